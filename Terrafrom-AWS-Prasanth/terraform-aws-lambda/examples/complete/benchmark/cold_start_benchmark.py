@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Cold-Start Benchmark for the Lambda Module's Complete Example
+
+Runs ../python/complete.py in a fresh Python process per sample, so every
+sample is a cold start, and times each phase:
+
+- process:      spawn to exit, including interpreter startup
+- module load:  importing the handler module (variant imports + INIT work)
+- import / init: the two INIT parts as recorded by the fixture itself
+- first invoke: the first lambda_handler call (cold)
+- warm invoke:  the second call in the same process
+- max RSS:      peak resident memory, a floor for the function's memory_size
+
+Variants (see complete.py):
+- plain, boto3, boto3-lazy
+- layer:          a dependency layer shipped as source only. /var/task and
+                  /opt are read-only on Lambda, so bytecode is compiled on
+                  every cold start
+- layer-compiled: the same layer with bytecode precompiled
+                  (compileall --invalidation-mode unchecked-hash)
+
+The layer is generated synthetically (--layer-modules x --layer-functions)
+unless --layer-path / --layer-import point at a real unpacked layer.
+Samples are interleaved across variants so machine drift affects them evenly.
+
+No AWS access is needed. Local times approximate one full vCPU; Lambda
+allocates CPU in proportion to memory_size, so deploy the fixture and invoke
+it with {"benchmark": true} to confirm a choice at a given memory size.
+
+Usage:
+    python3 cold_start_benchmark.py
+    python3 cold_start_benchmark.py --runs 30 --layer-modules 800
+    python3 cold_start_benchmark.py --layer-path /tmp/layer/python --layer-import pandas,numpy
+    python3 cold_start_benchmark.py --json results.json
+"""
+
+import argparse
+import compileall
+import json
+import os
+import platform
+import py_compile
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'python')
+
+# Executed in each child process; prints one BENCHMARK line of JSON
+RUNNER = r'''
+import json, resource, sys, time
+started = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import complete
+loaded = time.perf_counter()
+cold = complete.lambda_handler({"benchmark": True}, None)
+first = time.perf_counter()
+complete.lambda_handler({"benchmark": True}, None)
+warm = time.perf_counter()
+print("BENCHMARK " + json.dumps({
+    "module_load_ms": (loaded - started) * 1000,
+    "import_ms": cold["import_ms"],
+    "init_ms": cold["init_ms"],
+    "first_invoke_ms": (first - loaded) * 1000,
+    "warm_invoke_ms": (warm - first) * 1000,
+    "in_process_ms": (warm - started) * 1000,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+'''
+
+PHASES = ('process_ms', 'module_load_ms', 'import_ms', 'init_ms', 'first_invoke_ms', 'warm_invoke_ms')
+
+
+def build_synthetic_layer(root, modules, functions):
+    """
+    Write a dependency layer of `modules` modules with `functions` functions each
+
+    Returns:
+        Tuple of (source-only dir, precompiled dir, module names, source bytes)
+    """
+    source_dir = os.path.join(root, 'source', 'python')
+    os.makedirs(source_dir)
+    names = []
+    for index in range(modules):
+        name = f"benchlayer_{index:04d}"
+        body = [f'"""Synthetic layer module {index}"""', 'import json', '']
+        for fn in range(functions):
+            body.append(f"def transform_{fn}(value, scale={fn}):")
+            body.append(f"    payload = {{'id': {fn}, 'value': value, 'scale': scale}}")
+            body.append("    return json.dumps(payload) if value else None")
+            body.append("")
+        body.append(f"class Model{index}:")
+        body.append("    fields = " + repr(tuple(f"field_{n}" for n in range(20))))
+        with open(os.path.join(source_dir, f"{name}.py"), 'w') as f:
+            f.write('\n'.join(body) + '\n')
+        names.append(name)
+
+    compiled_dir = os.path.join(root, 'compiled', 'python')
+    shutil.copytree(source_dir, compiled_dir)
+    compileall.compile_dir(compiled_dir, quiet=1,
+                           invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+
+    size = sum(os.path.getsize(os.path.join(source_dir, name)) for name in os.listdir(source_dir))
+    return source_dir, compiled_dir, names, size
+
+
+def run_sample(variant, env_overrides):
+    """Run one cold start in a fresh interpreter and return its phase timings"""
+    env = dict(os.environ, BENCHMARK_VARIANT=variant, PYTHONDONTWRITEBYTECODE='1', **env_overrides)
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-s', '-c', RUNNER, FIXTURE_DIR],
+                            env=env, capture_output=True, text=True)
+    process_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else 'unknown error')
+
+    line = next(line for line in result.stdout.splitlines() if line.startswith('BENCHMARK '))
+    sample = json.loads(line[len('BENCHMARK '):])
+    sample['process_ms'] = process_ms
+    sample['runtime_overhead_ms'] = process_ms - sample.pop('in_process_ms')
+    return sample
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)]
+
+
+def summarize(samples):
+    summary = {}
+    for phase in PHASES + ('runtime_overhead_ms',):
+        values = [sample[phase] for sample in samples]
+        summary[phase] = {
+            'median': round(statistics.median(values), 2),
+            'p90': round(percentile(values, 0.9), 2),
+        }
+    summary['max_rss_mb'] = round(max(sample['max_rss_mb'] for sample in samples), 1)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Lambda cold-start phases locally')
+    parser.add_argument('--runs', type=int, default=10, help='Cold starts per variant (default: 10)')
+    parser.add_argument('--variants', nargs='+',
+                        default=['plain', 'boto3', 'boto3-lazy', 'layer', 'layer-compiled'],
+                        help='Variants to run (default: all)')
+    parser.add_argument('--layer-modules', type=int, default=400,
+                        help='Modules in the synthetic layer (default: 400)')
+    parser.add_argument('--layer-functions', type=int, default=150,
+                        help='Functions per synthetic layer module (default: 150)')
+    parser.add_argument('--layer-path', help='Unpacked real layer directory (its python/ folder) instead')
+    parser.add_argument('--layer-import', default='',
+                        help='Comma-separated modules to import from --layer-path')
+    parser.add_argument('--json', help='Write machine-readable results to this file')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='cold-start-')
+    try:
+        configs = {'plain': {}, 'boto3': {}, 'boto3-lazy': {}}
+        layer_info = None
+        if args.layer_path:
+            configs['layer'] = {'PYTHONPATH': args.layer_path, 'BENCHMARK_LAYER_MODULES': args.layer_import}
+            layer_info = {'path': args.layer_path, 'modules': args.layer_import.split(',')}
+        else:
+            source_dir, compiled_dir, names, size = build_synthetic_layer(
+                workdir, args.layer_modules, args.layer_functions)
+            modules = ','.join(names)
+            configs['layer'] = {'PYTHONPATH': source_dir, 'BENCHMARK_LAYER_MODULES': modules}
+            configs['layer-compiled'] = {'PYTHONPATH': compiled_dir, 'BENCHMARK_LAYER_MODULES': modules}
+            layer_info = {'synthetic_modules': len(names), 'functions_per_module': args.layer_functions,
+                          'source_mb': round(size / (1024 * 1024), 1)}
+
+        variants = [variant for variant in args.variants if variant in configs]
+        samples = {variant: [] for variant in variants}
+        skipped = {}
+        for _ in range(args.runs):
+            for variant in variants:
+                if variant in skipped:
+                    continue
+                env = configs[variant]
+                try:
+                    samples[variant].append(run_sample(variant.replace('-compiled', ''), env))
+                except RuntimeError as e:
+                    skipped[variant] = str(e)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    results = {variant: summarize(runs) for variant, runs in samples.items() if runs}
+
+    print("=" * 100)
+    print(f"COLD-START BENCHMARK ({args.runs} cold starts per variant, Python {platform.python_version()}, "
+          f"{os.cpu_count()} CPUs)")
+    print("=" * 100)
+    print(f"{'Variant':<16} {'Process':>9} {'Runtime':>9} {'Load':>9} {'Import':>9} {'Init':>8} "
+          f"{'1st call':>9} {'Warm':>7} {'RSS MB':>7}")
+    print("(median ms)")
+    print("-" * 100)
+    for variant, summary in results.items():
+        print(f"{variant:<16} {summary['process_ms']['median']:>9} {summary['runtime_overhead_ms']['median']:>9} "
+              f"{summary['module_load_ms']['median']:>9} {summary['import_ms']['median']:>9} "
+              f"{summary['init_ms']['median']:>8} {summary['first_invoke_ms']['median']:>9} "
+              f"{summary['warm_invoke_ms']['median']:>7} {summary['max_rss_mb']:>7}")
+    for variant, reason in skipped.items():
+        print(f"{variant:<16} skipped: {reason}")
+    print("=" * 100)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+                'runs': args.runs,
+                'layer': layer_info,
+                'results': results,
+                'skipped': skipped,
+                'samples': samples,
+            }, f, indent=2)
+        print(f"✓ Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
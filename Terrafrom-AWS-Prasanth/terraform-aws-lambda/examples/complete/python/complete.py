@@ -1,8 +1,72 @@
+"""
+Lambda function for the complete example, doubling as a cold-start benchmark fixture
+
+Deployed as-is it behaves like a plain handler. The BENCHMARK_VARIANT
+environment variable selects what the module loads during the INIT phase,
+so the same file measures how import and packaging choices affect cold
+starts - locally via ../benchmark/cold_start_benchmark.py, or deployed with
+different memory sizes and invoked with {"benchmark": true}.
+
+Variants:
+- plain:      standard library only (default)
+- boto3:      import boto3 and create a client during INIT
+- boto3-lazy: import boto3 and create the client on the first invocation
+- layer:      import the modules listed in BENCHMARK_LAYER_MODULES (a dependency layer)
+"""
+
 import json
+import os
+import time
+
+_import_started = time.perf_counter()
+
+VARIANT = os.environ.get('BENCHMARK_VARIANT', 'plain')
 
 print('Loading function')
 
+# INIT phase, part 1: variant imports
+if VARIANT == 'boto3':
+    import boto3
+elif VARIANT == 'layer':
+    import importlib
+    layer_modules = [
+        importlib.import_module(name)
+        for name in os.environ.get('BENCHMARK_LAYER_MODULES', '').split(',')
+        if name
+    ]
+
+_init_started = time.perf_counter()
+
+# INIT phase, part 2: clients created once per execution environment
+client = None
+if VARIANT == 'boto3':
+    client = boto3.client('s3', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+
+COLD_START_TIMINGS = {
+    'variant': VARIANT,
+    'import_ms': round((_init_started - _import_started) * 1000, 3),
+    'init_ms': round((time.perf_counter() - _init_started) * 1000, 3),
+}
+
+invocations = 0
+
+
 def lambda_handler(event, context):
+    global client, invocations
+    started = time.perf_counter()
+    invocations += 1
+
+    # The lazy variant moves the boto3 cost from INIT into the first invocation
+    if VARIANT == 'boto3-lazy' and client is None:
+        import boto3
+        client = boto3.client('s3', region_name=os.environ.get('AWS_REGION', 'us-east-2'))
+
     print('lambda function successfully deployed and executed using the module')
+
+    if isinstance(event, dict) and event.get('benchmark'):
+        timings = dict(COLD_START_TIMINGS, cold=invocations == 1,
+                       handler_ms=round((time.perf_counter() - started) * 1000, 3))
+        print(json.dumps(timings))
+        return timings
+
     return "success"
-    raise Exception('Something went wrong')
@@ -10,13 +10,18 @@ Key Features:
 - Intelligent cleanup based on retention policies
 - Proper error handling and logging
 - Option group handling for Oracle databases
+- CloudWatch Embedded Metric Format (EMF) metrics per pipeline stage
+- Quota-aware scheduling of cross-region copies (queued while the destination region is full)
 """
 
 import json
 import boto3
 import os
+import random
+import time
 from datetime import datetime, timedelta
 import logging
+from botocore.exceptions import ClientError
 
 # ============================================================================
 # LOGGING CONFIGURATION
@@ -25,6 +30,66 @@ import logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# ============================================================================
+# EMBEDDED METRIC FORMAT (EMF) METRICS
+# ============================================================================
+class BackupMetrics:
+    """
+    📈 Collects per-stage metrics and writes them as one CloudWatch EMF record
+
+    CloudWatch Logs extracts the metrics from the JSON line printed by flush(),
+    so no PutMetricData calls (or extra IAM permissions) are needed. All metrics
+    share the DBInstanceIdentifier / Engine / Region dimension set.
+    """
+
+    def __init__(self, db_instance_identifier, region, engine='unknown'):
+        self.namespace = os.environ.get('METRICS_NAMESPACE', 'RDSCrossRegionBackup')
+        self.dimensions = {
+            'DBInstanceIdentifier': db_instance_identifier or 'unknown',
+            'Engine': engine or 'unknown',
+            'Region': region or 'unknown'
+        }
+        self.values = {}
+        self.units = {}
+        self.properties = {}
+
+    def put(self, name, value, unit='Count'):
+        """Record a metric value (later values for the same name are summed)"""
+        self.values[name] = self.values.get(name, 0) + value
+        self.units[name] = unit
+
+    def put_duration(self, name, started):
+        """Record milliseconds elapsed since a time.monotonic() start mark"""
+        self.put(name, round((time.monotonic() - started) * 1000, 1), 'Milliseconds')
+
+    def set_property(self, name, value):
+        """Attach a searchable, non-metric field to the EMF record"""
+        self.properties[name] = value
+
+    def flush(self):
+        """Print the EMF record to stdout and reset collected values"""
+        if not self.values:
+            return
+        record = {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': self.namespace,
+                    'Dimensions': [list(self.dimensions)],
+                    'Metrics': [
+                        {'Name': name, 'Unit': self.units[name]} for name in self.values
+                    ]
+                }]
+            }
+        }
+        record.update(self.properties)
+        record.update(self.dimensions)
+        record.update(self.values)
+        print(json.dumps(record, default=str))
+        self.values = {}
+        self.units = {}
+
+
 # ============================================================================
 # MAIN LAMBDA HANDLER FUNCTION
 # ============================================================================
@@ -36,7 +101,7 @@ def lambda_handler(event, context):
     1. 📋 Configuration Setup - Read environment variables and event data
     2. 📊 RDS Instance Discovery - Get database details and engine information
     3. 📸 Snapshot Creation - Create manual snapshot in primary region
-    4. ⏳ Wait for Completion - Monitor snapshot creation progress
+    4. ⏳ Wait for Completion - Adaptive polling, continuing in a new invocation near the deadline
     5. 🔄 Cross-Region Copy - Copy snapshot to secondary region with encryption
     6. 🧹 Cleanup Process - Remove old snapshots based on retention policy
     7. ✅ Success Response - Return operation results
@@ -49,6 +114,9 @@ def lambda_handler(event, context):
         dict: Status response with operation results
     """
     
+    handler_started = time.monotonic()
+    metrics = BackupMetrics(event.get('db_instance_identifier'), os.environ.get('PRIMARY_REGION'))
+    
     try:
         # ====================================================================
         # STEP 1: CONFIGURATION SETUP
@@ -63,12 +131,19 @@ def lambda_handler(event, context):
         retention_days = int(os.environ.get('RETENTION_DAYS', '7'))
         secondary_kms_key = os.environ.get('SECONDARY_KMS_KEY')
         secondary_option_group = os.environ.get('SECONDARY_OPTION_GROUP')
+        idempotency_window = int(os.environ.get('IDEMPOTENCY_WINDOW_MINUTES', '60'))
+        continuation_reserve = int(os.environ.get('CONTINUATION_RESERVE_SECONDS', '60'))
+        max_continuations = int(os.environ.get('MAX_CONTINUATIONS', '20'))
+        max_concurrent_copies = int(os.environ.get('MAX_CONCURRENT_COPIES', '20'))
+        copy_queue_timeout = int(os.environ.get('COPY_QUEUE_TIMEOUT_MINUTES', '360'))
         
         logger.info(f"📍 Primary Region: {primary_region}")
         logger.info(f"📍 Secondary Region: {secondary_region}")
         logger.info(f"📅 Retention Policy: {retention_days} days")
         logger.info(f"🔐 KMS Key: {secondary_kms_key}")
         logger.info(f"⚙️  Option Group: {secondary_option_group}")
+        logger.info(f"🔁 Idempotency Window: {idempotency_window} minutes")
+        logger.info(f"🚦 Copy Slots: {max_concurrent_copies} in flight per destination region")
         
         # Extract database identifier from the incoming event
         db_instance_identifier = event.get('db_instance_identifier')
@@ -96,6 +171,8 @@ def lambda_handler(event, context):
         # ====================================================================
         logger.info("🔍 Discovering RDS instance details and validating existence...")
         
+        stage_started = time.monotonic()
+        
         # Query the RDS instance to get its configuration details
         # This ensures the instance exists and gets engine-specific information
         instance_response = primary_rds.describe_db_instances(
@@ -113,6 +190,11 @@ def lambda_handler(event, context):
         instance_class = db_instance.get('DBInstanceClass')   # e.g., 'db.t3.micro'
         allocated_storage = db_instance.get('AllocatedStorage') # Storage size in GB
         
+        metrics.dimensions['Engine'] = engine or 'unknown'
+        metrics.set_property('SecondaryRegion', secondary_region)
+        metrics.put('AllocatedStorage', allocated_storage or 0, 'Gigabytes')
+        metrics.put_duration('InstanceDiscoveryDuration', stage_started)
+        
         logger.info(f"📋 RDS Instance Details:")
         logger.info(f"   🔧 Engine: {engine}")
         logger.info(f"   📦 Version: {engine_version}")
@@ -123,58 +205,131 @@ def lambda_handler(event, context):
         # ====================================================================
         # STEP 4: SNAPSHOT CREATION IN PRIMARY REGION
         # ====================================================================
-        logger.info("📸 Creating manual snapshot in primary region...")
-        
-        # Generate unique snapshot identifier with timestamp
-        # Format: instance-name-auto-backup-YYYY-MM-DD-HHMMSS
-        timestamp = datetime.now().strftime('%Y-%m-%d-%H%M%S')
-        snapshot_id = f"{db_instance_identifier}-auto-backup-{timestamp}"
-        
-        logger.info(f"🏷️  Snapshot ID: {snapshot_id}")
-        logger.info(f"📅 Timestamp: {timestamp}")
-        
-        # Create the manual snapshot with comprehensive tagging
-        # Tags help with identification, billing, and automation
-        primary_rds.create_db_snapshot(
-            DBInstanceIdentifier=db_instance_identifier,
-            DBSnapshotIdentifier=snapshot_id,
-            Tags=[
-                {'Key': 'CreatedBy', 'Value': 'lambda-automation'},
-                {'Key': 'BackupType', 'Value': 'automated-cross-region'},
-                {'Key': 'SourceRegion', 'Value': primary_region},
-                {'Key': 'CreatedAt', 'Value': timestamp},
-                {'Key': 'Engine', 'Value': engine},
-                {'Key': 'Purpose', 'Value': 'disaster-recovery'}
-            ]
-        )
+        stage_started = time.monotonic()
+        
+        # Past auto-backup snapshots drive both idempotency and the waiter's
+        # duration estimate, so list them once
+        primary_snapshots = list_auto_backup_snapshots(primary_rds, db_instance_identifier)
         
-        logger.info("✅ Snapshot creation initiated successfully")
+        # Retries (Lambda async retry policy, EventBridge redelivery, duplicate
+        # triggers) must not stack several full snapshots of the same database.
+        # Reuse an in-progress or recent snapshot and resume its later stages.
+        # A continuation invocation names the snapshot it has to resume.
+        resume_snapshot_id = event.get('resume_snapshot_id')
+        if resume_snapshot_id:
+            existing_snapshot = next(
+                (snapshot for snapshot in primary_snapshots
+                 if snapshot['DBSnapshotIdentifier'] == resume_snapshot_id),
+                None
+            )
+            if not existing_snapshot:
+                raise ValueError(f"❌ Snapshot {resume_snapshot_id} to resume not found in {primary_region}")
+        else:
+            existing_snapshot = find_reusable_snapshot(primary_snapshots, idempotency_window)
+        resumed = existing_snapshot is not None
+        
+        if resumed:
+            snapshot_id = existing_snapshot['DBSnapshotIdentifier']
+            timestamp = snapshot_id.split('-auto-backup-')[-1]
+            
+            logger.info("🔁 Reusing existing snapshot instead of creating a new one")
+            logger.info(f"🏷️  Snapshot ID: {snapshot_id}")
+            logger.info(f"📊 Status: {existing_snapshot.get('Status')}")
+        else:
+            logger.info("📸 Creating manual snapshot in primary region...")
+            
+            # Generate unique snapshot identifier with timestamp
+            # Format: instance-name-auto-backup-YYYY-MM-DD-HHMMSS
+            timestamp = datetime.now().strftime(SNAPSHOT_TIMESTAMP_FORMAT)
+            snapshot_id = f"{db_instance_identifier}-auto-backup-{timestamp}"
+            
+            logger.info(f"🏷️  Snapshot ID: {snapshot_id}")
+            logger.info(f"📅 Timestamp: {timestamp}")
+            
+            # Create the manual snapshot with comprehensive tagging
+            # Tags help with identification, billing, and automation
+            primary_rds.create_db_snapshot(
+                DBInstanceIdentifier=db_instance_identifier,
+                DBSnapshotIdentifier=snapshot_id,
+                Tags=[
+                    {'Key': 'CreatedBy', 'Value': 'lambda-automation'},
+                    {'Key': 'BackupType', 'Value': 'automated-cross-region'},
+                    {'Key': 'SourceRegion', 'Value': primary_region},
+                    {'Key': 'CreatedAt', 'Value': timestamp},
+                    {'Key': 'Engine', 'Value': engine},
+                    {'Key': 'Purpose', 'Value': 'disaster-recovery'}
+                ]
+            )
+            
+            logger.info("✅ Snapshot creation initiated successfully")
+        
+        metrics.put('SnapshotResumed', 1 if resumed else 0)
+        metrics.put_duration('SnapshotCreateDuration', stage_started)
         
         # ====================================================================
         # STEP 5: WAIT FOR SNAPSHOT COMPLETION
         # ====================================================================
         logger.info("⏳ Waiting for snapshot to complete (this may take several minutes)...")
         
-        # Use AWS waiter to monitor snapshot progress
-        # Waiter automatically polls the snapshot status until completion
-        waiter = primary_rds.get_waiter('db_snapshot_completed')
-        waiter.wait(
-            DBSnapshotIdentifier=snapshot_id,
-            WaiterConfig={
-                'Delay': 30,        # Check every 30 seconds
-                'MaxAttempts': 60   # Maximum 60 attempts = 30 minutes timeout
-            }
+        stage_started = time.monotonic()
+        
+        # Estimate completion from storage size and past durations, then poll
+        # sparsely at first and more often near the expected finish
+        expected_seconds = estimate_snapshot_seconds(primary_snapshots, allocated_storage)
+        logger.info(f"🔮 Expected snapshot duration: ~{int(expected_seconds)} seconds")
+        metrics.put('SnapshotExpectedDuration', int(expected_seconds), 'Seconds')
+        
+        # Last-resort start time for a snapshot that reports neither its create
+        # time nor a timestamp; carried through continuations
+        first_seen = event.get('snapshot_first_seen') or datetime.now().strftime(SNAPSHOT_TIMESTAMP_FORMAT)
+        
+        completed, polls, snapshot = wait_for_snapshot(
+            primary_rds, snapshot_id, expected_seconds, context, continuation_reserve,
+            first_seen=first_seen
         )
+        metrics.put_duration('SnapshotWaitDuration', stage_started)
+        metrics.put('WaiterPolls', polls)
+        
+        if not completed:
+            # Close to the Lambda deadline - continue in a fresh invocation
+            # instead of timing out mid-wait
+            continuation = event.get('continuation', 0) + 1
+            if continuation > max_continuations:
+                raise TimeoutError(
+                    f"❌ Snapshot {snapshot_id} still not available after {max_continuations} continuations"
+                )
+            
+            hand_off_continuation(
+                context, event, snapshot_id, continuation, snapshot_first_seen=first_seen
+            )
+            metrics.put('Continuations', 1)
+            metrics.put('BackupFailures', 0)
+            metrics.put_duration('TotalDuration', handler_started)
+            metrics.flush()
+            
+            return {
+                'statusCode': 202,
+                'body': json.dumps({
+                    'message': 'Snapshot still in progress - continued in a new invocation',
+                    'details': {
+                        'primary_snapshot': snapshot_id,
+                        'db_instance': db_instance_identifier,
+                        'percent_progress': snapshot.get('PercentProgress'),
+                        'continuation': continuation
+                    }
+                })
+            }
         
         logger.info("✅ Snapshot creation completed successfully!")
         
-        # Retrieve the snapshot ARN needed for cross-region copying
+        # Record how long this snapshot took so later runs estimate better
+        if not resumed or existing_snapshot.get('Status') != 'available':
+            record_snapshot_duration(primary_rds, snapshot)
+        
+        # The snapshot ARN is needed for cross-region copying
         # ARN (Amazon Resource Name) uniquely identifies the snapshot across regions
-        snapshot_response = primary_rds.describe_db_snapshots(
-            DBSnapshotIdentifier=snapshot_id
-        )
-        snapshot_arn = snapshot_response['DBSnapshots'][0]['DBSnapshotArn']
-        snapshot_size = snapshot_response['DBSnapshots'][0].get('AllocatedStorage', 'Unknown')
+        snapshot_arn = snapshot['DBSnapshotArn']
+        snapshot_size = snapshot.get('AllocatedStorage', 'Unknown')
         
         logger.info(f"📋 Snapshot Details:")
         logger.info(f"   🔗 ARN: {snapshot_arn}")
@@ -185,6 +340,7 @@ def lambda_handler(event, context):
         # STEP 6: CROSS-REGION SNAPSHOT COPY
         # ====================================================================
         logger.info("🔄 Initiating cross-region snapshot copy...")
+        stage_started = time.monotonic()
         
         # Generate target snapshot ID for secondary region
         # Format: original-snapshot-id-target-region
@@ -193,6 +349,20 @@ def lambda_handler(event, context):
         logger.info(f"🎯 Target Region: {secondary_region}")
         logger.info(f"🏷️  Target Snapshot: {target_snapshot_id}")
         
+        # RDS only copies incrementally while the previous copy of this instance,
+        # encrypted with the same KMS key, still exists in the target region.
+        # A resumed run may already have made the target copy - it is never its own base.
+        copy_base = find_incremental_copy_base(
+            secondary_rds, db_instance_identifier, secondary_kms_key,
+            exclude_snapshot_id=target_snapshot_id
+        )
+        copy_info = describe_copy_transfer(copy_base, snapshot_size)
+        
+        if copy_info['incremental']:
+            logger.info(f"⚡ Incremental copy - base snapshot: {copy_info['base_snapshot']}")
+        else:
+            logger.info(f"📦 Full copy - no completed copy with the same KMS key in {secondary_region}")
+        
         # Prepare copy parameters with encryption and tagging
         copy_params = {
             'SourceDBSnapshotIdentifier': snapshot_arn,          # Source snapshot ARN
@@ -205,7 +375,9 @@ def lambda_handler(event, context):
                 {'Key': 'SourceRegion', 'Value': primary_region},
                 {'Key': 'Method', 'Value': 'lambda-automation'},
                 {'Key': 'Purpose', 'Value': 'cross-region-backup'},
-                {'Key': 'CopiedAt', 'Value': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                {'Key': 'CopiedAt', 'Value': datetime.now().strftime('%Y-%m-%d %H:%M:%S')},
+                {'Key': 'CopyType', 'Value': 'incremental' if copy_info['incremental'] else 'full'},
+                {'Key': 'CopyBase', 'Value': copy_info['base_snapshot'] or 'none'}
             ]
         }
         
@@ -217,11 +389,59 @@ def lambda_handler(event, context):
         else:
             logger.info(f"🔧 Engine: {engine} - No special option group needed")
         
-        # Execute the cross-region copy operation
-        secondary_rds.copy_db_snapshot(**copy_params)
-        logger.info("✅ Cross-region copy initiated successfully!")
+        # Execute the cross-region copy operation (skipped when a previous
+        # attempt of this run already started it). RDS caps the copies in
+        # progress per destination region, so wait for a free slot first.
+        if snapshot_exists(secondary_rds, target_snapshot_id):
+            logger.info(f"🔁 Target snapshot {target_snapshot_id} already exists - skipping copy")
+        else:
+            queued_since = event.get('copy_queued_at', time.time())
+            started, in_flight, slot_checks = schedule_copy(
+                secondary_rds, copy_params, max_concurrent_copies, context, continuation_reserve
+            )
+            metrics.put('CopiesInFlight', in_flight)
+            metrics.put('CopySlotChecks', slot_checks)
+            
+            if not started:
+                # Still no free slot close to the Lambda deadline - keep the
+                # copy queued in a fresh invocation instead of failing the backup
+                queued_minutes = (time.time() - queued_since) / 60
+                if queued_minutes > copy_queue_timeout:
+                    raise TimeoutError(
+                        f"❌ No cross-region copy slot in {secondary_region} after {int(queued_minutes)} minutes"
+                    )
+                
+                hand_off_continuation(
+                    context, event, snapshot_id, event.get('continuation', 0),
+                    copy_queued_at=queued_since
+                )
+                metrics.put('CopyQueued', 1)
+                metrics.put('BackupFailures', 0)
+                metrics.put_duration('CopyInitiateDuration', stage_started)
+                metrics.put_duration('TotalDuration', handler_started)
+                metrics.flush()
+                
+                return {
+                    'statusCode': 202,
+                    'body': json.dumps({
+                        'message': 'Cross-region copy queued - waiting for a free copy slot in a new invocation',
+                        'details': {
+                            'primary_snapshot': snapshot_id,
+                            'db_instance': db_instance_identifier,
+                            'copies_in_flight': in_flight,
+                            'max_concurrent_copies': max_concurrent_copies
+                        }
+                    })
+                }
+            
+            metrics.put('CopyQueued', 0)
+            metrics.put('CopyQueueWait', round(time.time() - queued_since, 1), 'Seconds')
+            logger.info("✅ Cross-region copy initiated successfully!")
         logger.info("-" * 60)
         
+        metrics.put('IncrementalCopy', 1 if copy_info['incremental'] else 0)
+        metrics.put_duration('CopyInitiateDuration', stage_started)
+        
         # ====================================================================
         # STEP 7: CLEANUP OLD SNAPSHOTS (RETENTION POLICY)
         # ====================================================================
@@ -229,7 +449,10 @@ def lambda_handler(event, context):
         
         # Call cleanup function to remove snapshots older than retention period
         # This prevents unlimited snapshot accumulation and controls storage costs
-        cleanup_old_snapshots(primary_rds, secondary_rds, db_instance_identifier, retention_days)
+        cleanup_old_snapshots(
+            primary_rds, secondary_rds, db_instance_identifier, retention_days,
+            kms_key_id=secondary_kms_key, metrics=metrics
+        )
         
         # ====================================================================
         # STEP 8: SUCCESS RESPONSE
@@ -240,9 +463,14 @@ def lambda_handler(event, context):
         logger.info(f"✅ Primary Snapshot: {snapshot_id}")
         logger.info(f"✅ Secondary Snapshot: {target_snapshot_id}")
         logger.info(f"✅ Backup Time: {timestamp}")
+        logger.info(f"✅ Copy Type: {'incremental' if copy_info['incremental'] else 'full'}")
         logger.info(f"✅ Retention: {retention_days} days")
         logger.info("=" * 60)
         
+        metrics.put('BackupFailures', 0)
+        metrics.put_duration('TotalDuration', handler_started)
+        metrics.flush()
+        
         # Return success response with operation details
         return {
             'statusCode': 200,
@@ -257,7 +485,9 @@ def lambda_handler(event, context):
                     'engine': engine,
                     'engine_version': engine_version,
                     'timestamp': timestamp,
-                    'retention_days': retention_days
+                    'retention_days': retention_days,
+                    'resumed': resumed,
+                    'copy': copy_info
                 }
             })
         }
@@ -273,33 +503,532 @@ def lambda_handler(event, context):
         logger.error(f"🎯 RDS Instance: {db_instance_identifier if 'db_instance_identifier' in locals() else 'Unknown'}")
         logger.error("=" * 60)
         
+        metrics.put('BackupFailures', 1)
+        metrics.set_property('Error', str(e))
+        metrics.put_duration('TotalDuration', handler_started)
+        metrics.flush()
+        
         # Re-raise the exception for Lambda error handling
         # This will trigger dead letter queue if configured
         raise
 
 
+# ============================================================================
+# IDEMPOTENCY HELPERS
+# ============================================================================
+def snapshot_created_at(snapshot):
+    """
+    🕒 Naive creation time of a snapshot
+
+    Snapshots that are still 'creating' may not report SnapshotCreateTime yet;
+    they are treated as created now.
+    """
+    created = snapshot.get('SnapshotCreateTime')
+    return created.replace(tzinfo=None) if created else datetime.now()
+
+
+def find_reusable_snapshot(snapshots, window_minutes):
+    """
+    🔁 Find an in-progress or recent auto-backup snapshot a retried run should resume
+
+    Parameters:
+        snapshots: Primary-region auto-backup snapshots (list_auto_backup_snapshots)
+        window_minutes: How far back a completed snapshot still counts as this run's
+
+    Returns:
+        dict or None: DBSnapshot to resume (in-progress snapshots win over completed ones)
+    """
+    if window_minutes <= 0:
+        return None
+
+    cutoff = datetime.now() - timedelta(minutes=window_minutes)
+    candidates = [
+        snapshot for snapshot in snapshots
+        if snapshot.get('Status') in ('creating', 'available') and
+        snapshot_created_at(snapshot) >= cutoff
+    ]
+    if not candidates:
+        return None
+
+    return max(
+        candidates,
+        key=lambda snapshot: (snapshot['Status'] == 'creating', snapshot_created_at(snapshot))
+    )
+
+
+def snapshot_exists(rds_client, snapshot_id):
+    """
+    🔎 Check whether a manual snapshot with this identifier already exists
+    """
+    try:
+        rds_client.describe_db_snapshots(DBSnapshotIdentifier=snapshot_id)
+        return True
+    except rds_client.exceptions.DBSnapshotNotFoundFault:
+        return False
+
+
+# ============================================================================
+# ADAPTIVE SNAPSHOT WAITER
+# ============================================================================
+# Fallback estimate when no past durations are recorded for the instance
+DEFAULT_BASE_SECONDS = 60
+DEFAULT_SECONDS_PER_GB = 1.5
+
+# Poll interval bounds for the adaptive waiter
+MIN_POLL_SECONDS = 5
+MAX_POLL_SECONDS = 120
+
+# Only trust PercentProgress extrapolation once RDS reports some progress
+MIN_PROGRESS_FOR_ESTIMATE = 5
+
+DURATION_TAG = 'CreateDurationSeconds'
+
+# Format of the CreatedAt tag and the -auto-backup-<timestamp> identifier suffix
+SNAPSHOT_TIMESTAMP_FORMAT = '%Y-%m-%d-%H%M%S'
+
+
+def estimate_snapshot_seconds(snapshots, allocated_storage):
+    """
+    🔮 Estimate how long a new snapshot of this instance will take
+
+    Uses the median seconds-per-GB of past snapshots that carry a
+    CreateDurationSeconds tag, falling back to a size-based default.
+
+    Parameters:
+        snapshots: Past auto-backup snapshots of the instance (with TagList)
+        allocated_storage: Allocated storage of the instance in GB
+
+    Returns:
+        float: Expected snapshot duration in seconds
+    """
+    storage = max(allocated_storage or 1, 1)
+    per_gb = []
+    for snapshot in snapshots:
+        tags = {tag['Key']: tag['Value'] for tag in snapshot.get('TagList', [])}
+        size = snapshot.get('AllocatedStorage')
+        if DURATION_TAG in tags and size:
+            try:
+                per_gb.append(float(tags[DURATION_TAG]) / size)
+            except ValueError:
+                continue
+
+    if not per_gb:
+        return DEFAULT_BASE_SECONDS + DEFAULT_SECONDS_PER_GB * storage
+
+    per_gb.sort()
+    return per_gb[len(per_gb) // 2] * storage
+
+
+def snapshot_started_at(snapshot, first_seen=None):
+    """
+    🕒 Naive start time of a snapshot the waiter is polling
+
+    A 'creating' snapshot may not report SnapshotCreateTime yet, so the start
+    is then read from the CreatedAt tag or the -auto-backup-<timestamp> suffix
+    this function writes, and only otherwise from first_seen (a timestamp in
+    the same format). Falls back to now when none of them is available.
+    """
+    created = snapshot.get('SnapshotCreateTime')
+    if created:
+        return created.replace(tzinfo=None)
+
+    tags = {tag['Key']: tag['Value'] for tag in snapshot.get('TagList', [])}
+    candidates = (
+        tags.get('CreatedAt'),
+        snapshot.get('DBSnapshotIdentifier', '').partition('-auto-backup-')[2],
+        first_seen
+    )
+    for stamp in candidates:
+        if stamp:
+            try:
+                return datetime.strptime(stamp, SNAPSHOT_TIMESTAMP_FORMAT)
+            except ValueError:
+                continue
+    return datetime.now()
+
+
+def estimate_remaining_seconds(elapsed, percent_progress, expected_seconds):
+    """
+    ⏱️  Seconds until the snapshot is expected to finish
+
+    Extrapolates from PercentProgress once RDS reports meaningful progress,
+    otherwise uses the up-front estimate.
+    """
+    if percent_progress and percent_progress >= MIN_PROGRESS_FOR_ESTIMATE:
+        total = elapsed * 100.0 / percent_progress
+    else:
+        total = expected_seconds
+    return max(total - elapsed, 0)
+
+
+def next_poll_delay(remaining, elapsed):
+    """
+    💤 Delay before the next poll: half the expected remaining time, so polls
+    are sparse early and dense near the finish. Overdue snapshots back off
+    in proportion to how long they have been running.
+    """
+    delay = max(remaining / 2, elapsed * 0.05)
+    return min(max(delay, MIN_POLL_SECONDS), MAX_POLL_SECONDS)
+
+
+def wait_for_snapshot(rds_client, snapshot_id, expected_seconds, context=None, reserve_seconds=60,
+                      first_seen=None):
+    """
+    ⏳ Wait for a snapshot to become available, stopping before the Lambda deadline
+
+    Parameters:
+        rds_client: RDS client for the snapshot's region
+        snapshot_id: Snapshot identifier to wait for
+        expected_seconds: Up-front duration estimate (estimate_snapshot_seconds)
+        context: Lambda context; without one there is no deadline
+        reserve_seconds: Time to keep for the copy and cleanup stages
+        first_seen: When the snapshot was first waited on (SNAPSHOT_TIMESTAMP_FORMAT),
+            used only if the snapshot carries no start time of its own
+
+    Returns:
+        tuple: (completed, polls, snapshot) - completed is False when the wait
+        was stopped for a continuation
+
+    Raises:
+        RuntimeError: If the snapshot ends in a non-available terminal state
+    """
+    polls = 0
+    while True:
+        snapshot = rds_client.describe_db_snapshots(
+            DBSnapshotIdentifier=snapshot_id
+        )['DBSnapshots'][0]
+        polls += 1
+        status = snapshot.get('Status')
+
+        if status == 'available':
+            return True, polls, snapshot
+        if status not in ('creating', 'pending'):
+            raise RuntimeError(f"❌ Snapshot {snapshot_id} entered status '{status}'")
+
+        elapsed = (datetime.now() - snapshot_started_at(snapshot, first_seen)).total_seconds()
+        remaining = estimate_remaining_seconds(
+            elapsed, snapshot.get('PercentProgress'), expected_seconds
+        )
+        delay = next_poll_delay(remaining, elapsed)
+
+        if context is not None:
+            time_left = context.get_remaining_time_in_millis() / 1000.0
+            if time_left - reserve_seconds < delay:
+                logger.info(f"⏰ {int(time_left)}s left in this invocation - handing off")
+                return False, polls, snapshot
+
+        logger.info(
+            f"   ⏳ {status} {snapshot.get('PercentProgress', 0)}% - "
+            f"~{int(remaining)}s remaining, next check in {int(delay)}s"
+        )
+        time.sleep(delay)
+
+
+def record_snapshot_duration(rds_client, snapshot):
+    """
+    🏷️  Tag a completed snapshot with its approximate creation duration
+
+    The duration is measured up to the poll that saw the snapshot available,
+    so it is accurate to within one poll interval.
+    """
+    try:
+        duration = int((datetime.now() - snapshot_created_at(snapshot)).total_seconds())
+        rds_client.add_tags_to_resource(
+            ResourceName=snapshot['DBSnapshotArn'],
+            Tags=[{'Key': DURATION_TAG, 'Value': str(duration)}]
+        )
+    except Exception as e:
+        # Only affects future estimates
+        logger.warning(f"⚠️  Could not record snapshot duration: {str(e)}")
+
+
+def hand_off_continuation(context, event, snapshot_id, continuation, **fields):
+    """
+    🔀 Re-invoke this function asynchronously to keep waiting for a snapshot
+
+    The new invocation resumes the given snapshot (see resume_snapshot_id in
+    lambda_handler) with a fresh timeout budget. Extra keyword fields are
+    added to its event (e.g. copy_queued_at for a queued copy).
+    """
+    payload = dict(event)
+    payload.update(fields)
+    payload['resume_snapshot_id'] = snapshot_id
+    payload['continuation'] = continuation
+
+    boto3.client('lambda').invoke(
+        FunctionName=context.invoked_function_arn,
+        InvocationType='Event',
+        Payload=json.dumps(payload).encode('utf-8')
+    )
+    logger.info(f"🔀 Continuation #{continuation} scheduled for snapshot {snapshot_id}")
+
+
+# ============================================================================
+# INCREMENTAL COPY CHAIN HELPERS
+# ============================================================================
+GIB = 1024 ** 3
+
+
+def list_auto_backup_snapshots(rds_client, db_instance_identifier):
+    """
+    📋 List every manual 'auto-backup' snapshot of an instance, following pagination
+
+    Parameters:
+        rds_client: RDS client for the region to scan
+        db_instance_identifier: RDS instance identifier
+
+    Returns:
+        list: DBSnapshot dicts created by this function for the instance
+    """
+    paginator = rds_client.get_paginator('describe_db_snapshots')
+    snapshots = []
+    for page in paginator.paginate(
+        DBInstanceIdentifier=db_instance_identifier,
+        SnapshotType='manual'
+    ):
+        for snapshot in page['DBSnapshots']:
+            if (snapshot['DBSnapshotIdentifier'].startswith(db_instance_identifier) and
+                    'auto-backup' in snapshot['DBSnapshotIdentifier']):
+                snapshots.append(snapshot)
+    return snapshots
+
+
+def kms_key_matches(snapshot_key, kms_key_id):
+    """
+    🔐 Compare a snapshot's KmsKeyId with a configured key ARN or key ID
+
+    RDS always reports the full key ARN, while Terraform may hand us either form.
+    """
+    if not kms_key_id:
+        return True
+    if not snapshot_key:
+        return False
+    return snapshot_key == kms_key_id or snapshot_key.split('/')[-1] == kms_key_id.split('/')[-1]
+
+
+def latest_completed_snapshot(snapshots, kms_key_id=None):
+    """
+    🔗 Return the newest 'available' snapshot (optionally encrypted with kms_key_id)
+
+    This is the head of the copy chain: the snapshot RDS diffs against when
+    the next cross-region copy is made incrementally.
+    """
+    completed = [
+        snapshot for snapshot in snapshots
+        if snapshot.get('Status') == 'available' and
+        kms_key_matches(snapshot.get('KmsKeyId'), kms_key_id)
+    ]
+    if not completed:
+        return None
+    return max(completed, key=snapshot_created_at)
+
+
+def find_incremental_copy_base(secondary_rds, db_instance_identifier, kms_key_id,
+                               exclude_snapshot_id=None):
+    """
+    ⚡ Find the completed secondary-region copy the next copy can be incremental against
+
+    Parameters:
+        secondary_rds: RDS client for secondary region
+        db_instance_identifier: RDS instance identifier
+        kms_key_id: KMS key the new copy will be encrypted with
+        exclude_snapshot_id: Target copy of this run, which cannot be its own base
+
+    Returns:
+        dict or None: DBSnapshot of the copy chain head, None when a full copy is required
+    """
+    try:
+        return latest_completed_snapshot(
+            [snapshot for snapshot in list_auto_backup_snapshots(secondary_rds, db_instance_identifier)
+             if snapshot['DBSnapshotIdentifier'] != exclude_snapshot_id],
+            kms_key_id
+        )
+    except Exception as e:
+        # Not knowing the base only affects reporting, never the copy itself
+        logger.warning(f"⚠️  Could not look up incremental copy base: {str(e)}")
+        return None
+
+
+def describe_copy_transfer(copy_base, snapshot_size):
+    """
+    📊 Describe what a cross-region copy transfers
+
+    RDS does not report the bytes moved by a copy. A full copy transfers the
+    whole snapshot (bounded by its allocated storage); an incremental copy only
+    moves the blocks changed since the base, which the API does not expose, so
+    the estimate is left empty for incremental copies.
+
+    Parameters:
+        copy_base: DBSnapshot returned by find_incremental_copy_base (or None)
+        snapshot_size: Allocated storage of the source snapshot in GB
+
+    Returns:
+        dict: incremental flag, base snapshot identifier and estimated transfer bytes
+    """
+    incremental = copy_base is not None
+    full_bytes = snapshot_size * GIB if isinstance(snapshot_size, int) else None
+    return {
+        'incremental': incremental,
+        'base_snapshot': copy_base['DBSnapshotIdentifier'] if incremental else None,
+        'estimated_transfer_bytes': None if incremental else full_bytes
+    }
+
+
+def protected_copy_chain(primary_snapshots, secondary_snapshots, kms_key_id=None):
+    """
+    🛡️  Work out which snapshots must survive cleanup to keep the next copy incremental
+
+    Keeps, regardless of age:
+        - the newest completed copy in the secondary region (same KMS key)
+        - the primary snapshot that copy was made from
+        - the newest completed snapshot in the primary region
+
+    Returns:
+        tuple: (set of protected primary IDs, set of protected secondary IDs)
+    """
+    protected_primary = set()
+    protected_secondary = set()
+
+    chain_head = latest_completed_snapshot(secondary_snapshots, kms_key_id)
+    if chain_head:
+        protected_secondary.add(chain_head['DBSnapshotIdentifier'])
+        # SourceDBSnapshotIdentifier is the source ARN; the snapshot ID is its last field
+        source = chain_head.get('SourceDBSnapshotIdentifier') or ''
+        if source:
+            protected_primary.add(source.split(':')[-1])
+
+    latest_primary = latest_completed_snapshot(primary_snapshots)
+    if latest_primary:
+        protected_primary.add(latest_primary['DBSnapshotIdentifier'])
+
+    return protected_primary, protected_secondary
+
+
+# ============================================================================
+# CROSS-REGION COPY SCHEDULER
+# ============================================================================
+# Snapshot statuses of a copy that still holds one of the destination's slots
+IN_FLIGHT_COPY_STATUSES = ('pending', 'copying')
+
+# Errors RDS returns when the destination region has no free copy slot
+COPY_QUOTA_ERROR_CODES = ('SnapshotQuotaExceeded', 'SnapshotQuotaExceededFault')
+
+# Errors RDS returns once the SDK's own retries for a throttled call are used up
+THROTTLING_ERROR_CODES = ('Throttling', 'ThrottlingException', 'RequestLimitExceeded')
+
+# Backoff bounds while waiting for a copy slot (jittered, so queued
+# invocations started by the same schedule do not recheck in lockstep)
+MIN_COPY_SLOT_POLL_SECONDS = 15
+MAX_COPY_SLOT_POLL_SECONDS = 120
+
+
+def count_copies_in_flight(rds_client):
+    """
+    🚦 Count snapshot copies still in progress into the client's region
+
+    The limit applies to the whole account, so every manual snapshot in the
+    region is counted - not only the copies made by this function.
+    """
+    paginator = rds_client.get_paginator('describe_db_snapshots')
+    in_flight = 0
+    for page in paginator.paginate(SnapshotType='manual'):
+        for snapshot in page['DBSnapshots']:
+            if snapshot.get('Status') in IN_FLIGHT_COPY_STATUSES:
+                in_flight += 1
+    return in_flight
+
+
+def schedule_copy(rds_client, copy_params, max_copies, context=None, reserve_seconds=60):
+    """
+    🚦 Start a cross-region copy once the destination region has a free copy slot
+
+    Every backup invocation reads the number of copies in flight from RDS, so
+    concurrent invocations share the slots without any extra coordination
+    state. A quota error from a copy that lost the race for the last slot is
+    treated like a full region: the copy stays queued and is retried after
+    the next backoff. Throttling of the slot check or of the copy call
+    (many queued invocations polling the same region) also keeps the copy
+    queued, and backs off to the longest poll interval.
+
+    Parameters:
+        rds_client: RDS client for the destination region
+        copy_params: Keyword arguments for copy_db_snapshot
+        max_copies: Copies allowed in flight into the destination region
+        context: Lambda context; without one there is no deadline
+        reserve_seconds: Time to keep for the cleanup stage
+
+    Returns:
+        tuple: (started, in_flight, checks) - started is False when the wait
+        was stopped for a continuation; in_flight is the last observed count
+        (max_copies when no count could be read)
+    """
+    checks = 0
+    delay = MIN_COPY_SLOT_POLL_SECONDS
+    in_flight = max_copies
+    while True:
+        checks += 1
+        try:
+            in_flight = count_copies_in_flight(rds_client)
+            if in_flight < max_copies:
+                rds_client.copy_db_snapshot(**copy_params)
+                return True, in_flight, checks
+        except ClientError as e:
+            code = e.response['Error']['Code']
+            if code in COPY_QUOTA_ERROR_CODES:
+                logger.info(f"   🚦 Copy quota reached ({code}) - copy stays queued")
+            elif code in THROTTLING_ERROR_CODES:
+                logger.info(f"   🚦 Slot check throttled ({code}) - copy stays queued")
+                delay = MAX_COPY_SLOT_POLL_SECONDS
+            else:
+                raise
+
+        wait = random.uniform(delay / 2, delay)
+        if context is not None:
+            time_left = context.get_remaining_time_in_millis() / 1000.0
+            if time_left - reserve_seconds < wait:
+                logger.info(f"⏰ {int(time_left)}s left in this invocation - handing off queued copy")
+                return False, in_flight, checks
+
+        logger.info(
+            f"   🚦 {in_flight}/{max_copies} copies in flight - "
+            f"next slot check in {int(wait)}s"
+        )
+        time.sleep(wait)
+        delay = min(delay * 2, MAX_COPY_SLOT_POLL_SECONDS)
+
+
 # ============================================================================
 # CLEANUP FUNCTION - SNAPSHOT RETENTION MANAGEMENT
 # ============================================================================
-def cleanup_old_snapshots(primary_rds, secondary_rds, db_instance_identifier, retention_days):
+def cleanup_old_snapshots(primary_rds, secondary_rds, db_instance_identifier, retention_days,
+                          kms_key_id=None, metrics=None):
     """
     🧹 Clean up old automated snapshots based on retention policy
     
     This function removes snapshots older than the specified retention period
-    from both primary and secondary regions to control storage costs.
+    from both primary and secondary regions to control storage costs. The
+    latest completed copy chain is always kept so the next cross-region copy
+    stays incremental instead of falling back to a full copy.
     
     Parameters:
         primary_rds: RDS client for primary region
         secondary_rds: RDS client for secondary region  
         db_instance_identifier: RDS instance identifier
         retention_days: Number of days to retain snapshots
+        kms_key_id: KMS key used for secondary copies (chain head must match it)
+        metrics: BackupMetrics to add cleanup metrics to (a standalone call emits its own)
     
     Process:
         1. Calculate cutoff date based on retention policy
         2. Query existing snapshots in both regions
-        3. Identify snapshots older than cutoff date
-        4. Delete old snapshots (with error handling)
+        3. Protect the latest completed copy chain in each region
+        4. Delete old, unprotected snapshots (with error handling)
     """
+    owns_metrics = metrics is None
+    if owns_metrics:
+        metrics = BackupMetrics(db_instance_identifier, primary_rds._client_config.region_name)
+    cleanup_started = time.monotonic()
+    
     try:
         # ====================================================================
         # CALCULATE RETENTION CUTOFF DATE
@@ -309,21 +1038,28 @@ def cleanup_old_snapshots(primary_rds, secondary_rds, db_instance_identifier, re
         logger.info(f"🧹 Cleaning snapshots older than {retention_days} days...")
         
         # ====================================================================
-        # CLEANUP PRIMARY REGION SNAPSHOTS
+        # DISCOVER SNAPSHOTS & PROTECT THE LATEST COPY CHAIN
         # ====================================================================
         logger.info(f"🔍 Scanning primary region ({primary_rds._client_config.region_name}) for old snapshots...")
+        primary_snapshots = list_auto_backup_snapshots(primary_rds, db_instance_identifier)
         
-        # Get all manual snapshots for this RDS instance
-        primary_snapshots = primary_rds.describe_db_snapshots(
-            DBInstanceIdentifier=db_instance_identifier,
-            SnapshotType='manual'  # Only manual snapshots (not automated daily ones)
+        logger.info(f"🔍 Scanning secondary region ({secondary_rds._client_config.region_name}) for old snapshots...")
+        secondary_snapshots = list_auto_backup_snapshots(secondary_rds, db_instance_identifier)
+        
+        protected_primary, protected_secondary = protected_copy_chain(
+            primary_snapshots, secondary_snapshots, kms_key_id
         )
+        logger.info(f"🛡️  Protected primary snapshots: {sorted(protected_primary) or 'none'}")
+        logger.info(f"🛡️  Protected secondary snapshots: {sorted(protected_secondary) or 'none'}")
         
+        # ====================================================================
+        # CLEANUP PRIMARY REGION SNAPSHOTS
+        # ====================================================================
         primary_deleted_count = 0
-        for snapshot in primary_snapshots['DBSnapshots']:
+        for snapshot in primary_snapshots:
             # Check if this is an automated backup snapshot that's too old
-            if ('auto-backup' in snapshot['DBSnapshotIdentifier'] and 
-                snapshot['SnapshotCreateTime'].replace(tzinfo=None) < cutoff_date):
+            if (snapshot_created_at(snapshot) < cutoff_date and
+                    snapshot['DBSnapshotIdentifier'] not in protected_primary):
                 
                 logger.info(f"🗑️  Deleting old primary snapshot: {snapshot['DBSnapshotIdentifier']}")
                 primary_rds.delete_db_snapshot(
@@ -336,17 +1072,11 @@ def cleanup_old_snapshots(primary_rds, secondary_rds, db_instance_identifier, re
         # ====================================================================
         # CLEANUP SECONDARY REGION SNAPSHOTS  
         # ====================================================================
-        logger.info(f"🔍 Scanning secondary region ({secondary_rds._client_config.region_name}) for old snapshots...")
-        
-        # Get all manual snapshots in secondary region
-        secondary_snapshots = secondary_rds.describe_db_snapshots(SnapshotType='manual')
-        
         secondary_deleted_count = 0
-        for snapshot in secondary_snapshots['DBSnapshots']:
-            # Check if this snapshot belongs to our RDS instance and is too old
-            if (snapshot['DBSnapshotIdentifier'].startswith(db_instance_identifier) and
-                'auto-backup' in snapshot['DBSnapshotIdentifier'] and
-                snapshot['SnapshotCreateTime'].replace(tzinfo=None) < cutoff_date):
+        for snapshot in secondary_snapshots:
+            # Check if this snapshot is too old and not the incremental copy base
+            if (snapshot_created_at(snapshot) < cutoff_date and
+                    snapshot['DBSnapshotIdentifier'] not in protected_secondary):
                 
                 logger.info(f"🗑️  Deleting old secondary snapshot: {snapshot['DBSnapshotIdentifier']}")
                 secondary_rds.delete_db_snapshot(
@@ -356,10 +1086,20 @@ def cleanup_old_snapshots(primary_rds, secondary_rds, db_instance_identifier, re
         
         logger.info(f"✅ Secondary region cleanup: {secondary_deleted_count} snapshots deleted")
         logger.info(f"🧹 Total snapshots cleaned up: {primary_deleted_count + secondary_deleted_count}")
+        
+        metrics.put('CleanupPrimaryDeletes', primary_deleted_count)
+        metrics.put('CleanupSecondaryDeletes', secondary_deleted_count)
+        metrics.put('CleanupFailures', 0)
                 
     except Exception as e:
         # Don't fail the main backup process due to cleanup issues
         # Log warning but continue with the backup operation
         logger.warning("⚠️  Cleanup process encountered errors (backup still successful):")
         logger.warning(f"   💥 Cleanup Error: {str(e)}")
-        logger.warning("   🔄 Cleanup will be retried on next backup run")
\ No newline at end of file
+        logger.warning("   🔄 Cleanup will be retried on next backup run")
+        metrics.put('CleanupFailures', 1)
+    
+    finally:
+        metrics.put_duration('CleanupDuration', cleanup_started)
+        if owns_metrics:
+            metrics.flush()
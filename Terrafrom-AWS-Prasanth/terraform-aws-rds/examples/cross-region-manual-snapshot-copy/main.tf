@@ -342,6 +342,7 @@ data "template_file" "lambda_rds_policy" {
   vars = {
     PRIMARY_KMS_KEY_ARN   = module.primary_kms.key_arn
     SECONDARY_KMS_KEY_ARN = module.secondary_kms.key_arn
+    BACKUP_LAMBDA_ARN     = "arn:aws:lambda:${var.primary_region}:${var.account_id}:function:${local.resource_names.backup_lambda}"
   }
 }
 
@@ -387,11 +388,17 @@ module "rds_backup_lambda" {
 
   # Environment variables
   environment = {
-    PRIMARY_REGION         = var.primary_region
-    SECONDARY_REGION       = var.secondary_region
-    RETENTION_DAYS         = tostring(var.snapshot_retention_days)
-    SECONDARY_KMS_KEY      = module.secondary_kms.key_arn
-    SECONDARY_OPTION_GROUP = aws_db_option_group.secondary_option_group.name
+    PRIMARY_REGION               = var.primary_region
+    SECONDARY_REGION             = var.secondary_region
+    RETENTION_DAYS               = tostring(var.snapshot_retention_days)
+    SECONDARY_KMS_KEY            = module.secondary_kms.key_arn
+    SECONDARY_OPTION_GROUP       = aws_db_option_group.secondary_option_group.name
+    IDEMPOTENCY_WINDOW_MINUTES   = tostring(var.snapshot_idempotency_window_minutes)
+    METRICS_NAMESPACE            = var.metrics_namespace
+    CONTINUATION_RESERVE_SECONDS = tostring(var.snapshot_wait_reserve_seconds)
+    MAX_CONTINUATIONS            = tostring(var.snapshot_wait_max_continuations)
+    MAX_CONCURRENT_COPIES        = tostring(var.max_concurrent_copies)
+    COPY_QUEUE_TIMEOUT_MINUTES   = tostring(var.copy_queue_timeout_minutes)
   }
 
   # EventBridge trigger configuration
@@ -0,0 +1,604 @@
+#!/usr/bin/env python3
+"""
+Offline Simulation Harness for the RDS Cross-Region Backup Lambda
+
+Drives lambda_handler and cleanup_old_snapshots from ../lambda/lambda_function.py
+against stubbed RDS clients in both regions - no AWS account or network needed.
+
+What is simulated:
+- A virtual clock (time.sleep / time.monotonic / datetime.now are redirected)
+- Snapshot creation progress (PercentProgress) proportional to allocated storage
+- Cross-region copy latency (full vs incremental copies)
+- describe_db_snapshots pagination (MaxRecords / Marker, 100 per page)
+- API throttling with botocore-style retries and backoff
+- Lambda deadlines and asynchronous continuation invocations
+- The per-region limit on copies in progress (SnapshotQuotaExceeded)
+- A fleet of instances sharing the destination region's copy slots (--fleet)
+- Snapshots that do not report SnapshotCreateTime until they are available
+  (--no-create-time), as RDS may do while a snapshot is 'creating'
+
+What is reported per scenario:
+- Simulated wall time (virtual clock) and real CPU time
+- API call counts per region/operation (including throttled attempts)
+- Peak Python memory allocated during the run (tracemalloc)
+- Peak copies in flight and copy quota errors in the secondary region
+- Snapshot waiter polls
+
+Usage:
+    python3 simulate_backup.py
+    python3 simulate_backup.py --snapshots 10 1000 50000 --storage 2000 --timeout 300
+    python3 simulate_backup.py --snapshots 10 --fleet 120 --timeout 300
+    python3 simulate_backup.py --snapshots 10 --storage 2000 --no-create-time
+    python3 simulate_backup.py --json results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from botocore.exceptions import ClientError
+
+LAMBDA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lambda')
+sys.path.insert(0, LAMBDA_DIR)
+
+import lambda_function  # noqa: E402
+
+
+ACCOUNT_ID = '111122223333'
+PAGE_SIZE = 100
+
+# Simulated service behaviour
+API_LATENCY_SECONDS = 0.05
+PER_ITEM_LATENCY_SECONDS = 0.0005
+SNAPSHOT_BASE_SECONDS = 45
+SNAPSHOT_SECONDS_PER_GB = 1.2
+FULL_COPY_SECONDS_PER_GB = 3.0
+INCREMENTAL_COPY_SECONDS = 300
+MAX_RETRY_ATTEMPTS = 5
+COPY_QUOTA = 20
+SCHEDULE_INTERVAL = timedelta(hours=6)
+
+
+# ============================================================================
+# VIRTUAL CLOCK
+# ============================================================================
+class SimClock:
+    """Virtual clock shared by the stub clients and the patched time module"""
+
+    def __init__(self, start):
+        self.start = start
+        self.offset = 0.0
+
+    def advance(self, seconds):
+        self.offset += seconds
+
+    def now(self):
+        return self.start + timedelta(seconds=self.offset)
+
+    # time module interface used by lambda_function
+    def sleep(self, seconds):
+        self.advance(seconds)
+
+    def monotonic(self):
+        return self.offset
+
+    def time(self):
+        return self.now().timestamp()
+
+
+def make_sim_datetime(clock):
+    """datetime subclass whose now() follows the virtual clock (naive UTC, like Lambda)"""
+
+    class SimDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            current = clock.now()
+            return current.astimezone(tz) if tz else current.replace(tzinfo=None)
+
+    return SimDatetime
+
+
+# ============================================================================
+# STUB RDS CLIENT
+# ============================================================================
+class DBSnapshotNotFoundFault(ClientError):
+    pass
+
+
+class StubExceptions:
+    DBSnapshotNotFoundFault = DBSnapshotNotFoundFault
+
+
+class StubClientConfig:
+    def __init__(self, region_name):
+        self.region_name = region_name
+
+
+class StubPaginator:
+    def __init__(self, client, operation):
+        self.client = client
+        self.operation = operation
+
+    def paginate(self, **kwargs):
+        marker = None
+        while True:
+            params = dict(kwargs)
+            if marker:
+                params['Marker'] = marker
+            page = getattr(self.client, self.operation)(**params)
+            yield page
+            marker = page.get('Marker')
+            if not marker:
+                return
+
+
+class StubRDS:
+    """
+    In-memory RDS client for one region
+
+    Snapshots are stored per instance so filtered describes stay cheap even
+    with tens of thousands of snapshots; snapshot status is derived from the
+    virtual clock on every read.
+    """
+
+    def __init__(self, region, clock, calls, rng, throttle_rate, copy_quota=COPY_QUOTA,
+                 report_create_time=True):
+        self.region = region
+        self.clock = clock
+        self.calls = calls
+        self.rng = rng
+        self.throttle_rate = throttle_rate
+        self.copy_quota = copy_quota
+        self.report_create_time = report_create_time
+        self.peak_copies_in_flight = 0
+        self.instances = {}
+        self.snapshots = {}
+        self.by_instance = {}
+        self.peer = None
+        self.exceptions = StubExceptions
+        self._client_config = StubClientConfig(region)
+
+    # --- simulation plumbing ------------------------------------------------
+    def _call(self, operation, items=0):
+        """Charge latency for one API call, simulating throttling + SDK retries"""
+        for attempt in range(MAX_RETRY_ATTEMPTS):
+            self.calls[f"{self.region}:{operation}"] += 1
+            self.clock.advance(API_LATENCY_SECONDS + PER_ITEM_LATENCY_SECONDS * items)
+            if self.rng.random() >= self.throttle_rate:
+                return
+            self.calls[f"{self.region}:{operation}:throttled"] += 1
+            # botocore standard retry mode: exponential backoff with jitter
+            self.clock.advance(self.rng.uniform(0, min(20, 2 ** attempt)))
+        raise ClientError(
+            {'Error': {'Code': 'Throttling', 'Message': 'Rate exceeded'}}, operation
+        )
+
+    def _not_found(self, snapshot_id, operation):
+        raise DBSnapshotNotFoundFault(
+            {'Error': {'Code': 'DBSnapshotNotFound',
+                       'Message': f'DBSnapshot {snapshot_id} not found.'}},
+            operation
+        )
+
+    def _arn(self, snapshot_id):
+        return f"arn:aws:rds:{self.region}:{ACCOUNT_ID}:snapshot:{snapshot_id}"
+
+    def _add(self, snapshot, ready_at):
+        snapshot['_ready_at'] = ready_at
+        self.snapshots[snapshot['DBSnapshotIdentifier']] = snapshot
+        instance_snapshots = self.by_instance.setdefault(snapshot['DBInstanceIdentifier'], {})
+        instance_snapshots[snapshot['DBSnapshotIdentifier']] = snapshot
+
+    def _view(self, snapshot):
+        """Public copy of a stored snapshot with status derived from the clock"""
+        view = {key: value for key, value in snapshot.items() if not key.startswith('_')}
+        now = self.clock.now()
+        if now >= snapshot['_ready_at']:
+            view['Status'] = 'available'
+            view['PercentProgress'] = 100
+        else:
+            started = snapshot['SnapshotCreateTime']
+            total = (snapshot['_ready_at'] - started).total_seconds()
+            done = max((now - started).total_seconds(), 0)
+            view['Status'] = snapshot['_pending_status']
+            view['PercentProgress'] = int(done * 100 / total) if total else 0
+            if not self.report_create_time:
+                del view['SnapshotCreateTime']
+        return view
+
+    def _copies_in_flight(self):
+        now = self.clock.now()
+        return sum(
+            1 for snapshot in self.snapshots.values()
+            if snapshot['_pending_status'] == 'pending' and now < snapshot['_ready_at']
+        )
+
+    def seed_snapshot(self, instance_id, snapshot_id, created, storage, kms_key_id=None, source=None):
+        snapshot = {
+            'DBSnapshotIdentifier': snapshot_id,
+            'DBInstanceIdentifier': instance_id,
+            'DBSnapshotArn': self._arn(snapshot_id),
+            'SnapshotCreateTime': created,
+            'SnapshotType': 'manual',
+            'AllocatedStorage': storage,
+            'KmsKeyId': kms_key_id,
+            'TagList': [],
+            '_pending_status': 'creating',
+        }
+        if source:
+            snapshot['SourceDBSnapshotIdentifier'] = source
+        self._add(snapshot, created)
+
+    # --- RDS API surface used by lambda_function ---------------------------
+    def get_paginator(self, operation):
+        return StubPaginator(self, operation)
+
+    def describe_db_instances(self, DBInstanceIdentifier):
+        self._call('describe_db_instances', 1)
+        return {'DBInstances': [self.instances[DBInstanceIdentifier]]}
+
+    def describe_db_snapshots(self, DBSnapshotIdentifier=None, DBInstanceIdentifier=None,
+                              SnapshotType=None, MaxRecords=PAGE_SIZE, Marker=None):
+        if DBSnapshotIdentifier:
+            self._call('describe_db_snapshots', 1)
+            if DBSnapshotIdentifier not in self.snapshots:
+                self._not_found(DBSnapshotIdentifier, 'DescribeDBSnapshots')
+            return {'DBSnapshots': [self._view(self.snapshots[DBSnapshotIdentifier])]}
+
+        if DBInstanceIdentifier:
+            matches = list(self.by_instance.get(DBInstanceIdentifier, {}).values())
+        else:
+            matches = list(self.snapshots.values())
+        if SnapshotType:
+            matches = [snapshot for snapshot in matches if snapshot['SnapshotType'] == SnapshotType]
+
+        start = int(Marker or 0)
+        page = matches[start:start + MaxRecords]
+        self._call('describe_db_snapshots', len(page))
+        response = {'DBSnapshots': [self._view(snapshot) for snapshot in page]}
+        if start + MaxRecords < len(matches):
+            response['Marker'] = str(start + MaxRecords)
+        return response
+
+    def create_db_snapshot(self, DBInstanceIdentifier, DBSnapshotIdentifier, Tags=None):
+        self._call('create_db_snapshot')
+        storage = self.instances[DBInstanceIdentifier]['AllocatedStorage']
+        duration = (SNAPSHOT_BASE_SECONDS + SNAPSHOT_SECONDS_PER_GB * storage) * self.rng.uniform(0.8, 1.3)
+        now = self.clock.now()
+        snapshot = {
+            'DBSnapshotIdentifier': DBSnapshotIdentifier,
+            'DBInstanceIdentifier': DBInstanceIdentifier,
+            'DBSnapshotArn': self._arn(DBSnapshotIdentifier),
+            'SnapshotCreateTime': now,
+            'SnapshotType': 'manual',
+            'AllocatedStorage': storage,
+            'KmsKeyId': self.instances[DBInstanceIdentifier].get('KmsKeyId'),
+            'TagList': list(Tags or []),
+            '_pending_status': 'creating',
+        }
+        self._add(snapshot, now + timedelta(seconds=duration))
+        return {'DBSnapshot': self._view(snapshot)}
+
+    def copy_db_snapshot(self, SourceDBSnapshotIdentifier, TargetDBSnapshotIdentifier,
+                         KmsKeyId=None, CopyTags=False, Tags=None, OptionGroupName=None):
+        self._call('copy_db_snapshot')
+        source_id = SourceDBSnapshotIdentifier.split(':')[-1]
+        source = self.peer.snapshots[source_id]
+        tags = {tag['Key']: tag['Value'] for tag in Tags or []}
+        if tags.get('CopyType') == 'incremental':
+            duration = INCREMENTAL_COPY_SECONDS
+        else:
+            duration = FULL_COPY_SECONDS_PER_GB * source['AllocatedStorage']
+        if TargetDBSnapshotIdentifier in self.snapshots:
+            raise ClientError(
+                {'Error': {'Code': 'DBSnapshotAlreadyExists', 'Message': 'exists'}},
+                'CopyDBSnapshot'
+            )
+        if self._copies_in_flight() >= self.copy_quota:
+            self.calls[f"{self.region}:copy_db_snapshot:quota_exceeded"] += 1
+            raise ClientError(
+                {'Error': {'Code': 'SnapshotQuotaExceeded',
+                           'Message': 'Cannot exceed the number of snapshot copies in progress'}},
+                'CopyDBSnapshot'
+            )
+        snapshot = {
+            'DBSnapshotIdentifier': TargetDBSnapshotIdentifier,
+            'DBInstanceIdentifier': source['DBInstanceIdentifier'],
+            'DBSnapshotArn': self._arn(TargetDBSnapshotIdentifier),
+            'SnapshotCreateTime': source['SnapshotCreateTime'],
+            'SnapshotType': 'manual',
+            'AllocatedStorage': source['AllocatedStorage'],
+            'KmsKeyId': KmsKeyId,
+            'SourceDBSnapshotIdentifier': SourceDBSnapshotIdentifier,
+            'TagList': (list(source['TagList']) if CopyTags else []) + list(Tags or []),
+            '_pending_status': 'pending',
+        }
+        self._add(snapshot, self.clock.now() + timedelta(seconds=duration))
+        self.peak_copies_in_flight = max(self.peak_copies_in_flight, self._copies_in_flight())
+        return {'DBSnapshot': self._view(snapshot)}
+
+    def delete_db_snapshot(self, DBSnapshotIdentifier):
+        self._call('delete_db_snapshot')
+        snapshot = self.snapshots.pop(DBSnapshotIdentifier, None)
+        if snapshot is None:
+            self._not_found(DBSnapshotIdentifier, 'DeleteDBSnapshot')
+        del self.by_instance[snapshot['DBInstanceIdentifier']][DBSnapshotIdentifier]
+        return {'DBSnapshot': self._view(snapshot)}
+
+    def add_tags_to_resource(self, ResourceName, Tags):
+        self._call('add_tags_to_resource')
+        snapshot = self.snapshots.get(ResourceName.split(':')[-1])
+        if snapshot is not None:
+            snapshot['TagList'].extend(Tags)
+        return {}
+
+
+class StubLambda:
+    """Captures asynchronous self-invocations (continuations)"""
+
+    def __init__(self, calls, queue):
+        self.calls = calls
+        self.queue = queue
+
+    def invoke(self, FunctionName, InvocationType, Payload):
+        self.calls['lambda:invoke'] += 1
+        self.queue.append(json.loads(Payload))
+        return {'StatusCode': 202}
+
+
+class StubBoto3:
+    """Replacement for the boto3 module inside lambda_function"""
+
+    def __init__(self, clients):
+        self.clients = clients
+
+    def client(self, service, region_name=None):
+        if service == 'lambda':
+            return self.clients['lambda']
+        return self.clients[region_name]
+
+
+class SimContext:
+    """Lambda context whose remaining time follows the virtual clock"""
+
+    invoked_function_arn = f"arn:aws:lambda:us-east-2:{ACCOUNT_ID}:function:rds-backup-sim"
+
+    def __init__(self, clock, timeout_seconds):
+        self.clock = clock
+        self.deadline = clock.monotonic() + timeout_seconds
+
+    def get_remaining_time_in_millis(self):
+        return int(max(self.deadline - self.clock.monotonic(), 0) * 1000)
+
+
+# ============================================================================
+# SCENARIO
+# ============================================================================
+def seed_account(primary, secondary, instance_id, snapshot_count, storage, kms_key, retention_days):
+    """
+    Seed existing auto-backup snapshots for the instance, split across both regions,
+    with ages spread over twice the retention period so cleanup has real work to do.
+    The newest seed is one schedule interval old, outside the idempotency window.
+    """
+    newest = primary.clock.now() - SCHEDULE_INTERVAL
+    span = timedelta(days=retention_days * 2)
+    primary_count = snapshot_count - snapshot_count // 2
+    for index in range(primary_count):
+        created = newest - span * index / primary_count
+        snapshot_id = f"{instance_id}-auto-backup-seed-{index:06d}"
+        primary.seed_snapshot(instance_id, snapshot_id, created, storage)
+        if index < snapshot_count // 2:
+            secondary.seed_snapshot(
+                instance_id, f"{snapshot_id}-{secondary.region}", created, storage,
+                kms_key_id=kms_key, source=primary._arn(snapshot_id)
+            )
+
+
+def run_scenario(snapshot_count, storage, timeout_seconds, throttle_rate, seed,
+                 fleet=1, copy_quota=COPY_QUOTA, max_concurrent_copies=COPY_QUOTA,
+                 report_create_time=True):
+    """
+    Run one scheduled backup (including continuations) and collect measurements
+
+    With fleet > 1 the schedule fires for that many instances at once. Their
+    snapshots are all started at schedule time, as concurrent invocations
+    would; the invocations themselves then run one after another on the
+    virtual clock, so each one sees the copies the others left in flight.
+
+    With report_create_time False, snapshots that are not available yet are
+    described without SnapshotCreateTime.
+    """
+    rng = random.Random(seed)
+    clock = SimClock(datetime(2026, 1, 1, 2, 0, tzinfo=timezone.utc))
+    calls = Counter()
+    queue = []
+
+    primary_region, secondary_region = 'us-east-2', 'us-east-1'
+    kms_key = f"arn:aws:kms:{secondary_region}:{ACCOUNT_ID}:key/sim-secondary"
+    if fleet == 1:
+        instance_ids = ['sim-oracle-db']
+    else:
+        instance_ids = [f"sim-oracle-db-{index:03d}" for index in range(fleet)]
+    retention_days = 7
+
+    primary = StubRDS(primary_region, clock, calls, rng, throttle_rate,
+                      report_create_time=report_create_time)
+    secondary = StubRDS(secondary_region, clock, calls, rng, throttle_rate, copy_quota,
+                        report_create_time)
+    primary.peer, secondary.peer = secondary, primary
+    for instance_id in instance_ids:
+        primary.instances[instance_id] = {
+            'DBInstanceIdentifier': instance_id,
+            'Engine': 'oracle-se2',
+            'EngineVersion': '19.0.0.0.ru-2024-10.rur-2024-10.r1',
+            'DBInstanceClass': 'db.t3.micro',
+            'AllocatedStorage': storage,
+        }
+        seed_account(primary, secondary, instance_id, snapshot_count, storage, kms_key, retention_days)
+
+    if fleet > 1:
+        # The other invocations create their snapshots while the first one runs;
+        # each invocation then resumes its own snapshot (idempotency window)
+        timestamp = clock.now().strftime('%Y-%m-%d-%H%M%S')
+        for instance_id in instance_ids:
+            primary.create_db_snapshot(
+                DBInstanceIdentifier=instance_id,
+                DBSnapshotIdentifier=f"{instance_id}-auto-backup-{timestamp}"
+            )
+
+    os.environ.update({
+        'PRIMARY_REGION': primary_region,
+        'SECONDARY_REGION': secondary_region,
+        'RETENTION_DAYS': str(retention_days),
+        'SECONDARY_KMS_KEY': kms_key,
+        'SECONDARY_OPTION_GROUP': 'sim-option-group',
+        'MAX_CONCURRENT_COPIES': str(max_concurrent_copies),
+    })
+
+    patched = {
+        'boto3': StubBoto3({
+            primary_region: primary,
+            secondary_region: secondary,
+            'lambda': StubLambda(calls, queue),
+        }),
+        'time': clock,
+        'datetime': make_sim_datetime(clock),
+        'random': rng,
+    }
+    originals = {name: getattr(lambda_function, name) for name in patched}
+    for name, value in patched.items():
+        setattr(lambda_function, name, value)
+
+    emf_output = io.StringIO()
+    invocations = 0
+    timeouts = 0
+    status_codes = []
+    cpu_started = time.process_time()
+    tracemalloc.start()
+    try:
+        queue.extend({'db_instance_identifier': instance_id} for instance_id in instance_ids)
+        with contextlib.redirect_stdout(emf_output):
+            while queue:
+                event = queue.pop(0)
+                invocations += 1
+                context = SimContext(clock, timeout_seconds)
+                try:
+                    response = lambda_function.lambda_handler(event, context)
+                    status_codes.append(response['statusCode'])
+                except Exception:
+                    # Logged and re-raised by the handler: a failed backup
+                    status_codes.append(500)
+                if clock.monotonic() > context.deadline:
+                    # A real invocation would have been killed at this point
+                    timeouts += 1
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        for name, value in originals.items():
+            setattr(lambda_function, name, value)
+
+    emf_records = [json.loads(line) for line in emf_output.getvalue().splitlines() if '"_aws"' in line]
+    return {
+        'snapshots': snapshot_count,
+        'fleet': fleet,
+        'storage_gb': storage,
+        'invocations': invocations,
+        'status_codes': status_codes,
+        'timeouts': timeouts,
+        'simulated_seconds': round(clock.monotonic(), 1),
+        'cpu_seconds': round(time.process_time() - cpu_started, 3),
+        'peak_memory_bytes': peak_bytes,
+        'api_calls': sum(count for key, count in calls.items()
+                         if not key.endswith((':throttled', ':quota_exceeded'))),
+        'throttled_calls': sum(count for key, count in calls.items() if key.endswith(':throttled')),
+        'copy_quota_errors': sum(count for key, count in calls.items() if key.endswith(':quota_exceeded')),
+        'peak_copies_in_flight': secondary.peak_copies_in_flight,
+        'queued_copy_handoffs': emf_output.getvalue().count('"CopyQueued": 1'),
+        'waiter_polls': sum(record.get('WaiterPolls', 0) for record in emf_records),
+        'api_calls_by_operation': dict(sorted(calls.items())),
+        'remaining_snapshots': {
+            primary_region: len(primary.snapshots),
+            secondary_region: len(secondary.snapshots),
+        },
+        'emf_records': len(emf_records),
+    }
+
+
+def print_report(results):
+    print("=" * 100)
+    print("RDS BACKUP LAMBDA - OFFLINE SIMULATION")
+    print("=" * 100)
+    print(f"{'Snapshots':>10} {'Invocations':>12} {'Timeouts':>9} {'Sim wall (s)':>13} {'CPU (s)':>9} "
+          f"{'Peak mem (KiB)':>15} {'API calls':>10} {'Throttled':>10} {'Polls':>6}")
+    print("-" * 100)
+    for result in results:
+        print(f"{result['snapshots']:>10} {result['invocations']:>12} {result['timeouts']:>9} "
+              f"{result['simulated_seconds']:>13} "
+              f"{result['cpu_seconds']:>9} {result['peak_memory_bytes'] // 1024:>15} "
+              f"{result['api_calls']:>10} {result['throttled_calls']:>10} {result['waiter_polls']:>6}")
+    print("-" * 100)
+    for result in results:
+        if result['fleet'] > 1:
+            print(f"{result['snapshots']} snapshots x {result['fleet']} instances - "
+                  f"peak copies in flight: {result['peak_copies_in_flight']}, "
+                  f"copy quota errors: {result['copy_quota_errors']}, "
+                  f"queued copy hand-offs: {result['queued_copy_handoffs']}, "
+                  f"failed backups: {sum(1 for code in result['status_codes'] if code >= 500)}")
+    for result in results:
+        print(f"\n{result['snapshots']} snapshots - calls by operation:")
+        for operation, count in result['api_calls_by_operation'].items():
+            print(f"   {operation}: {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Simulate the RDS cross-region backup Lambda against stubbed RDS clients'
+    )
+    parser.add_argument('--snapshots', type=int, nargs='+', default=[10, 1000, 50000],
+                        help='Existing manual snapshot counts to simulate (default: 10 1000 50000)')
+    parser.add_argument('--storage', type=int, default=200,
+                        help='Allocated storage of the simulated instance in GB (default: 200)')
+    parser.add_argument('--timeout', type=int, default=300,
+                        help='Simulated Lambda timeout in seconds (default: 300)')
+    parser.add_argument('--throttle-rate', type=float, default=0.02,
+                        help='Probability that an API call is throttled (default: 0.02)')
+    parser.add_argument('--fleet', type=int, default=1,
+                        help='Instances backed up by the same schedule (default: 1)')
+    parser.add_argument('--copy-quota', type=int, default=COPY_QUOTA,
+                        help=f'Copies RDS allows in progress into the secondary region (default: {COPY_QUOTA})')
+    parser.add_argument('--max-concurrent-copies', type=int, default=COPY_QUOTA,
+                        help=f'MAX_CONCURRENT_COPIES given to the function (default: {COPY_QUOTA})')
+    parser.add_argument('--no-create-time', action='store_true',
+                        help='Describe snapshots without SnapshotCreateTime until they are available')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--json', help='Write machine-readable results to this file')
+    args = parser.parse_args()
+
+    # Keep the handler's per-step logging out of the report
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = [
+        run_scenario(count, args.storage, args.timeout, args.throttle_rate, args.seed,
+                     args.fleet, args.copy_quota, args.max_concurrent_copies,
+                     not args.no_create_time)
+        for count in args.snapshots
+    ]
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -103,6 +103,67 @@ variable "snapshot_retention_days" {
   }
 }
 
+variable "snapshot_idempotency_window_minutes" {
+  description = "Minutes within which an existing in-progress or completed auto-backup snapshot is resumed instead of creating a new one (0 disables; keep below the schedule interval)"
+  type        = number
+  default     = 60
+
+  validation {
+    condition     = var.snapshot_idempotency_window_minutes >= 0 && var.snapshot_idempotency_window_minutes <= 1440
+    error_message = "Snapshot idempotency window must be between 0 and 1440 minutes."
+  }
+}
+
+variable "metrics_namespace" {
+  description = "CloudWatch namespace for the Embedded Metric Format metrics emitted by the backup Lambda"
+  type        = string
+  default     = "RDSCrossRegionBackup"
+}
+
+variable "snapshot_wait_reserve_seconds" {
+  description = "Seconds of Lambda time kept for copy and cleanup; when less remains the snapshot wait continues in a new invocation"
+  type        = number
+  default     = 60
+
+  validation {
+    condition     = var.snapshot_wait_reserve_seconds >= 10 && var.snapshot_wait_reserve_seconds <= 600
+    error_message = "Snapshot wait reserve must be between 10 and 600 seconds."
+  }
+
+  validation {
+    condition     = var.snapshot_wait_reserve_seconds * 2 <= var.lambda_timeout
+    error_message = "Snapshot wait reserve must be at most half of lambda_timeout, or every invocation hands off after its first poll."
+  }
+}
+
+variable "snapshot_wait_max_continuations" {
+  description = "Maximum number of self-invocations used to keep waiting for a long-running snapshot"
+  type        = number
+  default     = 20
+}
+
+variable "max_concurrent_copies" {
+  description = "Cross-region snapshot copies allowed in progress into the secondary region (RDS allows 20 per destination region per account); further copies wait for a free slot"
+  type        = number
+  default     = 20
+
+  validation {
+    condition     = var.max_concurrent_copies >= 1 && var.max_concurrent_copies <= 20
+    error_message = "Max concurrent copies must be between 1 and 20."
+  }
+}
+
+variable "copy_queue_timeout_minutes" {
+  description = "Minutes a backup may wait for a free cross-region copy slot before it fails"
+  type        = number
+  default     = 360
+
+  validation {
+    condition     = var.copy_queue_timeout_minutes >= 10 && var.copy_queue_timeout_minutes <= 1440
+    error_message = "Copy queue timeout must be between 10 and 1440 minutes."
+  }
+}
+
 variable "lambda_schedule" {
   description = "EventBridge schedule expression for automated backups (e.g., rate(1 hour) or cron(0 2 * * ? *))"
   type        = string
@@ -3,7 +3,7 @@
 ################################################################################
 
 terraform {
-  required_version = ">= 1.0"
+  required_version = ">= 1.9" # cross-variable validation
 
   required_providers {
     aws = {
@@ -6,19 +6,244 @@ This script helps manage AWS resources by:
 1. Listing ECR images with their last used dates
 2. Listing AMIs with their metadata and last used dates
 3. Deleting old AMIs while keeping a specified number of recent images
+4. Sweeping EBS snapshots orphaned by previously deregistered AMIs
+5. Writing a deletion plan once and applying it later, non-interactively
+6. Reporting ECR storage per repository and the bytes an ARN deletion file would reclaim
 
 Usage:
     python aws_resource_cleanup.py --aws-account-id <account-id> --action list-ecr
     python aws_resource_cleanup.py --aws-account-id <account-id> --action list-ami
     python aws_resource_cleanup.py --aws-account-id <account-id> --action delete-ami --keep 5
+    python aws_resource_cleanup.py --aws-account-id <account-id> --action sweep-snapshots --dry-run
+    python aws_resource_cleanup.py --aws-account-id <account-id> --action plan --plan-file plan.json
+    python aws_resource_cleanup.py --aws-account-id <account-id> --action apply --plan-file plan.json
+    python aws_resource_cleanup.py --aws-account-id <account-id> --action ecr-storage --arn-file images.txt
 """
 
 import argparse
-import boto3
+import hashlib
+import heapq
+import json
+import os
+import re
 import sys
-from datetime import datetime
-from typing import List, Dict
-from botocore.exceptions import ClientError, NoCredentialsError
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Set, Tuple
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+
+# boto3 and botocore.config take a few hundred milliseconds to import, so they
+# are imported on first client construction (see AWSResourceManager._client)
+# rather than at startup; --help and argument errors never pay for them.
+
+
+# AMI IDs referenced in snapshot descriptions written by EC2, e.g.
+# "Created by CreateImage(i-0abc) for ami-0def" or "Copied for DestinationAmi ami-0def ..."
+AMI_ID_PATTERN = re.compile(r'\bami-[0-9a-f]{8,17}\b')
+
+# Default location of the AMI last-launched cache shared between runs
+DEFAULT_USAGE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'aws-cleanup')
+
+# Usage lookups younger than this need no re-check before an AMI is deleted
+FRESH_USAGE_SECONDS = 300
+
+# Deletion plan format (see build_plan / apply_plan)
+PLAN_VERSION = 1
+DEFAULT_PLAN_FILE = 'cleanup-plan.json'
+DEFAULT_MAX_PLAN_AGE_HOURS = 24
+
+# IDs per describe call when re-reading planned items (EC2 filter value limit is 200)
+VERIFY_CHUNK_SIZE = 200
+
+# Image IDs accepted per ECR BatchDeleteImage call
+ECR_DELETE_BATCH_SIZE = 100
+
+
+def fingerprint(*parts) -> str:
+    """Short stable hash of the resource state a plan decision depended on"""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def plan_checksum(plan: Dict) -> str:
+    """SHA-256 over the canonical JSON of every plan field except the checksum"""
+    body = {key: value for key, value in plan.items() if key != 'checksum'}
+    return hashlib.sha256(json.dumps(body, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+
+def snapshot_fingerprint(snapshot: Dict) -> str:
+    return fingerprint(snapshot.get('State'), snapshot.get('Description', ''))
+
+
+def format_bytes(size: float) -> str:
+    """Human-readable binary size, e.g. 1.50 GiB"""
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if abs(size) < 1024:
+            return f"{size:.2f} {unit}" if unit != 'B' else f"{int(size)} B"
+        size /= 1024
+    return f"{size:.2f} TiB"
+
+
+@dataclass
+class ECRImage:
+    """
+    Compact ECR image record
+    
+    Keeps only the fields the tools use. __slots__ avoids a per-instance
+    dict, and repository names and tags are interned so a million images
+    share one copy of each distinct string.
+    """
+    __slots__ = ('repository', 'tags', 'pushed_at', 'size_bytes', 'digest')
+    
+    repository: str
+    tags: Tuple[str, ...]
+    pushed_at: Optional[datetime]
+    size_bytes: int
+    digest: str
+    
+    @classmethod
+    def from_api(cls, repository: str, image: Dict) -> 'ECRImage':
+        """Build a record from one describe_images imageDetails entry"""
+        return cls(
+            repository=sys.intern(repository),
+            tags=tuple(sys.intern(tag) for tag in image.get('imageTags', ())),
+            pushed_at=image.get('imagePushedAt'),
+            size_bytes=image.get('imageSizeInBytes', 0),
+            digest=image.get('imageDigest', 'Unknown')
+        )
+    
+    @property
+    def size_mb(self) -> float:
+        return self.size_bytes / (1024 * 1024)
+    
+    @property
+    def fingerprint(self) -> str:
+        return fingerprint(self.tags, self.pushed_at)
+
+
+@dataclass
+class AMIRecord:
+    """
+    Compact AMI record
+    
+    Keeps only the fields the tools use, with interned tag keys.
+    last_launched is filled in by the usage enrichment stage.
+    """
+    __slots__ = ('ami_id', 'name', 'creation_date', 'state', 'description', 'architecture', 'tags',
+                 'snapshot_ids', 'last_launched')
+    
+    ami_id: str
+    name: str
+    creation_date: str
+    state: str
+    description: str
+    architecture: str
+    tags: Dict[str, str]
+    snapshot_ids: Tuple[str, ...]
+    last_launched: Optional[str]
+    
+    @classmethod
+    def from_api(cls, image: Dict) -> 'AMIRecord':
+        """Build a record from one describe_images Images entry"""
+        return cls(
+            ami_id=image.get('ImageId', 'Unknown'),
+            name=image.get('Name', '<no name>'),
+            creation_date=image.get('CreationDate', 'Unknown'),
+            state=sys.intern(image.get('State', 'Unknown')),
+            description=image.get('Description', '<no description>'),
+            architecture=sys.intern(image.get('Architecture', 'Unknown')),
+            tags={sys.intern(tag['Key']): tag['Value'] for tag in image.get('Tags', [])},
+            snapshot_ids=tuple(
+                mapping['Ebs']['SnapshotId']
+                for mapping in image.get('BlockDeviceMappings', [])
+                if mapping.get('Ebs', {}).get('SnapshotId')
+            ),
+            last_launched=None
+        )
+    
+    @property
+    def fingerprint(self) -> str:
+        return fingerprint(self.state, self.tags, self.snapshot_ids)
+    
+    def launched_within(self, days: int) -> bool:
+        """True if the AMI was launched within the last `days` days"""
+        if not self.last_launched:
+            return False
+        launched = datetime.fromisoformat(self.last_launched.replace('Z', '+00:00'))
+        return launched >= datetime.now(timezone.utc) - timedelta(days=days)
+
+
+@dataclass
+class RepositoryUsage:
+    """Running storage totals for one ECR repository"""
+    __slots__ = ('images', 'bytes', 'untagged_images', 'untagged_bytes', 'reclaimable_images', 'reclaimable_bytes')
+    
+    images: int
+    bytes: int
+    untagged_images: int
+    untagged_bytes: int
+    reclaimable_images: int
+    reclaimable_bytes: int
+    
+    @classmethod
+    def empty(cls) -> 'RepositoryUsage':
+        return cls(0, 0, 0, 0, 0, 0)
+
+
+class ECRStorageReport:
+    """
+    Streaming ECR storage accounting
+    
+    Images are added one at a time and only aggregates are kept: totals per
+    repository, a bounded min-heap of the largest images, and the bytes that
+    match an optional set of deletion targets. Memory grows with the number
+    of repositories and top_k, never with the number of images.
+    """
+    
+    def __init__(self, top_k: int = 20, targets: Optional[Set[Tuple[str, str]]] = None):
+        """
+        Args:
+            top_k: Number of largest images to track
+            targets: (repository, digest) pairs planned for deletion
+        """
+        self.top_k = top_k
+        self.targets = targets or set()
+        self.repositories: Dict[str, RepositoryUsage] = {}
+        # Min-heap of (size_bytes, digest, repository, tags); the smallest tracked image is at [0]
+        self.largest: List[Tuple[int, str, str, Tuple[str, ...]]] = []
+    
+    def add(self, image: ECRImage):
+        usage = self.repositories.get(image.repository)
+        if usage is None:
+            usage = self.repositories[image.repository] = RepositoryUsage.empty()
+        
+        size = image.size_bytes
+        usage.images += 1
+        usage.bytes += size
+        if not image.tags:
+            usage.untagged_images += 1
+            usage.untagged_bytes += size
+        if (image.repository, image.digest) in self.targets:
+            usage.reclaimable_images += 1
+            usage.reclaimable_bytes += size
+        
+        entry = (size, image.digest, image.repository, image.tags)
+        if len(self.largest) < self.top_k:
+            heapq.heappush(self.largest, entry)
+        elif size > self.largest[0][0]:
+            heapq.heapreplace(self.largest, entry)
+    
+    def total(self, field: str) -> int:
+        return sum(getattr(usage, field) for usage in self.repositories.values())
+    
+    def top_repositories(self, count: int, field: str = 'bytes') -> List[Tuple[str, RepositoryUsage]]:
+        return heapq.nlargest(count, self.repositories.items(), key=lambda item: getattr(item[1], field))
+    
+    def largest_images(self) -> List[Tuple[int, str, str, Tuple[str, ...]]]:
+        return sorted(self.largest, reverse=True)
 
 
 class AWSResourceManager:
@@ -33,84 +258,124 @@ class AWSResourceManager:
             region: AWS region (defaults to current configured region)
         """
         self.aws_account_id = aws_account_id
-        self.region = region or boto3.Session().region_name
+        self.region = region or self._default_region()
         
-        try:
-            self.ecr_client = boto3.client('ecr', region_name=self.region)
-            self.ec2_client = boto3.client('ec2', region_name=self.region)
-            print(f"✓ Connected to AWS Account: {self.aws_account_id}")
-            print(f"✓ Using Region: {self.region}")
-        except NoCredentialsError:
-            print("✗ Error: AWS credentials not found. Please configure AWS CLI.")
-            sys.exit(1)
-        except Exception as e:
-            print(f"✗ Error initializing AWS clients: {str(e)}")
-            sys.exit(1)
-    
-    def list_ecr_images(self) -> List[Dict]:
+        # Usage enrichment settings (see enrich_ami_usage)
+        self.usage_workers = 16
+        self.usage_cache_ttl_hours = 24
+        self.usage_cache_path = os.path.join(
+            DEFAULT_USAGE_CACHE_DIR, f"ami-usage-{aws_account_id}-{self.region}.json"
+        )
+        self._usage_fetched_at = {}
+        
+        # Clients are created on first use, so each action only pays for the services it calls
+        self._clients = {}
+        self._client_lock = threading.Lock()
+        
+        print(f"✓ Connected to AWS Account: {self.aws_account_id}")
+        print(f"✓ Using Region: {self.region}")
+    
+    @staticmethod
+    def _default_region() -> Optional[str]:
+        """Configured region, read from the environment before falling back to a boto3 session"""
+        region = os.environ.get('AWS_REGION') or os.environ.get('AWS_DEFAULT_REGION')
+        if region:
+            return region
+        import boto3
+        return boto3.Session().region_name
+    
+    def _client(self, service: str, max_pool_connections: Optional[int] = None):
+        """
+        Return the boto3 client for a service, creating it on first use
+        
+        Args:
+            service: AWS service name, e.g. 'ec2'
+            max_pool_connections: Size the connection pool (and enable adaptive
+                retries) for a client shared by that many worker threads
+        """
+        key = (service, max_pool_connections)
+        client = self._clients.get(key)
+        if client is None:
+            # boto3's default session is not thread-safe, so creation is serialized
+            with self._client_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    import boto3
+                    config = None
+                    if max_pool_connections:
+                        from botocore.config import Config
+                        config = Config(max_pool_connections=max_pool_connections, retries={'mode': 'adaptive'})
+                    client = self._clients[key] = boto3.client(service, region_name=self.region, config=config)
+        return client
+    
+    @property
+    def ecr_client(self):
+        return self._client('ecr')
+    
+    @property
+    def ec2_client(self):
+        return self._client('ec2')
+    
+    def list_ecr_images(self, verbose: bool = True) -> List[ECRImage]:
         """
         List all ECR images with their metadata
         
+        Repositories and images are paged through; each page is converted to
+        compact ECRImage records and the raw response is dropped.
+        
+        Args:
+            verbose: Print every image rather than per-repository totals
+        
         Returns:
-            List of dictionaries containing ECR image information
+            List of ECRImage records
         """
         print("\n" + "="*80)
         print("ECR IMAGES REPORT")
         print("="*80)
         
         all_images = []
+        repository_count = 0
         
         try:
             # Get all repositories
-            repositories = self.ecr_client.describe_repositories()
+            repo_paginator = self.ecr_client.get_paginator('describe_repositories')
+            image_paginator = self.ecr_client.get_paginator('describe_images')
             
-            if not repositories['repositories']:
-                print("No ECR repositories found in this account/region.")
-                return all_images
-            
-            for repo in repositories['repositories']:
-                repo_name = repo['repositoryName']
-                repo_uri = repo['repositoryUri']
-                
-                print(f"\n📦 Repository: {repo_name}")
-                print(f"   URI: {repo_uri}")
-                
-                # Get images in this repository
-                try:
-                    images_response = self.ecr_client.describe_images(
-                        repositoryName=repo_name
-                    )
+            for repo_page in repo_paginator.paginate():
+                for repo in repo_page['repositories']:
+                    repository_count += 1
+                    repo_name = repo['repositoryName']
+                    repo_uri = repo['repositoryUri']
                     
-                    images = images_response.get('imageDetails', [])
+                    print(f"\n📦 Repository: {repo_name}")
+                    print(f"   URI: {repo_uri}")
                     
-                    # Sort by pushed date (most recent first)
-                    images.sort(key=lambda x: x.get('imagePushedAt', datetime.min), reverse=True)
-                    
-                    print(f"   Total Images: {len(images)}")
-                    
-                    for idx, image in enumerate(images, 1):
-                        image_tags = image.get('imageTags', ['<untagged>'])
-                        pushed_at = image.get('imagePushedAt', 'Unknown')
-                        size_mb = image.get('imageSizeInBytes', 0) / (1024 * 1024)
-                        digest = image.get('imageDigest', 'Unknown')
+                    # Get images in this repository
+                    try:
+                        images = [
+                            ECRImage.from_api(repo_name, image)
+                            for page in image_paginator.paginate(repositoryName=repo_name)
+                            for image in page.get('imageDetails', [])
+                        ]
                         
-                        image_info = {
-                            'repository': repo_name,
-                            'uri': repo_uri,
-                            'tags': image_tags,
-                            'pushed_at': pushed_at,
-                            'size_mb': size_mb,
-                            'digest': digest
-                        }
-                        all_images.append(image_info)
+                        # Sort by pushed date (most recent first)
+                        images.sort(key=lambda x: x.pushed_at or datetime.min, reverse=True)
                         
-                        print(f"   {idx}. Tags: {', '.join(image_tags)}")
-                        print(f"      Pushed: {pushed_at}")
-                        print(f"      Size: {size_mb:.2f} MB")
-                        print(f"      Digest: {digest[:20]}...")
-                
-                except ClientError as e:
-                    print(f"   ✗ Error listing images: {e}")
+                        print(f"   Total Images: {len(images)}")
+                        
+                        for idx, image in enumerate(images if verbose else (), 1):
+                            print(f"   {idx}. Tags: {', '.join(image.tags or ('<untagged>',))}")
+                            print(f"      Pushed: {image.pushed_at or 'Unknown'}")
+                            print(f"      Size: {image.size_mb:.2f} MB")
+                            print(f"      Digest: {image.digest[:20]}...")
+                        
+                        all_images.extend(images)
+                    
+                    except ClientError as e:
+                        print(f"   ✗ Error listing images: {e}")
+            
+            if not repository_count:
+                print("No ECR repositories found in this account/region.")
                     
         except ClientError as e:
             print(f"✗ Error listing repositories: {e}")
@@ -118,12 +383,313 @@ class AWSResourceManager:
         print(f"\n📊 Total ECR images across all repositories: {len(all_images)}")
         return all_images
     
-    def list_amis(self) -> List[Dict]:
+    def iter_ecr_images(self):
+        """
+        Yield every ECR image in the region as an ECRImage, page by page
+        
+        Nothing is accumulated, so callers can aggregate inventories of any
+        size in bounded memory.
+        """
+        repo_paginator = self.ecr_client.get_paginator('describe_repositories')
+        image_paginator = self.ecr_client.get_paginator('describe_images')
+        
+        for repo_page in repo_paginator.paginate():
+            for repo in repo_page['repositories']:
+                repo_name = repo['repositoryName']
+                try:
+                    for page in image_paginator.paginate(repositoryName=repo_name):
+                        for image in page.get('imageDetails', []):
+                            yield ECRImage.from_api(repo_name, image)
+                except ClientError as e:
+                    print(f"   ✗ Error listing images in {repo_name}: {e}")
+    
+    def _load_deletion_targets(self, arn_file: str) -> Tuple[Set[Tuple[str, str]], int, int]:
+        """
+        Read an ECR image ARN file (the delete_ecr_images.py format)
+        
+        Returns:
+            Tuple of ((repository, digest) pairs in this region, ARNs for other regions, invalid ARNs)
+        """
+        # Imported here so the other actions don't pay for delete_ecr_images' logging setup
+        from delete_ecr_images import load_arns_from_file, parse_arn
+        
+        targets = set()
+        other_regions = 0
+        invalid = 0
+        for arn in load_arns_from_file(arn_file):
+            try:
+                region, repository, digest = parse_arn(arn)
+            except ValueError:
+                invalid += 1
+                continue
+            if region == self.region:
+                targets.add((repository, digest))
+            else:
+                other_regions += 1
+        return targets, other_regions, invalid
+    
+    def ecr_storage_report(self, top_k: int = 20, arn_file: Optional[str] = None,
+                           report_file: Optional[str] = None) -> ECRStorageReport:
+        """
+        Report ECR storage per repository and per account
+        
+        Streams every image through an ECRStorageReport: per-repository and
+        account totals, untagged bytes, the top_k largest images and, given
+        an ARN deletion file, the bytes that deleting those images would
+        reclaim, ranked by repository.
+        
+        Args:
+            top_k: Number of largest images and repositories to show
+            arn_file: Optional file of ECR image ARNs planned for deletion
+            report_file: Optional path to write the report as JSON
+            
+        Returns:
+            The populated ECRStorageReport
+        """
+        print("\n" + "="*80)
+        print("ECR STORAGE REPORT")
+        print("="*80)
+        
+        targets, other_regions, invalid = set(), 0, 0
+        if arn_file:
+            targets, other_regions, invalid = self._load_deletion_targets(arn_file)
+        
+        report = ECRStorageReport(top_k=top_k, targets=targets)
+        try:
+            for image in self.iter_ecr_images():
+                report.add(image)
+        except ClientError as e:
+            print(f"✗ Error listing repositories: {e}")
+            return report
+        
+        total_images = report.total('images')
+        print(f"\n📊 Account totals ({self.region}):")
+        print(f"   Repositories: {len(report.repositories)}")
+        print(f"   Images: {total_images}")
+        print(f"   Stored: {format_bytes(report.total('bytes'))}")
+        print(f"   Untagged: {report.total('untagged_images')} images, {format_bytes(report.total('untagged_bytes'))}")
+        
+        if not total_images:
+            print("\nNo ECR images found in this account/region.")
+            return report
+        
+        print("\n" + "-"*80)
+        print(f"TOP {top_k} REPOSITORIES BY SIZE:")
+        print("-"*80)
+        for idx, (name, usage) in enumerate(report.top_repositories(top_k), 1):
+            print(f"{idx}. {name} - {format_bytes(usage.bytes)} ({usage.images} images, "
+                  f"untagged {format_bytes(usage.untagged_bytes)})")
+        
+        print("\n" + "-"*80)
+        print(f"TOP {top_k} LARGEST IMAGES:")
+        print("-"*80)
+        for idx, (size, digest, repository, tags) in enumerate(report.largest_images(), 1):
+            print(f"{idx}. {repository}@{digest[:19]}... - {format_bytes(size)} "
+                  f"(Tags: {', '.join(tags or ('<untagged>',))})")
+        
+        reclaim = None
+        if arn_file:
+            matched = report.total('reclaimable_images')
+            reclaim = {
+                'arn_file': arn_file,
+                'targets_in_region': len(targets),
+                'matched_images': matched,
+                'not_found': len(targets) - matched,
+                'other_regions': other_regions,
+                'invalid': invalid,
+                'reclaimable_bytes': report.total('reclaimable_bytes')
+            }
+            
+            print("\n" + "-"*80)
+            print(f"PROJECTED RECLAIM ({arn_file}):")
+            print("-"*80)
+            print(f"   ARNs in {self.region}: {len(targets)} ({matched} found, {len(targets) - matched} not found)")
+            if other_regions:
+                print(f"   ARNs in other regions: {other_regions} (run again with --region to include them)")
+            if invalid:
+                print(f"   Invalid ARNs: {invalid}")
+            print(f"   Reclaimable: {format_bytes(reclaim['reclaimable_bytes'])}")
+            print("   (sum of image sizes; layers shared with images that are kept are not freed)")
+            
+            ranked = [item for item in report.top_repositories(len(report.repositories), 'reclaimable_bytes')
+                      if item[1].reclaimable_images]
+            for idx, (name, usage) in enumerate(ranked[:top_k], 1):
+                print(f"   {idx}. {name} - {format_bytes(usage.reclaimable_bytes)} "
+                      f"({usage.reclaimable_images} images)")
+        
+        if report_file:
+            with open(report_file, 'w') as f:
+                json.dump({
+                    'account_id': self.aws_account_id,
+                    'region': self.region,
+                    'generated_at': datetime.now(timezone.utc).isoformat(),
+                    'totals': {
+                        field: report.total(field)
+                        for field in ('images', 'bytes', 'untagged_images', 'untagged_bytes')
+                    },
+                    'repositories': [
+                        {'repository': name, **{field: getattr(usage, field) for field in RepositoryUsage.__slots__}}
+                        for name, usage in report.top_repositories(len(report.repositories))
+                    ],
+                    'largest_images': [
+                        {'repository': repository, 'digest': digest, 'size_bytes': size, 'tags': list(tags)}
+                        for size, digest, repository, tags in report.largest_images()
+                    ],
+                    'reclaim': reclaim
+                }, f, indent=2)
+            print(f"\n✓ Report written to {report_file}")
+        
+        return report
+    
+    def _load_usage_cache(self) -> Dict[str, Dict]:
+        """Load cached lastLaunchedTime lookups, dropping entries older than the TTL"""
+        try:
+            with open(self.usage_cache_path, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        cutoff = time.time() - self.usage_cache_ttl_hours * 3600
+        return {ami_id: entry for ami_id, entry in cache.items() if entry.get('fetched_at', 0) >= cutoff}
+    
+    def _save_usage_cache(self, cache: Dict[str, Dict]):
+        """Write the usage cache atomically so concurrent runs never see a partial file"""
+        try:
+            os.makedirs(os.path.dirname(self.usage_cache_path), exist_ok=True)
+            tmp_path = f"{self.usage_cache_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.usage_cache_path)
+        except OSError as e:
+            print(f"   ⚠️  Could not write usage cache {self.usage_cache_path}: {e}")
+    
+    def _fetch_last_launched(self, ec2_client, ami_id: str) -> Optional[str]:
+        """Fetch one AMI's lastLaunchedTime attribute (None if never launched)"""
+        response = ec2_client.describe_image_attribute(ImageId=ami_id, Attribute='lastLaunchedTime')
+        return response.get('LastLaunchedTime', {}).get('Value')
+    
+    def enrich_ami_usage(self, amis: List[AMIRecord]) -> List[AMIRecord]:
+        """
+        Fill in last_launched for each AMI
+        
+        lastLaunchedTime is only available through describe_image_attribute,
+        one call per AMI, so lookups run concurrently on a bounded worker pool
+        and results are cached between runs for usage_cache_ttl_hours.
+        
+        Args:
+            amis: AMI records to enrich (updated in place)
+            
+        Returns:
+            The same list of AMI records
+        """
+        cache = self._load_usage_cache()
+        missing = [ami for ami in amis if ami.ami_id not in cache]
+        
+        print(f"\n🔎 Usage lookup: {len(amis) - len(missing)} cached, {len(missing)} to fetch "
+              f"({self.usage_workers} workers)")
+        
+        if missing:
+            self._fetch_usage(missing, cache)
+            self._save_usage_cache(cache)
+        
+        for ami in amis:
+            entry = cache.get(ami.ami_id, {})
+            ami.last_launched = entry.get('last_launched')
+            self._usage_fetched_at[ami.ami_id] = entry.get('fetched_at', 0)
+        
+        return amis
+    
+    def _fetch_usage(self, amis: List[AMIRecord], cache: Dict[str, Dict]) -> Set[str]:
+        """
+        Look up lastLaunchedTime for the given AMIs on the worker pool
+        
+        Args:
+            amis: AMI records to look up (last_launched is updated in place)
+            cache: Usage cache, updated in place with the results
+            
+        Returns:
+            IDs of the AMIs whose lookup failed (left out of the cache)
+        """
+        # Size the connection pool to the worker count to avoid pool contention
+        ec2_client = self._client('ec2', max_pool_connections=self.usage_workers)
+        started = time.monotonic()
+        failed = set()
+        with ThreadPoolExecutor(max_workers=self.usage_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_last_launched, ec2_client, ami.ami_id): ami
+                for ami in amis
+            }
+            for future in as_completed(futures):
+                ami = futures[future]
+                try:
+                    ami.last_launched = future.result()
+                    cache[ami.ami_id] = {'last_launched': ami.last_launched, 'fetched_at': time.time()}
+                except (ClientError, BotoCoreError) as e:
+                    # Left uncached so the next run retries it
+                    print(f"   ✗ {ami.ami_id}: {e}")
+                    cache.pop(ami.ami_id, None)
+                    failed.add(ami.ami_id)
+        
+        print(f"   Fetched {len(amis) - len(failed)} in {time.monotonic() - started:.1f}s"
+              f"{f', {len(failed)} failed' if failed else ''}")
+        return failed
+    
+    def confirm_not_launched(self, amis: List[AMIRecord],
+                             keep_launched_days: int) -> Tuple[List[AMIRecord], List[AMIRecord]]:
+        """
+        Look up deletion candidates again when their usage came from the cache
+        
+        A cached recent launch can only keep an AMI, so it is safe to reuse.
+        A cached "not launched within the window" may be out of date, and
+        acting on it would delete an AMI launched since the lookup, so those
+        AMIs are fetched again, bypassing the cache.
+        
+        Args:
+            amis: AMIs selected for deletion
+            keep_launched_days: Keep window the selection used
+            
+        Returns:
+            Tuple of (AMIs to keep after all, AMIs still safe to delete)
+        """
+        cutoff = time.time() - FRESH_USAGE_SECONDS
+        stale = [ami for ami in amis if self._usage_fetched_at.get(ami.ami_id, 0) < cutoff]
+        if not stale:
+            return [], amis
+        
+        print(f"\n🔎 Re-checking {len(stale)} cached usage result(s) before deletion")
+        cache = self._load_usage_cache()
+        failed = self._fetch_usage(stale, cache)
+        self._save_usage_cache(cache)
+        
+        keep, to_delete = [], []
+        for ami in amis:
+            if ami.ami_id in failed:
+                # Unknown usage never justifies a deletion
+                keep.append(ami)
+                continue
+            if ami.ami_id in cache:
+                self._usage_fetched_at[ami.ami_id] = cache[ami.ami_id]['fetched_at']
+            if ami.launched_within(keep_launched_days):
+                keep.append(ami)
+            else:
+                to_delete.append(ami)
+        
+        if keep:
+            print(f"   {len(keep)} AMI(s) launched since their cached lookup (or not verifiable) - kept")
+        return keep, to_delete
+    
+    def list_amis(self, with_usage: bool = True, verbose: bool = True,
+                  include_disabled: bool = False) -> List[AMIRecord]:
         """
         List all AMIs owned by the account with their metadata
         
+        Args:
+            with_usage: Also look up each AMI's last launched time
+            verbose: Print every AMI rather than just the total
+            include_disabled: Also list disabled AMIs (left out by describe_images by default)
+        
         Returns:
-            List of dictionaries containing AMI information
+            List of AMIRecord records
         """
         print("\n" + "="*80)
         print("AMI (Amazon Machine Images) REPORT")
@@ -133,54 +699,38 @@ class AWSResourceManager:
         
         try:
             # Get AMIs owned by this account
-            response = self.ec2_client.describe_images(
-                Owners=[self.aws_account_id]
-            )
-            
-            amis = response.get('Images', [])
+            paginator = self.ec2_client.get_paginator('describe_images')
+            all_amis = [
+                AMIRecord.from_api(ami)
+                for page in paginator.paginate(Owners=[self.aws_account_id], IncludeDisabled=include_disabled)
+                for ami in page.get('Images', [])
+            ]
             
-            if not amis:
+            if not all_amis:
                 print("No AMIs found in this account/region.")
                 return all_amis
             
             # Sort by creation date (most recent first)
-            amis.sort(key=lambda x: x.get('CreationDate', ''), reverse=True)
+            all_amis.sort(key=lambda x: x.creation_date, reverse=True)
             
-            print(f"\nTotal AMIs: {len(amis)}")
+            if with_usage:
+                self.enrich_ami_usage(all_amis)
+            
+            print(f"\nTotal AMIs: {len(all_amis)}")
             print("-" * 80)
             
-            for idx, ami in enumerate(amis, 1):
-                ami_id = ami.get('ImageId', 'Unknown')
-                ami_name = ami.get('Name', '<no name>')
-                creation_date = ami.get('CreationDate', 'Unknown')
-                state = ami.get('State', 'Unknown')
-                description = ami.get('Description', '<no description>')
-                architecture = ami.get('Architecture', 'Unknown')
-                
-                # Get tags
-                tags = ami.get('Tags', [])
-                tag_dict = {tag['Key']: tag['Value'] for tag in tags}
-                
-                ami_info = {
-                    'ami_id': ami_id,
-                    'name': ami_name,
-                    'creation_date': creation_date,
-                    'state': state,
-                    'description': description,
-                    'architecture': architecture,
-                    'tags': tag_dict
-                }
-                all_amis.append(ami_info)
-                
-                print(f"\n{idx}. AMI ID: {ami_id}")
-                print(f"   Name: {ami_name}")
-                print(f"   Created: {creation_date}")
-                print(f"   State: {state}")
-                print(f"   Architecture: {architecture}")
-                if description and description != '<no description>':
-                    print(f"   Description: {description[:60]}...")
-                if tag_dict:
-                    print(f"   Tags: {tag_dict}")
+            for idx, ami in enumerate(all_amis if verbose else (), 1):
+                print(f"\n{idx}. AMI ID: {ami.ami_id}")
+                print(f"   Name: {ami.name}")
+                print(f"   Created: {ami.creation_date}")
+                print(f"   State: {ami.state}")
+                print(f"   Architecture: {ami.architecture}")
+                if with_usage:
+                    print(f"   Last Launched: {ami.last_launched or 'Never'}")
+                if ami.description and ami.description != '<no description>':
+                    print(f"   Description: {ami.description[:60]}...")
+                if ami.tags:
+                    print(f"   Tags: {ami.tags}")
             
         except ClientError as e:
             print(f"✗ Error listing AMIs: {e}")
@@ -188,13 +738,36 @@ class AWSResourceManager:
         print(f"\n📊 Total AMIs: {len(all_amis)}")
         return all_amis
     
-    def delete_old_amis(self, keep_count: int = 5, dry_run: bool = True) -> int:
+    def _select_old_amis(self, amis: List[AMIRecord], keep_count: int,
+                         keep_launched_days: Optional[int]) -> Tuple[List[AMIRecord], List[AMIRecord]]:
+        """
+        Split AMIs beyond the keep_count most recent into recently launched and deletable
+        
+        Args:
+            amis: AMI records sorted most recent first
+            keep_count: Number of most recent AMIs to keep
+            keep_launched_days: Also keep older AMIs launched within this many days
+            
+        Returns:
+            Tuple of (older AMIs kept because they were launched recently, AMIs to delete)
+        """
+        older = amis[keep_count:]
+        if keep_launched_days is None:
+            return [], older
+        
+        recently_launched = [ami for ami in older if ami.launched_within(keep_launched_days)]
+        to_delete = [ami for ami in older if not ami.launched_within(keep_launched_days)]
+        return recently_launched, to_delete
+    
+    def delete_old_amis(self, keep_count: int = 5, dry_run: bool = True,
+                        keep_launched_days: Optional[int] = None) -> int:
         """
         Delete old AMIs, keeping only the specified number of most recent ones
         
         Args:
             keep_count: Number of most recent AMIs to keep
             dry_run: If True, only simulate deletion without actually deleting
+            keep_launched_days: Also keep older AMIs launched within this many days
             
         Returns:
             Number of AMIs deleted (or would be deleted in dry-run mode)
@@ -203,19 +776,24 @@ class AWSResourceManager:
         print(f"AMI DELETION {'(DRY RUN)' if dry_run else '(LIVE)'}")
         print("="*80)
         
-        amis = self.list_amis()
+        amis = self.list_amis(with_usage=keep_launched_days is not None)
         
         if len(amis) <= keep_count:
             print(f"\n✓ Only {len(amis)} AMI(s) found. Keeping all as requested count is {keep_count}.")
             return 0
         
         # Calculate how many to delete
-        amis_to_delete = amis[keep_count:]
+        recently_launched, amis_to_delete = self._select_old_amis(amis, keep_count, keep_launched_days)
+        if keep_launched_days is not None:
+            launched_since, amis_to_delete = self.confirm_not_launched(amis_to_delete, keep_launched_days)
+            recently_launched += launched_since
         delete_count = len(amis_to_delete)
         
         print(f"\n📋 Analysis:")
         print(f"   Total AMIs: {len(amis)}")
         print(f"   AMIs to keep: {keep_count}")
+        if keep_launched_days is not None:
+            print(f"   Older AMIs kept (launched within {keep_launched_days} days): {len(recently_launched)}")
         print(f"   AMIs to delete: {delete_count}")
         
         if dry_run:
@@ -227,13 +805,24 @@ class AWSResourceManager:
         print("AMIs TO KEEP (most recent):")
         print("-"*80)
         for idx, ami in enumerate(amis[:keep_count], 1):
-            print(f"{idx}. {ami['ami_id']} - {ami['name']} (Created: {ami['creation_date']})")
+            print(f"{idx}. {ami.ami_id} - {ami.name} (Created: {ami.creation_date})")
+        
+        if recently_launched:
+            print("\n" + "-"*80)
+            print(f"AMIs TO KEEP (launched within {keep_launched_days} days):")
+            print("-"*80)
+            for idx, ami in enumerate(recently_launched, 1):
+                print(f"{idx}. {ami.ami_id} - {ami.name} (Last launched: {ami.last_launched})")
+        
+        if not amis_to_delete:
+            print("\n✓ Nothing to delete.")
+            return 0
         
         print("\n" + "-"*80)
         print(f"AMIs TO DELETE (older):")
         print("-"*80)
         for idx, ami in enumerate(amis_to_delete, 1):
-            print(f"{idx}. {ami['ami_id']} - {ami['name']} (Created: {ami['creation_date']})")
+            print(f"{idx}. {ami.ami_id} - {ami.name} (Created: {ami.creation_date})")
         
         if not dry_run:
             # Ask for confirmation
@@ -250,7 +839,7 @@ class AWSResourceManager:
             
             print("\n🗑️  Deleting AMIs...")
             for ami in amis_to_delete:
-                ami_id = ami['ami_id']
+                ami_id = ami.ami_id
                 try:
                     # First, deregister the AMI
                     print(f"   Deregistering {ami_id}...", end=" ")
@@ -274,6 +863,653 @@ class AWSResourceManager:
         else:
             print(f"\n✓ Dry run complete. {delete_count} AMI(s) would be deleted in live mode.")
             return delete_count
+    
+    def _owned_ami_index(self, amis: Optional[List[AMIRecord]] = None) -> Tuple[Set[str], Set[str]]:
+        """
+        Page through all owned AMIs once, including disabled ones (which
+        describe_images leaves out by default but which still hold their snapshots)
+        
+        Args:
+            amis: Records from list_amis(include_disabled=True) to index instead of listing again
+        
+        Returns:
+            Tuple of (owned AMI IDs, snapshot IDs referenced by their block device mappings)
+        """
+        if amis is not None:
+            return {ami.ami_id for ami in amis}, {snapshot_id for ami in amis for snapshot_id in ami.snapshot_ids}
+        
+        ami_ids = set()
+        referenced_snapshots = set()
+        
+        paginator = self.ec2_client.get_paginator('describe_images')
+        for page in paginator.paginate(Owners=[self.aws_account_id], IncludeDisabled=True):
+            for image in page.get('Images', []):
+                ami_ids.add(image['ImageId'])
+                for mapping in image.get('BlockDeviceMappings', []):
+                    snapshot_id = mapping.get('Ebs', {}).get('SnapshotId')
+                    if snapshot_id:
+                        referenced_snapshots.add(snapshot_id)
+        
+        return ami_ids, referenced_snapshots
+    
+    def find_orphaned_snapshots(self, amis: Optional[List[AMIRecord]] = None) -> List[Dict]:
+        """
+        Find EBS snapshots created for AMIs that no longer exist
+        
+        Snapshots and AMIs are each listed once; orphan detection is then a
+        single pass over the snapshots with set lookups. Only snapshots whose
+        description names an AMI are considered, so manual EBS backups and
+        AWS Backup snapshots are never treated as orphans.
+        
+        Args:
+            amis: All owned AMIs, including disabled ones, if the caller already listed them
+        
+        Returns:
+            List of dictionaries describing orphaned snapshots
+        """
+        ami_ids, referenced_snapshots = self._owned_ami_index(amis)
+        print(f"   Owned AMIs: {len(ami_ids)} ({len(referenced_snapshots)} referenced snapshots)")
+        
+        orphans = []
+        scanned = 0
+        paginator = self.ec2_client.get_paginator('describe_snapshots')
+        for page in paginator.paginate(OwnerIds=[self.aws_account_id]):
+            for snapshot in page.get('Snapshots', []):
+                scanned += 1
+                snapshot_id = snapshot['SnapshotId']
+                if snapshot_id in referenced_snapshots:
+                    continue
+                
+                # The first AMI named is the one the snapshot was created for
+                # (a copy's description also names its source AMI afterwards)
+                ami_refs = AMI_ID_PATTERN.findall(snapshot.get('Description', ''))
+                if not ami_refs or ami_refs[0] in ami_ids:
+                    continue
+                
+                orphans.append({
+                    'snapshot_id': snapshot_id,
+                    'ami_id': ami_refs[0],
+                    'size_gib': snapshot.get('VolumeSize', 0),
+                    'start_time': snapshot.get('StartTime', 'Unknown'),
+                    'fingerprint': snapshot_fingerprint(snapshot)
+                })
+        
+        print(f"   Owned snapshots scanned: {scanned}")
+        return orphans
+    
+    def sweep_orphaned_snapshots(self, dry_run: bool = True, workers: int = 8) -> int:
+        """
+        Delete EBS snapshots left behind by deregistered AMIs
+        
+        Args:
+            dry_run: If True, only report orphans without deleting them
+            workers: Number of parallel deletion workers
+            
+        Returns:
+            Number of snapshots deleted (or would be deleted in dry-run mode)
+        """
+        print("\n" + "="*80)
+        print(f"ORPHANED SNAPSHOT SWEEP {'(DRY RUN)' if dry_run else '(LIVE)'}")
+        print("="*80)
+        
+        try:
+            orphans = self.find_orphaned_snapshots()
+        except (ClientError, BotoCoreError) as e:
+            print(f"✗ Error scanning snapshots: {e}")
+            return 0
+        
+        reclaimable_gib = sum(orphan['size_gib'] for orphan in orphans)
+        
+        print(f"\n📋 Analysis:")
+        print(f"   Orphaned snapshots: {len(orphans)}")
+        print(f"   Reclaimable: {reclaimable_gib} GiB (provisioned volume size; billed "
+              f"snapshot storage is incremental and may be lower)")
+        
+        if not orphans:
+            print("\n✓ No orphaned snapshots found.")
+            return 0
+        
+        print("\n" + "-"*80)
+        print("ORPHANED SNAPSHOTS:")
+        print("-"*80)
+        for idx, orphan in enumerate(orphans, 1):
+            print(f"{idx}. {orphan['snapshot_id']} - {orphan['size_gib']} GiB "
+                  f"(AMI: {orphan['ami_id']}, Created: {orphan['start_time']})")
+        
+        if dry_run:
+            print(f"\n✓ Dry run complete. {len(orphans)} snapshot(s) would be deleted in live mode.")
+            return len(orphans)
+        
+        print("\n" + "="*80)
+        confirmation = input(f"⚠️  Type 'yes' to confirm deletion of {len(orphans)} snapshots: ")
+        
+        if confirmation.lower() != 'yes':
+            print("❌ Deletion cancelled by user.")
+            return 0
+        
+        deleted_count = 0
+        failed_count = 0
+        deleted_gib = 0
+        
+        print(f"\n🗑️  Deleting snapshots with {workers} parallel workers...")
+        # Size the connection pool to the worker count to avoid pool contention
+        ec2_client = self._client('ec2', max_pool_connections=workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(ec2_client.delete_snapshot, SnapshotId=orphan['snapshot_id']): orphan
+                for orphan in orphans
+            }
+            for future in as_completed(futures):
+                orphan = futures[future]
+                try:
+                    future.result()
+                    deleted_count += 1
+                    deleted_gib += orphan['size_gib']
+                except (ClientError, BotoCoreError) as e:
+                    print(f"   ✗ {orphan['snapshot_id']} failed: {e}")
+                    failed_count += 1
+        
+        print(f"\n📊 Deletion Summary:")
+        print(f"   Successfully deleted: {deleted_count} ({deleted_gib} GiB)")
+        print(f"   Failed: {failed_count}")
+        
+        return deleted_count
+    
+    def build_plan(self, keep_count: int = 5, keep_launched_days: Optional[int] = None,
+                   ecr_keep: Optional[int] = None) -> Dict:
+        """
+        Build a deletion plan without deleting anything
+        
+        This is the expensive step: every AMI, snapshot and (optionally) ECR
+        image is listed once. Each planned item records a fingerprint of the
+        state the decision was based on, so apply_plan can tell which items
+        changed since planning without listing everything again.
+        
+        Args:
+            keep_count: Number of most recent AMIs to keep
+            keep_launched_days: Also keep older AMIs launched within this many days
+            ecr_keep: Most recent images to keep per ECR repository (None skips ECR)
+            
+        Returns:
+            Plan dictionary, including its checksum
+        """
+        print("\n" + "="*80)
+        print("CLEANUP PLAN")
+        print("="*80)
+        
+        # One listing serves both the AMI selection and the orphan scan below;
+        # disabled AMIs are never planned but still hold their snapshots
+        all_amis = self.list_amis(with_usage=False, verbose=False, include_disabled=True)
+        amis = [ami for ami in all_amis if ami.state != 'disabled']
+        if keep_launched_days is not None:
+            self.enrich_ami_usage(amis)
+        _, amis_to_delete = self._select_old_amis(amis, keep_count, keep_launched_days)
+        if keep_launched_days is not None:
+            _, amis_to_delete = self.confirm_not_launched(amis_to_delete, keep_launched_days)
+        
+        ami_items = [
+            {'id': ami.ami_id, 'name': ami.name, 'snapshots': list(ami.snapshot_ids), 'fp': ami.fingerprint}
+            for ami in amis_to_delete
+        ]
+        
+        # Snapshots backing the planned AMIs become orphans once they are deregistered,
+        # unless an AMI that is kept (including a disabled one) uses them too
+        snapshot_items = []
+        planned_ids = {ami.ami_id for ami in amis_to_delete}
+        still_used = {
+            snapshot_id for ami in all_amis if ami.ami_id not in planned_ids for snapshot_id in ami.snapshot_ids
+        }
+        backing = {
+            snapshot_id: ami.ami_id
+            for ami in amis_to_delete for snapshot_id in ami.snapshot_ids if snapshot_id not in still_used
+        }
+        for snapshot in self._describe_snapshots_by_id(list(backing)).values():
+            snapshot_items.append({
+                'id': snapshot['SnapshotId'],
+                'ami_id': backing[snapshot['SnapshotId']],
+                'size_gib': snapshot.get('VolumeSize', 0),
+                'fp': snapshot_fingerprint(snapshot)
+            })
+        
+        print("\n🔎 Scanning for snapshots already orphaned...")
+        for orphan in self.find_orphaned_snapshots(all_amis):
+            snapshot_items.append({
+                'id': orphan['snapshot_id'],
+                'ami_id': orphan['ami_id'],
+                'size_gib': orphan['size_gib'],
+                'fp': orphan['fingerprint']
+            })
+        
+        ecr_items = []
+        if ecr_keep is not None:
+            print("\n🔎 Listing ECR images and their manifest references...")
+            ecr_items = self._plan_ecr_images(ecr_keep)
+        
+        plan = {
+            'version': PLAN_VERSION,
+            'account_id': self.aws_account_id,
+            'region': self.region,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'policy': {'keep': keep_count, 'keep_launched_days': keep_launched_days, 'ecr_keep': ecr_keep},
+            'amis': ami_items,
+            'snapshots': snapshot_items,
+            'ecr_images': ecr_items
+        }
+        plan['checksum'] = plan_checksum(plan)
+        
+        print(f"\n📋 Plan:")
+        print(f"   AMIs to deregister: {len(ami_items)}")
+        print(f"   Snapshots to delete: {len(snapshot_items)} "
+              f"({sum(item['size_gib'] for item in snapshot_items)} GiB provisioned)")
+        if ecr_keep is not None:
+            print(f"   ECR images to delete: {len(ecr_items)} "
+                  f"({sum(item['size_bytes'] for item in ecr_items) / (1024 ** 3):.2f} GiB)")
+        
+        return plan
+    
+    def _plan_ecr_images(self, keep: int) -> List[Dict]:
+        """
+        Plan ECR images beyond the `keep` most recent per repository
+        
+        Each repository is listed once and its image indexes are read to build
+        its manifest graph (see delete_ecr_images.build_manifest_graph). Only
+        indexes and standalone manifests count towards `keep`. The platform
+        manifests of a kept index are never planned. Those of a planned index
+        are planned with it, listing it under 'parents', if they are untagged
+        and no kept index uses them.
+        
+        Returns:
+            Plan items, each index before the manifests it references
+        """
+        # Imported here so plans without ECR don't pay for delete_ecr_images' logging setup
+        from delete_ecr_images import build_manifest_graph, plan_manifest_deletions
+        
+        items = []
+        repo_paginator = self.ecr_client.get_paginator('describe_repositories')
+        image_paginator = self.ecr_client.get_paginator('describe_images')
+        for repo_page in repo_paginator.paginate():
+            for repo in repo_page['repositories']:
+                repository = repo['repositoryName']
+                try:
+                    details = [
+                        image
+                        for page in image_paginator.paginate(repositoryName=repository)
+                        for image in page.get('imageDetails', [])
+                    ]
+                    graph = build_manifest_graph(self.ecr_client, repository, details)
+                except (ClientError, BotoCoreError, ValueError, KeyError) as e:
+                    # Unreadable repository or malformed index manifest: plan nothing in it
+                    print(f"   ✗ Skipping ECR repository {repository}: {e!r}")
+                    continue
+                
+                images = {image['imageDigest']: ECRImage.from_api(repository, image) for image in details}
+                del details
+                
+                # Manifests referenced by an index are not images of their own for `keep`
+                roots = sorted(
+                    (image for digest, image in images.items() if not graph.parents.get(digest)),
+                    key=lambda image: image.pushed_at or datetime.min, reverse=True
+                )
+                deleting, _, _ = plan_manifest_deletions(graph, {image.digest for image in roots[keep:]})
+                
+                for digest in sorted(deleting, key=lambda digest: (bool(graph.parents.get(digest)), digest)):
+                    image = images[digest]
+                    item = {
+                        'repository': repository,
+                        'digest': digest,
+                        'size_bytes': image.size_bytes,
+                        'fp': image.fingerprint
+                    }
+                    if graph.parents.get(digest):
+                        item['parents'] = sorted(graph.parents[digest])
+                    items.append(item)
+        return items
+    
+    @staticmethod
+    def write_plan(plan: Dict, path: str):
+        """Write a plan as compact JSON, atomically"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(plan, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        print(f"✓ Plan written to {path} (checksum {plan['checksum'][:12]})")
+    
+    def load_plan(self, path: str, max_age_hours: float = DEFAULT_MAX_PLAN_AGE_HOURS) -> Dict:
+        """
+        Read a plan file and check it can be applied here
+        
+        Args:
+            path: Plan file written by write_plan
+            max_age_hours: Reject plans older than this
+            
+        Returns:
+            Plan dictionary
+            
+        Raises:
+            ValueError: If the plan is corrupt, stale, or for another account/region
+        """
+        try:
+            with open(path, 'r') as f:
+                plan = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Cannot read plan {path}: {e}")
+        
+        if plan.get('version') != PLAN_VERSION:
+            raise ValueError(f"Unsupported plan version {plan.get('version')} (expected {PLAN_VERSION})")
+        if plan.get('checksum') != plan_checksum(plan):
+            raise ValueError("Plan checksum mismatch - the file was modified or truncated")
+        if plan['account_id'] != self.aws_account_id or plan['region'] != self.region:
+            raise ValueError(f"Plan is for {plan['account_id']}/{plan['region']}, "
+                             f"not {self.aws_account_id}/{self.region}")
+        
+        age_hours = (datetime.now(timezone.utc) - datetime.fromisoformat(plan['created_at'])).total_seconds() / 3600
+        if age_hours > max_age_hours:
+            raise ValueError(f"Plan is {age_hours:.1f} hours old (max {max_age_hours}); run plan again")
+        
+        return plan
+    
+    def _describe_amis_by_id(self, ami_ids: List[str]) -> Dict[str, AMIRecord]:
+        """
+        Current state of the given owned AMIs, disabled ones included; IDs
+        that no longer exist are absent
+        """
+        found = {}
+        paginator = self.ec2_client.get_paginator('describe_images')
+        for start in range(0, len(ami_ids), VERIFY_CHUNK_SIZE):
+            chunk = ami_ids[start:start + VERIFY_CHUNK_SIZE]
+            for page in paginator.paginate(Owners=[self.aws_account_id], IncludeDisabled=True,
+                                           Filters=[{'Name': 'image-id', 'Values': chunk}]):
+                for image in page.get('Images', []):
+                    found[image['ImageId']] = AMIRecord.from_api(image)
+        return found
+    
+    def _describe_snapshots_by_id(self, snapshot_ids: List[str]) -> Dict[str, Dict]:
+        """Current state of the given owned snapshots; IDs that no longer exist are absent"""
+        found = {}
+        paginator = self.ec2_client.get_paginator('describe_snapshots')
+        for start in range(0, len(snapshot_ids), VERIFY_CHUNK_SIZE):
+            chunk = snapshot_ids[start:start + VERIFY_CHUNK_SIZE]
+            for page in paginator.paginate(OwnerIds=[self.aws_account_id],
+                                           Filters=[{'Name': 'snapshot-id', 'Values': chunk}]):
+                for snapshot in page.get('Snapshots', []):
+                    found[snapshot['SnapshotId']] = snapshot
+        return found
+    
+    def _triage(self, planned: List[Dict], current: Dict, key: str,
+                fingerprint_of, reverify) -> Tuple[List[Dict], int, int]:
+        """
+        Compare planned items with their current state
+        
+        Unchanged items go straight through; only items whose fingerprint
+        changed are passed to reverify(item, current_state).
+        
+        Returns:
+            Tuple of (items still to delete, already gone count, skipped count)
+        """
+        ready, gone, skipped = [], 0, 0
+        for item in planned:
+            state = current.get(item[key])
+            if state is None:
+                gone += 1
+            elif item['fp'] == fingerprint_of(state):
+                ready.append(item)
+            elif reverify(item, state):
+                ready.append(item)
+            else:
+                print(f"   ↷ {item[key]} changed since planning and no longer qualifies - skipped")
+                skipped += 1
+        return ready, gone, skipped
+    
+    def _run_parallel(self, label: str, items: List[Dict], key: str, delete, workers: int) -> Tuple[Set[str], int]:
+        """Call delete(item) for each item on a worker pool; returns (succeeded keys, failure count)"""
+        succeeded, failed = set(), 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(delete, item): item for item in items}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    future.result()
+                    succeeded.add(item[key])
+                except (ClientError, BotoCoreError) as e:
+                    print(f"   ✗ {label} {item[key]} failed: {e}")
+                    failed += 1
+        return succeeded, failed
+    
+    @staticmethod
+    def _delete_ecr_batch(ecr_client, batch: Dict):
+        """
+        Delete one repository's digests with a single BatchDeleteImage call
+        
+        Per-digest results are recorded on the batch: 'deleted' and 'gone'
+        counts, and the remaining 'failures' entries of the response.
+        """
+        response = ecr_client.batch_delete_image(
+            repositoryName=batch['repository'],
+            imageIds=[{'imageDigest': digest} for digest in batch['digests']]
+        )
+        failures = response.get('failures', [])
+        batch['deleted'] = len(response.get('imageIds', []))
+        batch['gone'] = sum(1 for f in failures if f.get('failureCode') == 'ImageNotFound')
+        batch['failures'] = [f for f in failures if f.get('failureCode') != 'ImageNotFound']
+    
+    def apply_plan(self, plan: Dict, workers: int = 8, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Execute a plan written by build_plan, without prompting
+        
+        Planned items are re-read by ID in bulk. Items that are gone are
+        counted as done, unchanged items are deleted as planned, and only
+        items whose fingerprint changed are re-verified:
+        - AMIs must still be available (a disabled AMI is skipped, not counted as gone)
+        - Snapshots must be completed and not back any existing AMI
+        - ECR images must not have gained tags (a retag usually means a promotion)
+        
+        ECR indexes are deleted before the platform manifests they reference,
+        and a manifest whose index was not deleted is left alone.
+        
+        A launch does not change an AMI's fingerprint, so if the plan kept
+        recently launched AMIs, every planned AMI's last launch is fetched
+        again (bypassing the usage cache) and AMIs launched since are skipped.
+        
+        AMIs are deregistered before their snapshots are deleted; a snapshot
+        whose AMI was skipped or failed is left alone.
+        
+        Args:
+            plan: Plan dictionary from load_plan
+            workers: Number of parallel deletion workers
+            dry_run: If True, verify and report without deleting
+            
+        Returns:
+            Dictionary with deleted, gone, skipped and failed counts
+        """
+        print("\n" + "="*80)
+        print(f"APPLY PLAN {'(DRY RUN)' if dry_run else '(LIVE)'}")
+        print("="*80)
+        print(f"   Plan created: {plan['created_at']} (checksum {plan['checksum'][:12]})")
+        
+        totals = {'deleted': 0, 'gone': 0, 'skipped': 0, 'failed': 0}
+        keep_launched_days = plan['policy'].get('keep_launched_days')
+        # Shared by the worker threads, so size the connection pool to match
+        ec2_client = self._client('ec2', max_pool_connections=workers)
+        
+        # AMIs first, so the snapshots they hold are released
+        current = self._describe_amis_by_id([item['id'] for item in plan['amis']])
+        amis, gone, skipped = self._triage(
+            plan['amis'], current, 'id', lambda ami: ami.fingerprint, lambda item, ami: ami.state == 'available'
+        )
+        # A disabled (or otherwise unavailable) AMI still holds its snapshots
+        available = []
+        for item in amis:
+            if current[item['id']].state == 'available':
+                available.append(item)
+            else:
+                print(f"   ↷ {item['id']} is {current[item['id']].state} - skipped")
+                skipped += 1
+        amis = available
+        
+        if keep_launched_days is not None and amis:
+            print(f"\n🔎 Re-checking the last launch of {len(amis)} planned AMI(s)")
+            failed = self._fetch_usage([current[item['id']] for item in amis], {})
+            not_launched = []
+            for item in amis:
+                ami = current[item['id']]
+                if item['id'] in failed:
+                    print(f"   ↷ {item['id']} last launch unknown - skipped")
+                    skipped += 1
+                elif ami.launched_within(keep_launched_days):
+                    print(f"   ↷ {item['id']} launched since planning ({ami.last_launched}) - skipped")
+                    skipped += 1
+                else:
+                    not_launched.append(item)
+            amis = not_launched
+        totals['gone'] += gone
+        totals['skipped'] += skipped
+        print(f"\n🖼️  AMIs: {len(amis)} to deregister, {gone} already gone, {skipped} skipped")
+        
+        planned_amis = {item['id'] for item in plan['amis']}
+        if dry_run:
+            deregistered = {item['id'] for item in amis}
+        else:
+            deregistered, failed = self._run_parallel(
+                'AMI', amis, 'id', lambda item: ec2_client.deregister_image(ImageId=item['id']), workers
+            )
+            totals['deleted'] += len(deregistered)
+            totals['failed'] += failed
+        # AMIs that disappeared on their own no longer hold their snapshots either
+        cleared = deregistered | (planned_amis - set(current))
+        
+        # Snapshots, skipping any still held by an AMI that was not deregistered
+        def reverify_snapshot(item, snapshot):
+            if snapshot.get('State') != 'completed':
+                return False
+            response = self.ec2_client.describe_images(
+                Owners=[self.aws_account_id],
+                Filters=[{'Name': 'block-device-mapping.snapshot-id', 'Values': [item['id']]}]
+            )
+            return not response.get('Images')
+        
+        eligible = [item for item in plan['snapshots'] if item['ami_id'] not in planned_amis or item['ami_id'] in cleared]
+        held = len(plan['snapshots']) - len(eligible)
+        current = self._describe_snapshots_by_id([item['id'] for item in eligible])
+        snapshots, gone, skipped = self._triage(eligible, current, 'id', snapshot_fingerprint, reverify_snapshot)
+        totals['gone'] += gone
+        totals['skipped'] += skipped + held
+        print(f"\n💾 Snapshots: {len(snapshots)} to delete, {gone} already gone, {skipped + held} skipped"
+              f"{f' ({held} still backing an AMI)' if held else ''}")
+        
+        if not dry_run:
+            deleted, failed = self._run_parallel(
+                'Snapshot', snapshots, 'id', lambda item: ec2_client.delete_snapshot(SnapshotId=item['id']), workers
+            )
+            totals['deleted'] += len(deleted)
+            totals['failed'] += failed
+        
+        # ECR images, batched per repository
+        if plan['ecr_images']:
+            by_repository = {}
+            for item in plan['ecr_images']:
+                by_repository.setdefault(item['repository'], []).append(item)
+            
+            # Imported here so plans without ECR images don't pay for delete_ecr_images' logging setup
+            from delete_ecr_images import VERIFY_BATCH_SIZE, describe_digests
+            
+            ready_images = []
+            removed = set()  # (repository, digest) of images deleted or already gone
+            ecr_gone = ecr_skipped = 0
+            for repository, items in by_repository.items():
+                # Only the planned digests are described, VERIFY_BATCH_SIZE per call
+                digests = [item['digest'] for item in items]
+                current = {}
+                try:
+                    for start in range(0, len(digests), VERIFY_BATCH_SIZE):
+                        found, _ = describe_digests(self.ecr_client, repository, digests[start:start + VERIFY_BATCH_SIZE])
+                        current.update(
+                            (digest, ECRImage.from_api(repository, image)) for digest, image in found.items()
+                        )
+                except (ClientError, BotoCoreError) as e:
+                    # A deleted repository means its images are gone; anything else leaves them unverified
+                    repository_gone = (isinstance(e, ClientError) and
+                                       e.response.get('Error', {}).get('Code') == 'RepositoryNotFoundException')
+                    if not repository_gone:
+                        print(f"   ✗ Could not re-read {repository}: {e} - its {len(items)} image(s) skipped")
+                        totals['skipped'] += len(items)
+                        continue
+                ready, gone, skipped = self._triage(
+                    items, current, 'digest', lambda image: image.fingerprint, lambda item, image: not image.tags
+                )
+                ecr_gone += gone
+                ecr_skipped += skipped
+                ready_images.extend(ready)
+                removed.update((repository, item['digest']) for item in items if item['digest'] not in current)
+            totals['gone'] += ecr_gone
+            totals['skipped'] += ecr_skipped
+            print(f"\n📦 ECR images: {len(ready_images)} to delete, {ecr_gone} already gone, {ecr_skipped} skipped")
+            
+            # In waves: an image is deleted once no index still waiting references it,
+            # and only if every index that referenced it is gone
+            waiting = ready_images
+            while waiting:
+                unresolved = {(item['repository'], item['digest']) for item in waiting}
+                wave, later = [], []
+                for item in waiting:
+                    parents = [(item['repository'], parent) for parent in item.get('parents', ())]
+                    if any(parent in unresolved for parent in parents):
+                        later.append(item)
+                    elif all(parent in removed for parent in parents):
+                        wave.append(item)
+                    else:
+                        print(f"   ↷ {item['repository']}@{item['digest']} is still referenced by an index "
+                              f"that was not deleted - skipped")
+                        totals['skipped'] += 1
+                # Manifest references form no cycles, but a wave that resolves nothing must not loop forever
+                waiting = later if len(later) < len(unresolved) else []
+                
+                by_wave_repository = {}
+                for item in wave:
+                    by_wave_repository.setdefault(item['repository'], []).append(item['digest'])
+                batches = [
+                    {
+                        'id': f"{repository}[{start}:{min(start + ECR_DELETE_BATCH_SIZE, len(digests))}]",
+                        'repository': repository,
+                        'digests': digests[start:start + ECR_DELETE_BATCH_SIZE]
+                    }
+                    for repository, digests in by_wave_repository.items()
+                    for start in range(0, len(digests), ECR_DELETE_BATCH_SIZE)
+                ]
+                
+                if dry_run:
+                    removed.update((item['repository'], item['digest']) for item in wave)
+                    continue
+                
+                ecr_client = self._client('ecr', max_pool_connections=workers)
+                completed, _ = self._run_parallel(
+                    'ECR batch', batches, 'id', lambda batch: self._delete_ecr_batch(ecr_client, batch), workers
+                )
+                for batch in batches:
+                    if batch['id'] not in completed:
+                        # The whole call failed, so none of its digests were deleted
+                        totals['failed'] += len(batch['digests'])
+                        continue
+                    totals['deleted'] += batch['deleted']
+                    totals['gone'] += batch['gone']
+                    totals['failed'] += len(batch['failures'])
+                    failed_digests = {failure.get('imageId', {}).get('imageDigest') for failure in batch['failures']}
+                    removed.update(
+                        (batch['repository'], digest) for digest in batch['digests'] if digest not in failed_digests
+                    )
+                    for failure in batch['failures']:
+                        print(f"   ✗ ECR image {batch['repository']}@{failure.get('imageId', {}).get('imageDigest')} "
+                              f"failed: {failure.get('failureCode')} {failure.get('failureReason', '')}")
+        
+        print(f"\n📊 Apply Summary:")
+        if dry_run:
+            print(f"   ✓ Dry run complete - nothing was deleted")
+        else:
+            print(f"   Successfully deleted: {totals['deleted']}")
+        print(f"   Already gone: {totals['gone']}")
+        print(f"   Skipped: {totals['skipped']}")
+        print(f"   Failed: {totals['failed']}")
+        
+        return totals
 
 
 def main():
@@ -295,8 +1531,24 @@ Examples:
   # Delete old AMIs (live - keeps 5 most recent)
   python aws_resource_cleanup.py --aws-account-id 123456789012 --action delete-ami --keep 5
   
+  # Also keep any older AMI launched in the last 30 days
+  python aws_resource_cleanup.py --aws-account-id 123456789012 --action delete-ami --keep 5 --keep-launched-days 30 --dry-run
+  
   # Specify a different region
   python aws_resource_cleanup.py --aws-account-id 123456789012 --region us-west-2 --action list-ami
+  
+  # Report (and then delete) EBS snapshots orphaned by deregistered AMIs
+  python aws_resource_cleanup.py --aws-account-id 123456789012 --action sweep-snapshots --dry-run
+  python aws_resource_cleanup.py --aws-account-id 123456789012 --action sweep-snapshots --workers 16
+  
+  # Plan once (AMIs, their snapshots, orphaned snapshots, ECR images beyond 10 per repo)...
+  python aws_resource_cleanup.py --aws-account-id 123456789012 --action plan --keep 5 --ecr-keep 10 --plan-file plan.json
+  
+  # ...then apply it later without prompts (e.g. from a pipeline)
+  python aws_resource_cleanup.py --aws-account-id 123456789012 --action apply --plan-file plan.json --workers 16
+  
+  # ECR storage per repository, and what deleting the images in images.txt would reclaim
+  python aws_resource_cleanup.py --aws-account-id 123456789012 --action ecr-storage --arn-file images.txt --report-file storage.json
         '''
     )
     
@@ -315,7 +1567,7 @@ Examples:
     parser.add_argument(
         '--action',
         required=True,
-        choices=['list-ecr', 'list-ami', 'delete-ami'],
+        choices=['list-ecr', 'list-ami', 'delete-ami', 'sweep-snapshots', 'plan', 'apply', 'ecr-storage'],
         help='Action to perform'
     )
     
@@ -332,38 +1584,160 @@ Examples:
         help='Perform a dry run (simulate deletion without actually deleting)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Parallel deletion workers for sweep-snapshots and apply (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--keep-launched-days',
+        type=int,
+        default=None,
+        help='For delete-ami: also keep older AMIs launched within this many days'
+    )
+    
+    parser.add_argument(
+        '--usage-workers',
+        type=int,
+        default=16,
+        help='Concurrent lastLaunchedTime lookups (default: 16)'
+    )
+    
+    parser.add_argument(
+        '--usage-cache',
+        default=None,
+        help='Path of the AMI last-launched cache (default: ~/.cache/aws-cleanup/ami-usage-<account>-<region>.json)'
+    )
+    
+    parser.add_argument(
+        '--usage-cache-ttl-hours',
+        type=int,
+        default=24,
+        help='Hours a cached last-launched lookup stays valid (default: 24)'
+    )
+    
+    parser.add_argument(
+        '--plan-file',
+        default=DEFAULT_PLAN_FILE,
+        help=f'Deletion plan written by plan and read by apply (default: {DEFAULT_PLAN_FILE})'
+    )
+    
+    parser.add_argument(
+        '--ecr-keep',
+        type=int,
+        default=None,
+        help='For plan: most recent images to keep per ECR repository (default: ECR not planned)'
+    )
+    
+    parser.add_argument(
+        '--max-plan-age-hours',
+        type=float,
+        default=DEFAULT_MAX_PLAN_AGE_HOURS,
+        help=f'For apply: reject plans older than this (default: {DEFAULT_MAX_PLAN_AGE_HOURS})'
+    )
+    
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=20,
+        help='For ecr-storage: number of largest repositories and images to show (default: 20)'
+    )
+    
+    parser.add_argument(
+        '--arn-file',
+        default=None,
+        help='For ecr-storage: ECR image ARN file (delete_ecr_images format) to project reclaimed bytes for'
+    )
+    
+    parser.add_argument(
+        '--report-file',
+        default=None,
+        help='For ecr-storage: also write the report as JSON to this file'
+    )
+    
     args = parser.parse_args()
     
     # Validate keep count
-    if args.action == 'delete-ami' and args.keep < 0:
+    if args.action in ('delete-ami', 'plan') and args.keep < 0:
         print("Error: --keep must be a positive number")
         sys.exit(1)
     
-    # Initialize resource manager
-    manager = AWSResourceManager(args.aws_account_id, args.region)
+    if args.ecr_keep is not None and args.ecr_keep < 0:
+        print("Error: --ecr-keep must be a positive number")
+        sys.exit(1)
     
-    # Execute requested action
-    if args.action == 'list-ecr':
-        manager.list_ecr_images()
+    # A cached lookup older than the keep window says nothing about that window
+    if args.keep_launched_days is not None and args.usage_cache_ttl_hours > args.keep_launched_days * 24:
+        print("Error: --usage-cache-ttl-hours must not exceed --keep-launched-days (in hours)")
+        sys.exit(1)
     
-    elif args.action == 'list-ami':
-        manager.list_amis()
+    # Initialize resource manager
+    manager = AWSResourceManager(args.aws_account_id, args.region)
+    manager.usage_workers = max(args.usage_workers, 1)
+    manager.usage_cache_ttl_hours = args.usage_cache_ttl_hours
+    if args.usage_cache:
+        manager.usage_cache_path = args.usage_cache
     
-    elif args.action == 'delete-ami':
-        # Default to dry-run if not explicitly set to live mode
-        dry_run = args.dry_run if '--dry-run' in sys.argv or '--keep' in sys.argv else True
+    try:
+        # Execute requested action (AWS credentials are first needed here)
+        if args.action == 'list-ecr':
+            manager.list_ecr_images()
+        
+        elif args.action == 'list-ami':
+            manager.list_amis()
+        
+        elif args.action == 'delete-ami':
+            # Default to dry-run if not explicitly set to live mode
+            dry_run = args.dry_run if '--dry-run' in sys.argv or '--keep' in sys.argv else True
+            
+            # If user didn't specify --dry-run, ask for confirmation
+            if not args.dry_run and '--dry-run' not in sys.argv:
+                print("\n⚠️  WARNING: You are about to perform a LIVE deletion!")
+                print("   Use --dry-run flag to test without deleting.")
+                response = input("   Continue with LIVE deletion? (yes/no): ")
+                if response.lower() != 'yes':
+                    print("Operation cancelled.")
+                    sys.exit(0)
+                dry_run = False
+            
+            manager.delete_old_amis(
+                keep_count=args.keep, dry_run=dry_run, keep_launched_days=args.keep_launched_days
+            )
+        
+        elif args.action == 'sweep-snapshots':
+            manager.sweep_orphaned_snapshots(dry_run=args.dry_run, workers=max(args.workers, 1))
+        
+        elif args.action == 'plan':
+            plan = manager.build_plan(
+                keep_count=args.keep, keep_launched_days=args.keep_launched_days, ecr_keep=args.ecr_keep
+            )
+            manager.write_plan(plan, args.plan_file)
         
-        # If user didn't specify --dry-run, ask for confirmation
-        if not args.dry_run and '--dry-run' not in sys.argv:
-            print("\n⚠️  WARNING: You are about to perform a LIVE deletion!")
-            print("   Use --dry-run flag to test without deleting.")
-            response = input("   Continue with LIVE deletion? (yes/no): ")
-            if response.lower() != 'yes':
-                print("Operation cancelled.")
-                sys.exit(0)
-            dry_run = False
+        elif args.action == 'apply':
+            try:
+                plan = manager.load_plan(args.plan_file, max_age_hours=args.max_plan_age_hours)
+            except ValueError as e:
+                print(f"✗ Error: {e}")
+                sys.exit(1)
+            
+            totals = manager.apply_plan(plan, workers=max(args.workers, 1), dry_run=args.dry_run)
+            if totals['failed']:
+                print(f"\n✗ {totals['failed']} deletion(s) failed")
+                sys.exit(1)
         
-        manager.delete_old_amis(keep_count=args.keep, dry_run=dry_run)
+        elif args.action == 'ecr-storage':
+            try:
+                manager.ecr_storage_report(
+                    top_k=max(args.top, 1), arn_file=args.arn_file, report_file=args.report_file
+                )
+            except OSError as e:
+                print(f"✗ Error: {e}")
+                sys.exit(1)
+    except NoCredentialsError:
+        print("✗ Error: AWS credentials not found. Please configure AWS CLI.")
+        sys.exit(1)
     
     print("\n✓ Script completed successfully!")
 
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Inventory Memory Benchmark
+
+Measures peak memory of the ECR image and AMI inventories built by
+aws_resource_cleanup.py for synthetic accounts, comparing the previous
+representation (one dict per item, full API responses held alongside)
+with the compact ECRImage / AMIRecord records.
+
+No AWS access is needed - describe_images pages are generated locally.
+
+Usage:
+    python3 benchmark_inventory.py
+    python3 benchmark_inventory.py --images 1000000 --repositories 500 --amis 20000
+    python3 benchmark_inventory.py --json results.json
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from aws_resource_cleanup import AMIRecord, ECRImage
+
+
+PAGE_SIZE = 1000
+
+
+def ecr_pages(image_count, repository_count, seed):
+    """Yield (repository, describe_images page) pairs shaped like the ECR API"""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    per_repo = max(image_count // repository_count, 1)
+    produced = 0
+    for repo_index in range(repository_count):
+        # Build names at runtime, like API responses, so equal strings are distinct objects
+        repository = ''.join(['team-', str(repo_index % 20), '/service-', str(repo_index)])
+        count = min(per_repo, image_count - produced)
+        for offset in range(0, count, PAGE_SIZE):
+            page = []
+            for index in range(offset, min(offset + PAGE_SIZE, count)):
+                image = {
+                    'registryId': '111122223333',
+                    'repositoryName': repository[:],
+                    'imageDigest': f"sha256:{rng.getrandbits(256):064x}",
+                    'imageSizeInBytes': rng.randint(5, 900) * 1024 * 1024,
+                    'imagePushedAt': start + timedelta(minutes=produced + index),
+                    'imageManifestMediaType': 'application/vnd.docker.distribution.manifest.v2+json',
+                    'artifactMediaType': 'application/vnd.docker.container.image.v1+json',
+                }
+                if rng.random() < 0.7:
+                    image['imageTags'] = [''.join(['build-', str(index)]), ''.join(['lat', 'est'])]
+                page.append(image)
+            yield repository, {'imageDetails': page}
+        produced += count
+        if produced >= image_count:
+            return
+
+
+def ami_pages(ami_count, seed):
+    """Yield describe_images pages shaped like the EC2 API"""
+    rng = random.Random(seed)
+    for offset in range(0, ami_count, PAGE_SIZE):
+        page = []
+        for index in range(offset, min(offset + PAGE_SIZE, ami_count)):
+            page.append({
+                'ImageId': f"ami-{rng.getrandbits(68):017x}",
+                'Name': f"app-build-{index}",
+                'CreationDate': f"2024-{1 + index % 12:02d}-{1 + index % 28:02d}T10:00:00.000Z",
+                'State': ''.join(['avail', 'able']),
+                'Description': f"Build {index} of the application image",
+                'Architecture': ''.join(['x86', '_64']),
+                'BlockDeviceMappings': [{
+                    'DeviceName': '/dev/xvda',
+                    'Ebs': {'SnapshotId': f"snap-{rng.getrandbits(68):017x}", 'VolumeSize': 8},
+                }],
+                'Tags': [
+                    {'Key': ''.join(['Envi', 'ronment']), 'Value': 'prod'},
+                    {'Key': ''.join(['Own', 'er']), 'Value': 'platform'},
+                ],
+            })
+        yield {'Images': page}
+
+
+def legacy_ecr(pages):
+    """Previous list_ecr_images shape: responses kept, one dict per image"""
+    responses, images = [], []
+    for repository, page in pages:
+        responses.append(page)
+        for image in page['imageDetails']:
+            images.append({
+                'repository': repository,
+                'uri': f"111122223333.dkr.ecr.us-east-1.amazonaws.com/{repository}",
+                'tags': image.get('imageTags', ['<untagged>']),
+                'pushed_at': image.get('imagePushedAt', 'Unknown'),
+                'size_mb': image.get('imageSizeInBytes', 0) / (1024 * 1024),
+                'digest': image.get('imageDigest', 'Unknown'),
+            })
+    return responses, images
+
+
+def compact_ecr(pages):
+    return [
+        ECRImage.from_api(repository, image)
+        for repository, page in pages
+        for image in page['imageDetails']
+    ]
+
+
+def legacy_amis(pages):
+    """Previous list_amis shape: responses kept, one dict per AMI"""
+    responses, amis = [], []
+    for page in pages:
+        responses.append(page)
+        for ami in page['Images']:
+            amis.append({
+                'ami_id': ami.get('ImageId', 'Unknown'),
+                'name': ami.get('Name', '<no name>'),
+                'creation_date': ami.get('CreationDate', 'Unknown'),
+                'state': ami.get('State', 'Unknown'),
+                'description': ami.get('Description', '<no description>'),
+                'architecture': ami.get('Architecture', 'Unknown'),
+                'tags': {tag['Key']: tag['Value'] for tag in ami.get('Tags', [])},
+            })
+    return responses, amis
+
+
+def compact_amis(pages):
+    return [AMIRecord.from_api(ami) for page in pages for ami in page['Images']]
+
+
+def measure(label, build):
+    """Run build() under tracemalloc and report its peak allocation and wall time"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {
+        'case': label,
+        'peak_mib': round(peak / (1024 * 1024), 1),
+        'retained_mib': round(current / (1024 * 1024), 1),
+        'seconds': round(elapsed, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ECR/AMI inventory memory use')
+    parser.add_argument('--images', type=int, default=100000,
+                        help='Synthetic ECR images (default: 100000)')
+    parser.add_argument('--repositories', type=int, default=200,
+                        help='Synthetic ECR repositories (default: 200)')
+    parser.add_argument('--amis', type=int, default=20000,
+                        help='Synthetic AMIs (default: 20000)')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed (default: 7)')
+    parser.add_argument('--json', help='Write machine-readable results to this file')
+    args = parser.parse_args()
+
+    results = [
+        measure('ecr-legacy-dicts', lambda: legacy_ecr(ecr_pages(args.images, args.repositories, args.seed))),
+        measure('ecr-compact-records', lambda: compact_ecr(ecr_pages(args.images, args.repositories, args.seed))),
+        measure('ami-legacy-dicts', lambda: legacy_amis(ami_pages(args.amis, args.seed))),
+        measure('ami-compact-records', lambda: compact_amis(ami_pages(args.amis, args.seed))),
+    ]
+
+    print("=" * 80)
+    print(f"INVENTORY MEMORY BENCHMARK ({args.images} images / {args.repositories} repos, {args.amis} AMIs)")
+    print("=" * 80)
+    print(f"{'Case':<24} {'Peak MiB':>10} {'Retained MiB':>14} {'Seconds':>9}")
+    print("-" * 80)
+    for result in results:
+        print(f"{result['case']:<24} {result['peak_mib']:>10} {result['retained_mib']:>14} {result['seconds']:>9}")
+    print("=" * 80)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
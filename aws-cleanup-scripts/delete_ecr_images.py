@@ -11,6 +11,9 @@ Features:
 - Dry-run mode to preview deletions without performing them
 - Comprehensive error handling and logging
 - Multi-region support (automatically detects region from ARN)
+- Pre-flight verification of every target, writing a cleaned ARN file
+- Multi-arch awareness: deleting an image index also deletes its platform
+  manifests, and manifests still used by another index are protected
 
 ARN Format:
     arn:aws:ecr:<region>:<account-id>:repository/<repo-name>/sha256:<digest>
@@ -21,15 +24,30 @@ Usage:
     
     # Actual deletion
     python3 delete_ecr_images.py --file images.txt --profile myprofile
+    
+    # Verify targets and write a cleaned ARN file (no deletions)
+    python3 delete_ecr_images.py --file images.txt --profile myprofile --verify --output images.verified.txt
+    
+    # Resolve image indexes / manifest lists before deleting
+    python3 delete_ecr_images.py --file images.txt --profile myprofile --resolve-manifests --dry-run
 """
 
 import argparse
-import boto3
+import json
 import re
 import sys
+import threading
+import time
 import logging
-from typing import Tuple, Optional
-from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple, Optional
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError, ProfileNotFound
+
+# boto3 and botocore.config are imported where a session or client is first
+# created; importing them costs a few hundred milliseconds at startup
+if TYPE_CHECKING:
+    import boto3
 
 
 # Configure logging
@@ -40,6 +58,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Image IDs accepted per ECR DescribeImages call
+VERIFY_BATCH_SIZE = 100
+
+# Entries listed per category in the verification report
+REPORT_SAMPLE_SIZE = 20
+
+# Image IDs accepted per ECR BatchGetImage call
+MANIFEST_BATCH_SIZE = 100
+
+# Manifests that reference other manifests (multi-arch images)
+INDEX_MEDIA_TYPES = (
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+    "application/vnd.oci.image.index.v1+json",
+)
+
+
+def log_sample(log, lines: List[str]):
+    """Log the first REPORT_SAMPLE_SIZE lines and a count of the rest"""
+    for line in lines[:REPORT_SAMPLE_SIZE]:
+        log(f"   {line}")
+    if len(lines) > REPORT_SAMPLE_SIZE:
+        log(f"   ... and {len(lines) - REPORT_SAMPLE_SIZE} more")
+
+
+# ECR clients by (session, region, pool size), shared across calls and threads
+_ecr_clients: Dict[Tuple[int, str, Optional[int]], object] = {}
+_ecr_clients_lock = threading.Lock()
+
+
+def get_ecr_client(session: "boto3.Session", region: str, max_pool_connections: Optional[int] = None):
+    """
+    Return the ECR client for a region, creating it on first use.
+    
+    Creating a client costs tens of milliseconds, so one client per region
+    is reused for every ARN instead of building a new one per deletion.
+    
+    Args:
+        session: Boto3 session with AWS credentials
+        region: AWS region
+        max_pool_connections: Size the connection pool (and enable adaptive
+            retries) for a client shared by that many worker threads
+    
+    Returns:
+        boto3 ECR client
+    """
+    key = (id(session), region, max_pool_connections)
+    client = _ecr_clients.get(key)
+    if client is None:
+        # Session.client() is not thread-safe, so creation is serialized
+        with _ecr_clients_lock:
+            client = _ecr_clients.get(key)
+            if client is None:
+                config = None
+                if max_pool_connections:
+                    from botocore.config import Config
+                    config = Config(max_pool_connections=max_pool_connections, retries={"mode": "adaptive"})
+                client = _ecr_clients[key] = session.client("ecr", region_name=region, config=config)
+    return client
+
 
 def parse_arn(arn: str) -> Tuple[str, str, str]:
     """
@@ -107,7 +184,7 @@ def load_arns_from_file(file_path: str) -> list:
 
 
 def delete_ecr_image(
-    session: boto3.Session,
+    session: "boto3.Session",
     region: str,
     repository: str,
     digest: str,
@@ -127,8 +204,6 @@ def delete_ecr_image(
         True if deletion was successful (or would be in dry-run), False otherwise
     """
     try:
-        ecr_client = session.client("ecr", region_name=region)
-        
         if dry_run:
             logger.info(
                 f"[DRY-RUN] Would delete image from repository '{repository}' "
@@ -136,6 +211,8 @@ def delete_ecr_image(
             )
             return True
         
+        ecr_client = get_ecr_client(session, region)
+        
         logger.info(
             f"Deleting image from repository '{repository}' "
             f"in region '{region}' with digest '{digest}'..."
@@ -182,6 +259,409 @@ def delete_ecr_image(
         return False
 
 
+def describe_digests(ecr_client, repository: str, digests: List[str]) -> Tuple[Dict[str, Dict], Set[str]]:
+    """
+    Look up a batch of digests in one repository.
+    
+    DescribeImages rejects the whole batch with ImageNotFoundException if any
+    digest is missing, so a rejected batch is split in half until the
+    missing digests are isolated. With few missing images this costs a
+    handful of extra calls rather than one call per digest.
+    
+    Args:
+        ecr_client: ECR client for the repository's region
+        repository: Name of the ECR repository
+        digests: Up to VERIFY_BATCH_SIZE image digests
+    
+    Returns:
+        Tuple of ({digest: imageDetails entry} for images found, set of missing digests)
+    
+    Raises:
+        ClientError: For errors other than a missing image (including a missing repository)
+    """
+    try:
+        response = ecr_client.describe_images(
+            repositoryName=repository,
+            imageIds=[{"imageDigest": digest} for digest in digests]
+        )
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'ImageNotFoundException':
+            raise
+        if len(digests) == 1:
+            return {}, set(digests)
+        middle = len(digests) // 2
+        found_left, missing_left = describe_digests(ecr_client, repository, digests[:middle])
+        found_right, missing_right = describe_digests(ecr_client, repository, digests[middle:])
+        return {**found_left, **found_right}, missing_left | missing_right
+    
+    found = {image["imageDigest"]: image for image in response.get("imageDetails", [])}
+    return found, set(digests) - set(found)
+
+
+@dataclass
+class ManifestGraph:
+    """Parent/child manifest references within one repository"""
+    tags: Dict[str, List[str]] = field(default_factory=dict)
+    children: Dict[str, Set[str]] = field(default_factory=dict)
+    parents: Dict[str, Set[str]] = field(default_factory=dict)
+
+
+def build_manifest_graph(ecr_client, repository: str, images: Optional[List[Dict]] = None) -> ManifestGraph:
+    """
+    Build the manifest reference graph of one repository.
+    
+    Every image is listed once to learn its tags and media type; only image
+    indexes / manifest lists are then fetched with BatchGetImage, in batches
+    of 100, since they are the only manifests that reference other manifests.
+    
+    Args:
+        ecr_client: ECR client for the repository's region
+        repository: Name of the ECR repository
+        images: The repository's imageDetails entries, if the caller already
+            listed them (listed here otherwise)
+    
+    Returns:
+        ManifestGraph for the repository
+    
+    Raises:
+        ClientError: If the repository cannot be read
+    """
+    graph = ManifestGraph()
+    indexes = []
+    
+    if images is None:
+        paginator = ecr_client.get_paginator("describe_images")
+        images = (
+            image
+            for page in paginator.paginate(repositoryName=repository)
+            for image in page.get("imageDetails", [])
+        )
+    for image in images:
+        digest = image["imageDigest"]
+        graph.tags[digest] = image.get("imageTags", [])
+        if image.get("imageManifestMediaType") in INDEX_MEDIA_TYPES:
+            indexes.append(digest)
+    
+    for start in range(0, len(indexes), MANIFEST_BATCH_SIZE):
+        response = ecr_client.batch_get_image(
+            repositoryName=repository,
+            imageIds=[{"imageDigest": digest} for digest in indexes[start:start + MANIFEST_BATCH_SIZE]],
+            acceptedMediaTypes=list(INDEX_MEDIA_TYPES)
+        )
+        for failure in response.get("failures", []):
+            logger.warning(
+                f"Could not fetch manifest {failure.get('imageId', {}).get('imageDigest')} "
+                f"in '{repository}': {failure.get('failureReason', 'Unknown reason')}"
+            )
+        for image in response.get("images", []):
+            parent = image["imageId"]["imageDigest"]
+            children = {
+                entry["digest"]
+                for entry in json.loads(image["imageManifest"]).get("manifests", [])
+            }
+            graph.children[parent] = children
+            for child in children:
+                graph.parents.setdefault(child, set()).add(parent)
+    
+    return graph
+
+
+def plan_manifest_deletions(graph: ManifestGraph, targets: Set[str]) -> Tuple[Set[str], Dict[str, str], Dict[str, Set[str]]]:
+    """
+    Expand and block a repository's deletion targets using its manifest graph.
+    
+    Repeated until nothing changes:
+    - A digest with a parent index that is not being deleted is blocked,
+      since deleting it would break that index
+    - An untagged child of an index being deleted is added once all of
+      its parents are being deleted, so no platform manifests are left behind
+    
+    Args:
+        graph: Manifest graph of the repository
+        targets: Digests requested for deletion
+    
+    Returns:
+        Tuple of (digests to delete, {added child: parent index},
+        {blocked target: parent indexes that still use it})
+    """
+    deleting = {digest for digest in targets if digest in graph.tags}
+    added: Dict[str, str] = {}
+    changed = True
+    while changed:
+        changed = False
+        for digest in list(deleting):
+            if graph.parents.get(digest, set()) - deleting:
+                deleting.discard(digest)
+                changed = True
+        for parent in list(deleting):
+            for child in graph.children.get(parent, ()):
+                if (child not in deleting and child in graph.tags and not graph.tags[child]
+                        and graph.parents[child] <= deleting):
+                    deleting.add(child)
+                    added.setdefault(child, parent)
+                    changed = True
+    
+    added = {child: parent for child, parent in added.items() if child in deleting}
+    blocked = {
+        digest: graph.parents.get(digest, set()) - deleting
+        for digest in targets
+        if digest in graph.tags and digest not in deleting
+    }
+    return deleting, added, blocked
+
+
+def resolve_manifests(session: "boto3.Session", arns: List[str], workers: int = 8) -> List[str]:
+    """
+    Expand or block ECR deletion targets across image indexes.
+    
+    Each repository named in the ARNs gets a manifest graph (built in
+    parallel across repositories). Untagged platform manifests of deleted
+    indexes are added, and targets still referenced by a surviving index
+    are removed. The result lists every index before the manifests it
+    references, so an interrupted run never leaves an index pointing at
+    deleted children.
+    
+    Args:
+        session: Boto3 session with AWS credentials
+        arns: ARNs loaded from the input file
+        workers: Number of repositories resolved in parallel
+    
+    Returns:
+        Resolved list of ARNs. Invalid ARNs and repositories that cannot be
+        read are passed through unchanged, so later steps report them
+    """
+    groups: Dict[Tuple[str, str], Dict[str, str]] = {}
+    passthrough = []
+    for arn in arns:
+        try:
+            region, repository, digest = parse_arn(arn)
+        except ValueError:
+            passthrough.append(arn)
+            continue
+        groups.setdefault((region, repository), {}).setdefault(digest, arn)
+    
+    clients = {
+        region: get_ecr_client(session, region, max_pool_connections=workers)
+        for region in {region for region, _ in groups}
+    }
+    
+    logger.info(f"Resolving manifest references in {len(groups)} repository(ies)...")
+    graphs: Dict[Tuple[str, str], ManifestGraph] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(build_manifest_graph, clients[region], repository): (region, repository)
+            for region, repository in groups
+        }
+        for future in as_completed(futures):
+            region, repository = futures[future]
+            try:
+                graphs[(region, repository)] = future.result()
+            except (ClientError, BotoCoreError, ValueError, KeyError) as e:
+                # Unreadable repository or malformed manifest body (JSONDecodeError is
+                # a ValueError): keep this repository's targets as given
+                logger.warning(f"Could not resolve '{repository}' in '{region}': {e!r} - targets kept unchanged")
+    
+    resolved = []
+    total_added = 0
+    total_blocked = 0
+    for key, targets in groups.items():
+        graph = graphs.get(key)
+        if graph is None:
+            resolved.extend(targets.values())
+            continue
+        
+        region, repository = key
+        deleting, added, blocked = plan_manifest_deletions(graph, set(targets))
+        total_added += len(added)
+        total_blocked += len(blocked)
+        
+        for child, parent in sorted(added.items()):
+            logger.info(f"➕ {repository}: {child} (platform manifest of {parent[:19]}...)")
+        for digest, parents in sorted(blocked.items()):
+            users = ", ".join(
+                f"{parent[:19]}... [{','.join(graph.tags.get(parent) or ['untagged'])}]" for parent in sorted(parents)
+            )
+            logger.warning(f"⛔ {repository}: {digest} is still referenced by {users} - skipped")
+        
+        # Parents before children (by reference depth); added children get
+        # ARNs derived from the repository's ARNs
+        depth: Dict[str, int] = {}
+        
+        def reference_depth(digest: str) -> int:
+            if digest not in depth:
+                parents = graph.parents.get(digest, set()) & deleting
+                depth[digest] = 1 + max(map(reference_depth, parents)) if parents else 0
+            return depth[digest]
+        
+        prefix = next(iter(targets.values())).rsplit("/", 1)[0]
+        ordered = sorted(deleting, key=lambda digest: (reference_depth(digest), digest not in targets))
+        resolved.extend(targets.get(digest, f"{prefix}/{digest}") for digest in ordered)
+        
+        # Targets not in the repository are kept so verification/deletion reports them
+        resolved.extend(arn for digest, arn in targets.items() if digest not in graph.tags)
+    
+    logger.info(
+        f"Manifest resolution: {total_added} platform manifest(s) added, "
+        f"{total_blocked} target(s) blocked, {len(resolved)} ARN(s) to process"
+    )
+    return resolved + passthrough
+
+
+def verify_targets(
+    session: "boto3.Session",
+    arns: List[str],
+    output_file: str,
+    workers: int = 8,
+    include_tagged: bool = False,
+    resolve: bool = False
+) -> int:
+    """
+    Check every ARN before a live run and write a cleaned ARN file.
+    
+    Targets are grouped by region and repository and checked with
+    DescribeImages in batches of 100, with batches running in parallel.
+    Missing images, missing repositories, images that still carry tags,
+    duplicates and invalid ARNs are reported; the remaining ARNs are written
+    to output_file in their original order.
+    
+    With resolve, manifest references are resolved on the verified targets
+    (see resolve_manifests) rather than on the input, so a platform manifest
+    whose index was dropped here is blocked along with it instead of being
+    left in the file. The file is then written in resolved order.
+    
+    Args:
+        session: Boto3 session with AWS credentials
+        arns: ARNs loaded from the input file
+        output_file: Path to write the cleaned ARN file
+        workers: Number of batches verified in parallel
+        include_tagged: Keep images that still have tags in the cleaned file
+        resolve: Resolve manifest references on the verified targets
+    
+    Returns:
+        Number of ARNs dropped from the cleaned file
+    """
+    started = time.monotonic()
+    
+    # Group targets by (region, repository), keeping the first ARN for each image
+    groups: Dict[Tuple[str, str], List[str]] = {}
+    arn_for: Dict[Tuple[str, str, str], str] = {}
+    invalid = []
+    duplicates = 0
+    for arn in arns:
+        try:
+            region, repository, digest = parse_arn(arn)
+        except ValueError:
+            invalid.append(arn)
+            continue
+        key = (region, repository, digest)
+        if key in arn_for:
+            duplicates += 1
+            continue
+        arn_for[key] = arn
+        groups.setdefault((region, repository), []).append(digest)
+    
+    # One client per region, with a connection pool sized for the workers
+    clients = {
+        region: get_ecr_client(session, region, max_pool_connections=workers)
+        for region in {region for region, _ in groups}
+    }
+    
+    batches = [
+        (region, repository, digests[start:start + VERIFY_BATCH_SIZE])
+        for (region, repository), digests in groups.items()
+        for start in range(0, len(digests), VERIFY_BATCH_SIZE)
+    ]
+    logger.info(
+        f"Verifying {len(arn_for)} image(s) in {len(groups)} repository(ies) "
+        f"with {len(batches)} batch(es) on {workers} worker(s)..."
+    )
+    
+    found: Dict[Tuple[str, str, str], List[str]] = {}
+    missing_images = []
+    missing_repositories = set()
+    errors = []
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(describe_digests, clients[region], repository, digests): (region, repository, digests)
+            for region, repository, digests in batches
+        }
+        for future in as_completed(futures):
+            region, repository, digests = futures[future]
+            try:
+                batch_found, batch_missing = future.result()
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                if error_code == 'RepositoryNotFoundException':
+                    missing_repositories.add((region, repository))
+                else:
+                    errors.extend((region, repository, digest, error_code) for digest in digests)
+                continue
+            except BotoCoreError as e:
+                # Network errors and timeouts only lose this batch
+                errors.extend((region, repository, digest, type(e).__name__) for digest in digests)
+                continue
+            for digest, image in batch_found.items():
+                found[(region, repository, digest)] = image.get("imageTags", [])
+            missing_images.extend((region, repository, digest) for digest in batch_missing)
+    
+    tagged = {key: tags for key, tags in found.items() if tags}
+    keep = {key for key in found if include_tagged or key not in tagged}
+    
+    # Write the cleaned file in the input's order
+    cleaned = [arn for key, arn in arn_for.items() if key in keep]
+    if resolve and cleaned:
+        cleaned = resolve_manifests(session, cleaned, workers=workers)
+    with open(output_file, "w") as f:
+        for arn in cleaned:
+            f.write(f"{arn}\n")
+    
+    missing_repo_images = sum(
+        len(groups[repository_key]) for repository_key in missing_repositories
+    )
+    # Platform manifests added by resolution are not input ARNs, so count
+    # which input ARNs made it into the file
+    requested = set(arns)
+    dropped = len(arns) - sum(1 for arn in cleaned if arn in requested)
+    elapsed = time.monotonic() - started
+    
+    print()
+    print("=" * 80)
+    print("Verification Report")
+    print("=" * 80)
+    logger.info(f"ARNs checked: {len(arns)} in {elapsed:.1f}s")
+    logger.info(f"✅ Present: {len(found)}")
+    if missing_images:
+        logger.warning(f"❌ Image not found: {len(missing_images)}")
+        log_sample(logger.warning, [" ".join(key) for key in sorted(missing_images)])
+    if missing_repositories:
+        logger.warning(
+            f"❌ Repository not found: {len(missing_repositories)} ({missing_repo_images} image(s))"
+        )
+        log_sample(logger.warning, [" ".join(key) for key in sorted(missing_repositories)])
+    if tagged:
+        action = "kept (--include-tagged)" if include_tagged else "dropped"
+        logger.warning(f"⚠️  Still tagged: {len(tagged)} - {action}")
+        log_sample(logger.warning, [
+            f"{' '.join(key)} tags={','.join(tags)}" for key, tags in sorted(tagged.items())
+        ])
+    if errors:
+        logger.error(f"❌ Could not verify: {len(errors)}")
+        log_sample(logger.error, [
+            f"{region} {repository} {digest} ({error_code})" for region, repository, digest, error_code in sorted(errors)
+        ])
+    if duplicates:
+        logger.warning(f"⚠️  Duplicate ARNs: {duplicates}")
+    if invalid:
+        logger.warning(f"❌ Invalid ARNs: {len(invalid)}")
+        log_sample(logger.warning, invalid)
+    print("=" * 80)
+    logger.info(f"Cleaned ARN file: {output_file} ({len(cleaned)} ARN(s), {dropped} dropped)")
+    print("=" * 80)
+    
+    return dropped
+
+
 def main():
     """Main entry point for the script"""
     parser = argparse.ArgumentParser(
@@ -197,6 +677,13 @@ Examples:
   
   # Using default AWS profile
   python3 delete_ecr_images.py --file images.txt --profile default
+  
+  # Skip the STS identity round trip (e.g. when invoked many times from a job)
+  python3 delete_ecr_images.py --file images.txt --profile default --skip-identity-check
+  
+  # Verify every target first, then delete from the cleaned file
+  python3 delete_ecr_images.py --file images.txt --profile myprofile --verify --output images.verified.txt
+  python3 delete_ecr_images.py --file images.verified.txt --profile myprofile
 
 ARN Format:
   arn:aws:ecr:<region>:<account-id>:repository/<repo-name>/sha256:<digest>
@@ -208,7 +695,7 @@ Notes:
   - Lines starting with '#' in the input file are treated as comments
   - Empty lines are ignored
   - The script automatically detects the region from each ARN
-  - Requires appropriate ECR permissions (ecr:BatchDeleteImage)
+  - Requires appropriate ECR permissions (ecr:BatchDeleteImage, plus ecr:DescribeImages for --verify)
         """
     )
     
@@ -230,27 +717,81 @@ Notes:
         help="Preview deletions without performing them (recommended for first run)"
     )
     
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check every target with batched DescribeImages calls and write a cleaned ARN file (no deletions)"
+    )
+    
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Cleaned ARN file written by --verify (default: <file>.verified)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Batches verified (or repositories resolved) in parallel (default: 8)"
+    )
+    
+    parser.add_argument(
+        "--skip-identity-check",
+        action="store_true",
+        help="Skip the STS GetCallerIdentity credential check at startup"
+    )
+    
+    parser.add_argument(
+        "--resolve-manifests",
+        action="store_true",
+        help="Expand deleted image indexes to their platform manifests and protect manifests still used by an index"
+    )
+    
+    parser.add_argument(
+        "--include-tagged",
+        action="store_true",
+        help="With --verify, keep images that still have tags in the cleaned file"
+    )
+    
     args = parser.parse_args()
     
     # Print header
     print("=" * 80)
     print("ECR Image Deletion Script")
     print("=" * 80)
-    print(f"Mode: {'DRY-RUN (no deletions will be performed)' if args.dry_run else 'LIVE (images will be deleted)'}")
+    if args.verify:
+        print("Mode: VERIFY (no deletions will be performed)")
+    else:
+        print(f"Mode: {'DRY-RUN (no deletions will be performed)' if args.dry_run else 'LIVE (images will be deleted)'}")
     print(f"Profile: {args.profile}")
     print(f"Input file: {args.file}")
     print("=" * 80)
     print()
     
+    # Load ARNs from file first, so a bad or empty file fails before any AWS work
+    try:
+        arns = load_arns_from_file(args.file)
+    except (FileNotFoundError, IOError):
+        sys.exit(1)
+    
+    if not arns:
+        logger.warning("No ARNs to process. Exiting.")
+        sys.exit(0)
+    
     # Load AWS session with the given profile
     try:
+        import boto3
         session = boto3.Session(profile_name=args.profile)
-        # Verify credentials by getting caller identity
-        sts = session.client('sts')
-        identity = sts.get_caller_identity()
-        logger.info(f"✅ AWS profile '{args.profile}' loaded successfully")
-        logger.info(f"   Account: {identity.get('Account')}")
-        logger.info(f"   User/Role: {identity.get('Arn')}")
+        if args.skip_identity_check:
+            logger.info(f"✅ AWS profile '{args.profile}' loaded (identity check skipped)")
+        else:
+            # Verify credentials by getting caller identity
+            sts = session.client('sts')
+            identity = sts.get_caller_identity()
+            logger.info(f"✅ AWS profile '{args.profile}' loaded successfully")
+            logger.info(f"   Account: {identity.get('Account')}")
+            logger.info(f"   User/Role: {identity.get('Arn')}")
     except ProfileNotFound:
         logger.error(f"❌ AWS profile '{args.profile}' not found")
         logger.error("   Available profiles can be listed with: aws configure list-profiles")
@@ -263,15 +804,22 @@ Notes:
         logger.error(f"❌ Failed to load AWS profile '{args.profile}': {e}")
         sys.exit(1)
     
-    # Load ARNs from file
-    try:
-        arns = load_arns_from_file(args.file)
-    except (FileNotFoundError, IOError):
-        sys.exit(1)
+    # With --verify, manifests are resolved on the verified targets instead
+    if args.resolve_manifests and not args.verify:
+        arns = resolve_manifests(session, arns, workers=max(args.workers, 1))
     
-    if not arns:
-        logger.warning("No ARNs to process. Exiting.")
-        sys.exit(0)
+    if args.verify:
+        output_file = args.output or f"{args.file}.verified"
+        try:
+            dropped = verify_targets(
+                session, arns, output_file,
+                workers=max(args.workers, 1), include_tagged=args.include_tagged,
+                resolve=args.resolve_manifests
+            )
+        except IOError as e:
+            logger.error(f"❌ Error writing {output_file}: {e}")
+            sys.exit(1)
+        sys.exit(0 if dropped == 0 else 1)
     
     # Process each ARN
     print()
@@ -11,6 +11,7 @@
 # - Dry-run mode to preview deletions without performing them
 # - Color-coded output for better readability
 # - Input validation and error handling
+# - Batched mode: up to 100 digests per CLI call, repositories in parallel
 #
 # ARN Format:
 #   arn:aws:ecr:<region>:<account-id>:repository/<repo-name>/sha256:<digest>
@@ -22,6 +23,9 @@
 #   # Actual deletion
 #   ./delete_ecr_images.sh --file images.txt --profile myprofile
 #
+#   # Batched deletion (large files)
+#   ./delete_ecr_images.sh --file images.txt --profile myprofile --batch --parallel 8
+#
 # Requirements:
 #   - AWS CLI installed and configured
 #   - Bash 4.0 or higher
@@ -38,6 +42,11 @@ set -o pipefail  # Exit on pipe failures
 PROFILE=""
 FILE=""
 DRY_RUN=false
+BATCH=false
+PARALLEL=4
+
+# batch-delete-image accepts at most 100 image IDs per call
+BATCH_SIZE=100
 
 # Color codes for output
 RED='\033[0;31m'
@@ -80,7 +89,7 @@ print_dry_run() {
 # Print usage information
 usage() {
     cat << EOF
-Usage: $0 --file <file> --profile <profile> [--dry-run]
+Usage: $0 --file <file> --profile <profile> [--dry-run] [--batch [--parallel <n>]]
 
 Delete ECR images from a list of ARNs.
 
@@ -90,6 +99,10 @@ Required Arguments:
 
 Optional Arguments:
   --dry-run           Preview deletions without performing them (recommended)
+  --batch             Group ARNs by region and repository and delete up to
+                      ${BATCH_SIZE} digests per AWS CLI call
+  --parallel <n>      Repository groups processed concurrently in batch mode
+                      (default: ${PARALLEL})
   --help, -h          Show this help message
 
 Examples:
@@ -99,6 +112,9 @@ Examples:
   # Actual deletion
   $0 --file images.txt --profile myprofile
 
+  # Batched deletion for large ARN files
+  $0 --file images.txt --profile myprofile --batch --parallel 8
+
 ARN Format:
   arn:aws:ecr:<region>:<account-id>:repository/<repo-name>/sha256:<digest>
 
@@ -226,6 +242,149 @@ delete_image() {
     fi
 }
 
+# Delete one chunk of digests from a repository with a single CLI call
+# Sets CHUNK_SUCCEEDED and CHUNK_FAILED for the caller
+delete_chunk() {
+    local repo=$1
+    local region=$2
+    local profile=$3
+    shift 3
+    local digests=("$@")
+    local label="${region}/${repo}"
+    
+    local image_ids=()
+    local digest
+    for digest in "${digests[@]}"; do
+        image_ids+=("imageDigest=${digest}")
+    done
+    
+    # Ask only for the failures: one "<digest> <code> <reason>" line each
+    local output
+    if ! output=$(aws ecr batch-delete-image \
+        --repository-name "${repo}" \
+        --image-ids "${image_ids[@]}" \
+        --region "${region}" \
+        --profile "${profile}" \
+        --query 'failures[].[imageId.imageDigest, failureCode, failureReason]' \
+        --output text 2>&1); then
+        print_error "[${label}] Batch of ${#digests[@]} image(s) failed"
+        echo "${output}" >&2
+        CHUNK_SUCCEEDED=0
+        CHUNK_FAILED=${#digests[@]}
+        return 1
+    fi
+    
+    local failed=0
+    if [[ -n "${output}" && "${output}" != "None" ]]; then
+        while IFS=$'\t' read -r failed_digest failure_code failure_reason; do
+            [[ -z "${failed_digest}" ]] && continue
+            print_error "[${label}] ${failed_digest}: ${failure_code} ${failure_reason}"
+            ((failed++))
+        done <<< "${output}"
+    fi
+    
+    CHUNK_SUCCEEDED=$(( ${#digests[@]} - failed ))
+    CHUNK_FAILED=${failed}
+    print_success "[${label}] Deleted ${CHUNK_SUCCEEDED}/${#digests[@]} image(s) in one call"
+}
+
+# Process every digest of one region/repository group in chunks of BATCH_SIZE
+# Writes "<succeeded> <failed>" to the result file
+process_group() {
+    local group_file=$1
+    local result_file=$2
+    local profile=$3
+    local dry_run=$4
+    
+    local region repo
+    IFS='|' read -r region repo < "${group_file}"
+    local digests=()
+    mapfile -t digests < <(tail -n +2 "${group_file}")
+    
+    local succeeded=0
+    local failed=0
+    local start
+    for (( start = 0; start < ${#digests[@]}; start += BATCH_SIZE )); do
+        local chunk=("${digests[@]:start:BATCH_SIZE}")
+        
+        if ${dry_run}; then
+            print_dry_run "[${region}/${repo}] Would delete ${#chunk[@]} image(s) in one call"
+            ((succeeded += ${#chunk[@]}))
+            continue
+        fi
+        
+        delete_chunk "${repo}" "${region}" "${profile}" "${chunk[@]}"
+        ((succeeded += CHUNK_SUCCEEDED))
+        ((failed += CHUNK_FAILED))
+    done
+    
+    echo "${succeeded} ${failed}" > "${result_file}"
+}
+
+# Batched mode: group ARNs by region and repository, then delete each group
+# in chunks of up to BATCH_SIZE digests with PARALLEL groups at a time
+run_batched() {
+    local work_dir
+    work_dir=$(mktemp -d)
+    trap 'rm -rf "${work_dir}"' EXIT
+    
+    declare -A group_files
+    local group_count=0
+    local line parsed region repo digest key
+    
+    while IFS= read -r line || [[ -n "${line}" ]]; do
+        # Skip empty lines and comments
+        if [[ -z "${line}" || "${line}" =~ ^[[:space:]]*# ]]; then
+            continue
+        fi
+        
+        ((TOTAL_COUNT++))
+        
+        if parsed=$(parse_arn "${line}"); then
+            IFS='|' read -r region repo digest <<< "${parsed}"
+            key="${region}|${repo}"
+            if [[ -z "${group_files[${key}]}" ]]; then
+                ((group_count++))
+                group_files[${key}]="${work_dir}/group-${group_count}"
+                echo "${key}" > "${group_files[${key}]}"
+            fi
+            echo "${digest}" >> "${group_files[${key}]}"
+        else
+            print_error "Invalid ARN format: ${line}"
+            ((FAILURE_COUNT++))
+        fi
+    done < "${FILE}"
+    
+    print_info "Grouped $((TOTAL_COUNT - FAILURE_COUNT)) ARN(s) into ${group_count} repository group(s)"
+    print_info "Processing up to ${PARALLEL} group(s) in parallel, ${BATCH_SIZE} digests per call"
+    echo ""
+    
+    local group_file
+    for group_file in "${group_files[@]}"; do
+        # Throttle to PARALLEL concurrent groups
+        while (( $(jobs -rp | wc -l) >= PARALLEL )); do
+            wait -n 2>/dev/null || sleep 0.2
+        done
+        process_group "${group_file}" "${group_file}.result" "${PROFILE}" ${DRY_RUN} &
+    done
+    wait
+    
+    local result_file succeeded failed
+    for group_file in "${group_files[@]}"; do
+        result_file="${group_file}.result"
+        if [[ -f "${result_file}" ]]; then
+            read -r succeeded failed < "${result_file}"
+        else
+            # The worker died before reporting; count the whole group as failed
+            succeeded=0
+            failed=$(( $(wc -l < "${group_file}") - 1 ))
+        fi
+        ((SUCCESS_COUNT += succeeded))
+        ((FAILURE_COUNT += failed))
+    done
+    echo ""
+}
+
 # ============================================================================
 # Main Script
 # ============================================================================
@@ -245,6 +404,14 @@ while [[ $# -gt 0 ]]; do
             DRY_RUN=true
             shift
             ;;
+        --batch)
+            BATCH=true
+            shift
+            ;;
+        --parallel)
+            PARALLEL="$2"
+            shift 2
+            ;;
         --help|-h)
             usage
             ;;
@@ -269,6 +436,11 @@ if [[ -z "${PROFILE}" ]]; then
     usage
 fi
 
+if ! [[ "${PARALLEL}" =~ ^[1-9][0-9]*$ ]]; then
+    print_error "--parallel must be a positive integer"
+    exit 1
+fi
+
 # Print header
 echo "================================================================================"
 echo "ECR Image Deletion Script"
@@ -280,6 +452,9 @@ else
 fi
 echo "Profile: ${PROFILE}"
 echo "Input file: ${FILE}"
+if ${BATCH}; then
+    echo "Batch mode: ${BATCH_SIZE} digests per call, ${PARALLEL} parallel group(s)"
+fi
 echo "================================================================================"
 echo ""
 
@@ -292,8 +467,12 @@ echo ""
 print_info "Processing ARNs from file..."
 echo ""
 
-# Process each line in the file
-while IFS= read -r line || [[ -n "${line}" ]]; do
+if ${BATCH}; then
+    run_batched
+fi
+
+# Process each line in the file (batch mode has already processed it)
+${BATCH} || while IFS= read -r line || [[ -n "${line}" ]]; do
     # Skip empty lines and comments
     if [[ -z "${line}" || "${line}" =~ ^[[:space:]]*# ]]; then
         continue
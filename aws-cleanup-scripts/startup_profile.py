@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Profile
+
+Measures how long aws_resource_cleanup.py and delete_ecr_images.py take to
+start, checks the times against a budget, and prints an import-time
+profile (python -X importtime) of each module.
+
+Startup is timed with `--help`, which parses arguments and exits before any
+AWS call, so the result is the fixed cost paid by every invocation. No AWS
+access is needed.
+
+Usage:
+    python3 startup_profile.py
+    python3 startup_profile.py --budget-ms 150 --runs 20
+    python3 startup_profile.py --json results.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+CLIS = ('aws_resource_cleanup.py', 'delete_ecr_images.py')
+
+# Modules that must not be imported just to start the CLIs
+DEFERRED_MODULES = ('boto3', 'botocore.session', 'botocore.config')
+
+
+def time_command(args, runs):
+    """Median and max wall time in ms of running `python <args>` `runs` times"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=HERE,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 1), round(max(samples), 1)
+
+
+def import_profile(module):
+    """
+    Parse `python -X importtime -c "import <module>"` output
+
+    Returns:
+        List of (module name, self ms, cumulative ms), one per imported module
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                            cwd=HERE, capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile cleanup CLI startup time')
+    parser.add_argument('--budget-ms', type=float, default=150,
+                        help='Maximum median startup time per CLI (default: 150)')
+    parser.add_argument('--runs', type=int, default=10, help='Timed runs per command (default: 10)')
+    parser.add_argument('--top', type=int, default=10,
+                        help='Slowest imports to show per module (default: 10)')
+    parser.add_argument('--json', help='Write machine-readable results to this file')
+    args = parser.parse_args()
+
+    baseline, _ = time_command(['-c', 'pass'], args.runs)
+
+    results = []
+    for cli in CLIS:
+        median_ms, max_ms = time_command([cli, '--help'], args.runs)
+        module = cli[:-len('.py')]
+        profile = import_profile(module)
+        loaded = {name for name, _, _ in profile}
+        results.append({
+            'cli': cli,
+            'median_ms': median_ms,
+            'max_ms': max_ms,
+            'over_interpreter_ms': round(median_ms - baseline, 1),
+            'import_ms': round(profile[-1][2], 1) if profile else 0,
+            'deferred_modules_loaded': [name for name in DEFERRED_MODULES if name in loaded],
+            'slowest_imports': [
+                {'module': name, 'self_ms': round(self_ms, 1), 'cumulative_ms': round(cumulative_ms, 1)}
+                for name, self_ms, cumulative_ms in sorted(profile, key=lambda row: row[1], reverse=True)[:args.top]
+            ],
+            'within_budget': median_ms <= args.budget_ms,
+        })
+
+    print("=" * 80)
+    print(f"CLI STARTUP PROFILE (budget {args.budget_ms:.0f} ms, {args.runs} runs, "
+          f"bare interpreter {baseline} ms)")
+    print("=" * 80)
+    print(f"{'CLI':<26} {'Median ms':>10} {'Max ms':>8} {'Imports ms':>11} {'Budget':>8}")
+    print("-" * 80)
+    for result in results:
+        status = 'ok' if result['within_budget'] else 'OVER'
+        print(f"{result['cli']:<26} {result['median_ms']:>10} {result['max_ms']:>8} "
+              f"{result['import_ms']:>11} {status:>8}")
+
+    for result in results:
+        print(f"\nSlowest imports - {result['cli']} (self ms / cumulative ms):")
+        for row in result['slowest_imports']:
+            print(f"   {row['module']:<40} {row['self_ms']:>8} {row['cumulative_ms']:>10}")
+        if result['deferred_modules_loaded']:
+            print(f"   ⚠️  Loaded at startup: {', '.join(result['deferred_modules_loaded'])}")
+    print("=" * 80)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'budget_ms': args.budget_ms, 'baseline_ms': baseline, 'results': results}, f, indent=2)
+        print(f"✓ Results written to {args.json}")
+
+    failed = [r['cli'] for r in results if not r['within_budget'] or r['deferred_modules_loaded']]
+    if failed:
+        print(f"✗ Startup budget exceeded: {', '.join(failed)}")
+        sys.exit(1)
+    print("✓ All CLIs within startup budget")
+
+
+if __name__ == '__main__':
+    main()
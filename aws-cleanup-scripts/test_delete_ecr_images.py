@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Tests for --verify and manifest resolution in delete_ecr_images.py
+
+Runs against an in-memory ECR client, so no AWS access is needed:
+    python3 -m unittest test_delete_ecr_images.py
+"""
+
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+import delete_ecr_images
+
+
+INDEX_TYPE = "application/vnd.oci.image.index.v1+json"
+MANIFEST_TYPE = "application/vnd.oci.image.manifest.v1+json"
+ARN_PREFIX = "arn:aws:ecr:us-east-1:111122223333:repository/app"
+
+INDEX = "sha256:" + "a" * 64
+AMD64 = "sha256:" + "b" * 64
+ARM64 = "sha256:" + "c" * 64
+
+
+class FakePaginator:
+    def __init__(self, client):
+        self.client = client
+
+    def paginate(self, repositoryName):
+        yield {"imageDetails": [dict(image) for image in self.client.images.values()]}
+
+
+class FakeECR:
+    """Single-repository ECR client: DescribeImages and BatchGetImage only"""
+
+    def __init__(self, images, manifests):
+        self.images = images
+        self.manifests = manifests
+
+    def get_paginator(self, operation):
+        return FakePaginator(self)
+
+    def describe_images(self, repositoryName, imageIds):
+        digests = [image_id["imageDigest"] for image_id in imageIds]
+        if any(digest not in self.images for digest in digests):
+            raise ClientError({"Error": {"Code": "ImageNotFoundException", "Message": "missing"}}, "DescribeImages")
+        return {"imageDetails": [dict(self.images[digest]) for digest in digests]}
+
+    def batch_get_image(self, repositoryName, imageIds, acceptedMediaTypes):
+        return {
+            "images": [
+                {"imageId": {"imageDigest": image_id["imageDigest"]},
+                 "imageManifest": self.manifests[image_id["imageDigest"]]}
+                for image_id in imageIds
+            ],
+            "failures": []
+        }
+
+
+class FakeSession:
+    def __init__(self, client):
+        self.ecr = client
+
+    def client(self, service, region_name=None, config=None):
+        return self.ecr
+
+
+def multi_arch_repository(index_tags=("latest",), index_manifest=None):
+    """An image index with two untagged platform manifests"""
+    images = {
+        INDEX: {"imageDigest": INDEX, "imageTags": list(index_tags), "imageManifestMediaType": INDEX_TYPE},
+        AMD64: {"imageDigest": AMD64, "imageManifestMediaType": MANIFEST_TYPE},
+        ARM64: {"imageDigest": ARM64, "imageManifestMediaType": MANIFEST_TYPE},
+    }
+    if index_manifest is None:
+        index_manifest = json.dumps({"manifests": [{"digest": AMD64}, {"digest": ARM64}]})
+    return FakeSession(FakeECR(images, {INDEX: index_manifest}))
+
+
+def arn(digest):
+    return f"{ARN_PREFIX}/{digest}"
+
+
+class ResolveWithVerifyTest(unittest.TestCase):
+    def setUp(self):
+        delete_ecr_images._ecr_clients.clear()
+        logging.disable(logging.CRITICAL)
+        handle, self.output_file = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        os.remove(self.output_file)
+
+    def verify(self, session, arns, **kwargs):
+        dropped = delete_ecr_images.verify_targets(session, arns, self.output_file, workers=2, **kwargs)
+        with open(self.output_file) as f:
+            return dropped, f.read().split()
+
+    def test_children_of_a_dropped_tagged_index_are_not_written(self):
+        dropped, written = self.verify(multi_arch_repository(), [arn(INDEX)], resolve=True)
+        self.assertEqual(written, [])
+        self.assertEqual(dropped, 1)
+
+    def test_requested_children_of_a_dropped_index_are_blocked(self):
+        arns = [arn(INDEX), arn(AMD64), arn(ARM64)]
+        dropped, written = self.verify(multi_arch_repository(), arns, resolve=True)
+        self.assertEqual(written, [])
+        self.assertEqual(dropped, 3)
+
+    def test_kept_index_is_written_before_its_added_children(self):
+        dropped, written = self.verify(multi_arch_repository(), [arn(INDEX)], resolve=True, include_tagged=True)
+        self.assertEqual(written[0], arn(INDEX))
+        self.assertCountEqual(written[1:], [arn(AMD64), arn(ARM64)])
+        self.assertEqual(dropped, 0)
+
+    def test_untagged_index_is_expanded(self):
+        dropped, written = self.verify(multi_arch_repository(index_tags=()), [arn(INDEX)], resolve=True)
+        self.assertEqual(written[0], arn(INDEX))
+        self.assertCountEqual(written[1:], [arn(AMD64), arn(ARM64)])
+        self.assertEqual(dropped, 0)
+
+    def test_network_error_drops_only_the_failed_batch(self):
+        session = multi_arch_repository(index_tags=())
+        describe_images = session.ecr.describe_images
+
+        def flaky(repositoryName, imageIds):
+            if any(image_id["imageDigest"] == ARM64 for image_id in imageIds):
+                raise EndpointConnectionError(endpoint_url="https://api.ecr.us-east-1.amazonaws.com")
+            return describe_images(repositoryName, imageIds)
+
+        session.ecr.describe_images = flaky
+        self.addCleanup(setattr, delete_ecr_images, "VERIFY_BATCH_SIZE", delete_ecr_images.VERIFY_BATCH_SIZE)
+        delete_ecr_images.VERIFY_BATCH_SIZE = 1
+        dropped, written = self.verify(session, [arn(AMD64), arn(ARM64)])
+        self.assertEqual(written, [arn(AMD64)])
+        self.assertEqual(dropped, 1)
+
+
+class ResolveErrorsTest(unittest.TestCase):
+    def setUp(self):
+        delete_ecr_images._ecr_clients.clear()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_malformed_manifest_keeps_the_repository_targets(self):
+        session = multi_arch_repository(index_tags=(), index_manifest="{not json")
+        arns = [arn(INDEX), arn(AMD64)]
+        self.assertEqual(delete_ecr_images.resolve_manifests(session, arns, workers=2), arns)
+
+    def test_manifest_without_digests_keeps_the_repository_targets(self):
+        session = multi_arch_repository(index_tags=(), index_manifest=json.dumps({"manifests": [{}]}))
+        arns = [arn(INDEX)]
+        self.assertEqual(delete_ecr_images.resolve_manifests(session, arns, workers=2), arns)
+
+    def test_network_error_keeps_the_repository_targets(self):
+        session = multi_arch_repository(index_tags=())
+
+        def unreachable(operation):
+            raise EndpointConnectionError(endpoint_url="https://api.ecr.us-east-1.amazonaws.com")
+
+        session.ecr.get_paginator = unreachable
+        arns = [arn(INDEX)]
+        self.assertEqual(delete_ecr_images.resolve_manifests(session, arns, workers=2), arns)
+
+
+if __name__ == "__main__":
+    unittest.main()